@@ -23,13 +23,16 @@ This is a technical detail and should not affect the user experience.
 
 from __future__ import annotations
 
+import datetime as dt
 import itertools
+import json
+import logging
 import mimetypes
 from abc import ABC, abstractmethod
 from collections import deque
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Generic, TypeGuard, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TextIO, TypeGuard, overload
 
 import numpy as np
 from tabulate import tabulate
@@ -47,14 +50,17 @@ from ultimate_notion.obj_api import core as obj_core
 from ultimate_notion.obj_api import objects as objs
 from ultimate_notion.obj_api.core import is_unset
 from ultimate_notion.obj_api.enums import BGColor, CodeLang, Color
+from ultimate_notion.obj_api.iterator import PREFETCH_PAGES
+from ultimate_notion.response_cache import CHILDREN
 from ultimate_notion.rich_text import Text
 from ultimate_notion.user import User
-from ultimate_notion.utils import set_attr_none
+from ultimate_notion.utils import run_concurrently, set_attr_none
 
 if TYPE_CHECKING:
     from ultimate_notion.database import DataSource
     from ultimate_notion.page import Page
 
+_logger = logging.getLogger(__name__)
 
 MIN_COLS = 2
 """Minimum number of columns when creating a column block to structure a page."""
@@ -72,6 +78,13 @@ Source: https://developers.notion.com/reference/request-limits#limits-for-proper
 """
 MAX_NESTING_LEVEL = 2
 """The maximum nesting level of blocks in Notion for one append call."""
+MAX_REQUEST_SIZE = 500_000
+"""The maximum size in bytes of the payload of one API request.
+
+Source: https://developers.notion.com/reference/request-limits#size-limits
+"""
+_REQUEST_SIZE_RESERVE = 1_000
+"""Bytes reserved for the parts of an append request besides the blocks, e.g. the `position`"""
 
 # ToDo: Use new syntax when requires-python >= 3.12
 DO_co = TypeVar('DO_co', bound=obj_blocks.DataObject, default=obj_blocks.DataObject, covariant=True)
@@ -97,6 +110,13 @@ def wrap_icon(
             raise RuntimeError(msg)
 
 
+def _prefix_md_lines(md: str, prefix: str) -> str:
+    """Prefix every line of the Markdown, leaving no trailing whitespace on blank lines."""
+    if not prefix:
+        return md
+    return ''.join(prefix + line if line.strip() else prefix.rstrip() + line for line in md.splitlines(keepends=True))
+
+
 class DataObject(NotionEntity[DO_co], wraps=obj_blocks.DataObject):
     """The base type for all data-related types, i.e, pages, databases, data sources and blocks."""
 
@@ -126,8 +146,17 @@ class DataObject(NotionEntity[DO_co], wraps=obj_blocks.DataObject):
         """Return whether the object has children."""
         return self.obj_ref.has_children
 
+    def _invalidate_parent_response(self) -> None:
+        """Remove the children of the parent from the response cache, e.g. after this object was modified."""
+        parent_ref = self.obj_ref.parent
+        if (response_cache := get_active_session().response_cache) is not None and isinstance(
+            parent_ref, objs.BlockRef | objs.PageRef
+        ):
+            response_cache.delete(CHILDREN, objs.get_uuid(parent_ref))
+
     def _delete_me_from_parent(self) -> None:
         """Remove the block from the parent's children list."""
+        self._invalidate_parent_response()
         if isinstance(self.parent, ChildrenMixin) and self.parent._children is not None:
             for idx, child in enumerate(self.parent._children):
                 if child.id == self.id:
@@ -180,6 +209,55 @@ class ChildrenMixin(DataObject[DO_co], wraps=obj_blocks.DataObject):
         """Return whether the object has a `children` field."""
         return isinstance(self.obj_ref, obj_blocks.Block) and isinstance(self.obj_ref.value, obj_blocks.WithChildren)
 
+    def _content_version(self) -> dt.datetime | None:
+        """Return the `last_edited_time` of the page containing this object as version of its content.
+
+        The page is only looked up in the session cache and `None` is returned if it is unknown or if
+        the content might stem from another page as for synced blocks.
+        """
+        session = get_active_session()
+        obj: DataObject = self
+        while not is_page(obj):
+            if isinstance(obj, SyncedBlock) or not isinstance(
+                parent_ref := obj.obj_ref.parent, objs.BlockRef | objs.PageRef
+            ):
+                return None
+            parent = session.cache.get(objs.get_uuid(parent_ref))
+            if not isinstance(parent, DataObject):
+                return None
+            obj = parent
+        return None if is_unset(last_edited_time := obj.obj_ref.last_edited_time) else last_edited_time
+
+    def _retrieve_children_objs(self) -> list[obj_blocks.Block]:
+        """Retrieve the low-level child blocks, using the response cache of the session if configured."""
+        session = get_active_session()
+        response_cache = session.response_cache
+        version = None if response_cache is None else self._content_version()
+        if response_cache is None or version is None:
+            cached_data = None
+        else:
+            cached_data = response_cache.get(CHILDREN, self.id, version)
+        if cached_data is not None:
+            return [obj_blocks.Block.model_validate(block) for block in cached_data]
+
+        child_blocks_objs = list(
+            session.api.blocks.children.list(parent=objs.get_uuid(self.obj_ref), prefetch=PREFETCH_PAGES)
+        )
+        if response_cache is not None and version is not None:
+            data = [block.model_dump(mode='json', by_alias=True, exclude_unset=True) for block in child_blocks_objs]
+            response_cache.put(CHILDREN, self.id, version, data)
+        return child_blocks_objs
+
+    def _reset_children(self) -> None:
+        """Force a new retrieval of the children from Notion next time, e.g. after they were modified."""
+        self._children = None
+        self._invalidate_children_response()
+
+    def _invalidate_children_response(self) -> None:
+        """Remove the children from the response cache, e.g. after children were appended locally."""
+        if (response_cache := get_active_session().response_cache) is not None:
+            response_cache.delete(CHILDREN, self.id)
+
     def _gen_children_cache(self) -> list[Block | Page | DataSource]:
         """Generate the children cache."""
         if self.is_deleted:
@@ -187,7 +265,7 @@ class ChildrenMixin(DataObject[DO_co], wraps=obj_blocks.DataObject):
             raise RuntimeError(msg)
 
         session = get_active_session()
-        child_blocks_objs = list(session.api.blocks.children.list(parent=objs.get_uuid(self.obj_ref)))
+        child_blocks_objs = self._retrieve_children_objs()
         self.obj_ref.has_children = bool(child_blocks_objs)  # update the property manually to avoid API call
         if isinstance(self.obj_ref, obj_blocks.Block) and isinstance(self.obj_ref.value, obj_blocks.WithChildren):
             self.obj_ref.value.children = child_blocks_objs  # update the children attribute
@@ -215,6 +293,52 @@ class ChildrenMixin(DataObject[DO_co], wraps=obj_blocks.DataObject):
         # resolving it, so re-caching it as a `ChildDatabase` would collide -- leave it uncached.
         return [block if isinstance(block, ChildDatabase) else session._cache_add(block) for block in child_blocks]
 
+    def fetch_tree(self, *, max_depth: int | None = None, concurrency: int | None = None) -> Self:
+        """Retrieve the whole tree of blocks below this object breadth-first and cache it.
+
+        The children of all blocks on one level of the tree are retrieved concurrently, so that loading a deeply
+        nested page takes one round of requests per level instead of one request per block after another.
+        Blocks without children are not requested at all. Child pages and data sources are not descended into
+        as their content is not part of this object. Already retrieved children are kept.
+
+        Args:
+            max_depth: maximum number of levels to retrieve, e.g. `1` only retrieves the direct children,
+                `None` retrieves the whole tree
+            concurrency: maximum number of concurrent requests, defaults to the `concurrency` setting
+        """
+        session = get_active_session()
+        concurrency = session.concurrency if concurrency is None else concurrency
+        level: list[ChildrenMixin[Any]] = [self]
+        depth = 0
+        while level and (max_depth is None or depth < max_depth):
+            pending = [obj for obj in level if obj.in_notion and obj._children is None]
+            for obj in pending:
+                if isinstance(obj, ParentBlock) and not obj.has_children:
+                    obj._children = []
+            pending = [obj for obj in pending if obj._children is None]
+            for obj, children in zip(
+                pending,
+                run_concurrently(lambda obj: obj._gen_children_cache(), pending, concurrency=concurrency),
+                strict=True,
+            ):
+                obj._children = children
+            level = [child for obj in level for child in obj.children if isinstance(child, ParentBlock)]
+            depth += 1
+        return self
+
+    def _write_nested_markdown(self, file: TextIO, *, prefix: str = '') -> None:
+        """Write the Markdown of all children including their nested children to a file-like object.
+
+        Every line of nested children is prefixed with the `_md_nested_prefix` of their parent blocks.
+        """
+        for idx, child in enumerate(self.children):
+            if idx > 0:
+                file.write(prefix.rstrip() + '\n')
+            if isinstance(child, ParentBlock):
+                child._write_markdown(file, prefix=prefix)
+            else:
+                file.write(_prefix_md_lines(child._to_markdown(), prefix))
+
     @property
     def children(self) -> tuple[Block | Page | DataSource, ...]:
         """Return the children of this block, which are blocks but might also be pages and data sources."""
@@ -233,7 +357,14 @@ class ChildrenMixin(DataObject[DO_co], wraps=obj_blocks.DataObject):
         """Return all contained blocks within this block (excluding child pages and data sources)"""
         return tuple(block for block in self.children if not is_page(block) and not is_ds(block))
 
-    def append(self, blocks: Block | Sequence[Block], *, after: Block | None = None, sync: bool | None = None) -> Self:
+    def append(
+        self,
+        blocks: Block | Sequence[Block],
+        *,
+        after: Block | None = None,
+        sync: bool | None = None,
+        concurrency: int = 1,
+    ) -> Self:
         """Append a block or a sequence of blocks to the content of this block.
 
         If *this* block is already in Notion, the blocks are appended directly to Notion, otherwise
@@ -247,6 +378,8 @@ class ChildrenMixin(DataObject[DO_co], wraps=obj_blocks.DataObject):
             sync: Whether to sync the changes with Notion directly or in one batch call later.
                   If `sync = None` (default), the blocks are appended directly if this block is already in Notion,
                   otherwise they are prepared to be appended in one batch call, later.
+            concurrency: maximum number of concurrent requests appending independent nested blocks, e.g. the
+                  children of different toggles. By default, all requests are sent one after another.
         """
         blocks = [blocks] if isinstance(blocks, Block) else blocks
 
@@ -291,7 +424,7 @@ class ChildrenMixin(DataObject[DO_co], wraps=obj_blocks.DataObject):
             self._children.extend(blocks)
         else:  # self.in_notion and sync is not False
             blocks_iter = _chunk_blocks_for_api(parent_obj, blocks)
-            _append_block_chunks(blocks_iter, after=after)
+            _append_block_chunks(blocks_iter, after=after, concurrency=concurrency)
 
         return self
 
@@ -374,6 +507,7 @@ class Block(CommentMixin[B_co], ABC, wraps=obj_blocks.Block):
             # missing_ok=True below to cover `Heading` which behave like `TextBlock` but have no `children` attribute
             set_attr_none(self.obj_ref, exclude_attrs, inplace=True, missing_ok=True)
             session.api.blocks.update(self.obj_ref)
+            self._invalidate_parent_response()
 
     def replace(self, blocks: Block | Sequence[Block]) -> None:
         """Replace this block with another block or blocks."""
@@ -433,6 +567,24 @@ class ParentBlock(Block[B_co], ChildrenMixin[B_co], wraps=obj_blocks.Block):
     for `isinstance(i, ChildrenMixin)` as Page inherits from ChildrenMixin and Block not. This is not what we want.
     """
 
+    _md_nested_prefix: ClassVar[str | None] = ''
+    """Line prefix of nested children in a full Markdown export, `None` if `to_markdown` already renders them.
+
+    Container blocks like `Columns` don't use a prefix but override `_write_markdown` to export their children.
+    """
+
+    def _write_markdown(self, file: TextIO, *, prefix: str = '') -> None:
+        """Write the Markdown of this block including all its nested children to a file-like object.
+
+        Container blocks, which render their children themselves in `to_markdown`, override this method
+        to descend into their children instead, so that no nested block is lost.
+        """
+        file.write(_prefix_md_lines(self._to_markdown(), prefix))
+        if self._md_nested_prefix is not None and self.children:
+            nested_prefix = prefix + self._md_nested_prefix
+            file.write(nested_prefix.rstrip() + '\n')
+            self._write_nested_markdown(file, prefix=nested_prefix)
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, ParentBlock):
             if isinstance(other, Block):
@@ -653,11 +805,18 @@ class Heading(ColoredTextBlock[HT], ParentBlock[HT], wraps=obj_blocks.Heading):
         self.obj_ref.value.is_toggleable = toggleable
         self._update_in_notion()
 
-    def append(self, blocks: Block | Sequence[Block], *, after: Block | None = None, sync: bool | None = None) -> Self:
+    def append(
+        self,
+        blocks: Block | Sequence[Block],
+        *,
+        after: Block | None = None,
+        sync: bool | None = None,
+        concurrency: int = 1,
+    ) -> Self:
         if not self.toggleable:
             msg = 'Cannot append blocks to a non-toggleable heading.'
             raise InvalidAPIUsageError(msg)
-        return super().append(blocks, after=after, sync=sync)
+        return super().append(blocks, after=after, sync=sync, concurrency=concurrency)
 
 
 class Heading1(Heading[obj_blocks.Heading1], wraps=obj_blocks.Heading1):
@@ -691,6 +850,8 @@ class Heading4(Heading[obj_blocks.Heading4], wraps=obj_blocks.Heading4):
 class Quote(ColoredTextBlock[obj_blocks.Quote], ParentBlock[obj_blocks.Quote], wraps=obj_blocks.Quote):
     """Quote block."""
 
+    _md_nested_prefix = '> '
+
     def to_markdown(self) -> str:
         return f'> {super().to_markdown()}\n'
 
@@ -704,6 +865,8 @@ class Callout(ColoredTextBlock[obj_blocks.Callout], ParentBlock[obj_blocks.Callo
         to have a callout block without an icon.
     """
 
+    _md_nested_prefix = '> '
+
     def __init__(
         self,
         text: str,
@@ -759,6 +922,8 @@ class BulletedItem(
 ):
     """Bulleted list item."""
 
+    _md_nested_prefix = '    '
+
     def to_markdown(self) -> str:
         return f'- {super().to_markdown()}\n'
 
@@ -770,6 +935,8 @@ class NumberedItem(
 ):
     """Numbered list item."""
 
+    _md_nested_prefix = '    '
+
     def to_markdown(self) -> str:
         return f'1. {super().to_markdown()}\n'
 
@@ -777,6 +944,8 @@ class NumberedItem(
 class ToDoItem(ColoredTextBlock[obj_blocks.ToDo], ParentBlock[obj_blocks.ToDo], wraps=obj_blocks.ToDo):
     """ToDo list item."""
 
+    _md_nested_prefix = '    '
+
     def __init__(
         self,
         text: str,
@@ -804,6 +973,8 @@ class ToDoItem(ColoredTextBlock[obj_blocks.ToDo], ParentBlock[obj_blocks.ToDo],
 class ToggleItem(ColoredTextBlock[obj_blocks.Toggle], ParentBlock[obj_blocks.Toggle], wraps=obj_blocks.Toggle):
     """Toggle list item."""
 
+    _md_nested_prefix = '    '
+
     def to_markdown(self) -> str:
         return f'- {super().to_markdown()}\n'
 
@@ -1199,6 +1370,9 @@ class Column(ParentBlock[obj_blocks.Column], wraps=obj_blocks.Column):
             mds.append(block.to_markdown())
         return '\n'.join(mds)
 
+    def _write_markdown(self, file: TextIO, *, prefix: str = '') -> None:
+        self._write_nested_markdown(file, prefix=prefix)
+
     @property
     def width_ratio(self) -> float | None:
         """Return the width ratio of this column."""
@@ -1277,7 +1451,14 @@ class Columns(ParentBlock[obj_blocks.ColumnList], wraps=obj_blocks.ColumnList):
             msg = f'Column index must be between 0 and {len(self.blocks)} (inclusive).'
             raise IndexError(msg)
 
-    def append(self, blocks: Block | Sequence[Block], *, after: Block | None = None, sync: bool | None = None) -> Self:  # noqa: PLR6301
+    def append(  # noqa: PLR6301
+        self,
+        blocks: Block | Sequence[Block],
+        *,
+        after: Block | None = None,
+        sync: bool | None = None,
+        concurrency: int = 1,
+    ) -> Self:
         """Append a block or a sequence of blocks to the content of this block."""
         msg = 'Use `add_column` to append a new column.'
         raise InvalidAPIUsageError(msg)
@@ -1290,6 +1471,13 @@ class Columns(ParentBlock[obj_blocks.ColumnList], wraps=obj_blocks.ColumnList):
             cols.append(md + block.to_markdown())
         return '\n'.join(cols)
 
+    def _write_markdown(self, file: TextIO, *, prefix: str = '') -> None:
+        for i, block in enumerate(self.columns):
+            if i > 0:
+                file.write(prefix.rstrip() + '\n')
+            file.write(_prefix_md_lines(md_comment(f'column {i + 1}'), prefix))
+            block._write_markdown(file, prefix=prefix)
+
     @property
     def width_ratios(self) -> tuple[float | None, ...]:
         """Return the width ratios of the columns."""
@@ -1397,7 +1585,14 @@ class Tabs(ParentBlock[obj_blocks.Tab], wraps=obj_blocks.Tab):
             msg = f'Tab index must be between 0 and {len(self.tabs)} (inclusive).'
             raise IndexError(msg)
 
-    def append(self, blocks: Block | Sequence[Block], *, after: Block | None = None, sync: bool | None = None) -> Self:  # noqa: PLR6301
+    def append(  # noqa: PLR6301
+        self,
+        blocks: Block | Sequence[Block],
+        *,
+        after: Block | None = None,
+        sync: bool | None = None,
+        concurrency: int = 1,
+    ) -> Self:
         """Append a block or a sequence of blocks to the content of this block."""
         msg = 'Use `add_tab` to append a new tab.'
         raise InvalidAPIUsageError(msg)
@@ -1406,20 +1601,32 @@ class Tabs(ParentBlock[obj_blocks.Tab], wraps=obj_blocks.Tab):
         """Return the content of all tabs as Markdown."""
         tabs_md = []
         for tab in self.tabs:
-            label = str(tab)
-            match tab.icon:
-                case Emoji():
-                    label = f'{tab.icon} {label}'.strip()
-                case CustomEmoji() | BuiltInIcon():
-                    label = f':{tab.icon.name}: {label}'.strip()
-                case AnyFile():
-                    label = f'![icon]({tab.icon.url}) {label}'.strip()
-                case None:
-                    pass
             content = '\n'.join(child.to_markdown() for child in tab.children)
-            tabs_md.append(md_comment(f'tab: {label}' if label else 'tab') + content)
+            tabs_md.append(self._tab_md_comment(tab) + content)
         return '\n'.join(tabs_md)
 
+    def _write_markdown(self, file: TextIO, *, prefix: str = '') -> None:
+        for i, tab in enumerate(self.tabs):
+            if i > 0:
+                file.write(prefix.rstrip() + '\n')
+            file.write(_prefix_md_lines(self._tab_md_comment(tab), prefix))
+            tab._write_nested_markdown(file, prefix=prefix)
+
+    @staticmethod
+    def _tab_md_comment(tab: Paragraph) -> str:
+        """Return the Markdown comment introducing a tab with its label and icon."""
+        label = str(tab)
+        match tab.icon:
+            case Emoji():
+                label = f'{tab.icon} {label}'.strip()
+            case CustomEmoji() | BuiltInIcon():
+                label = f':{tab.icon.name}: {label}'.strip()
+            case AnyFile():
+                label = f'![icon]({tab.icon.url}) {label}'.strip()
+            case None:
+                pass
+        return md_comment(f'tab: {label}' if label else 'tab')
+
 
 class TableRow(tuple[Text | None, ...], Block[obj_blocks.TableRow], wraps=obj_blocks.TableRow):
     """Table row block behaving like a tuple."""
@@ -1453,6 +1660,8 @@ class TableRow(tuple[Text | None, ...], Block[obj_blocks.TableRow], wraps=obj_bl
 class Table(ParentBlock[obj_blocks.Table], wraps=obj_blocks.Table):
     """Table block."""
 
+    _md_nested_prefix = None
+
     def __init__(self, n_rows: int, n_cols: int, *, header_col: bool = False, header_row: bool = False) -> None:
         if n_rows < 1:
             msg = 'Table must have at least one row.'
@@ -1685,6 +1894,10 @@ class SyncedBlock(ParentBlock[obj_blocks.SyncedBlock], wraps=obj_blocks.SyncedBl
             md += self.get_original().to_markdown(with_comment=False)
         return md
 
+    def _write_markdown(self, file: TextIO, *, prefix: str = '') -> None:
+        file.write(_prefix_md_lines(md_comment('original block' if self.is_original else 'synced block'), prefix))
+        self.get_original()._write_nested_markdown(file, prefix=prefix)
+
 
 class Template(TextBlock[obj_blocks.Template], ParentBlock[obj_blocks.Template], wraps=obj_blocks.Template):
     """Template block.
@@ -1734,6 +1947,60 @@ class _Node(Generic[NB_co]):
     children: list[_Node[Block]] = field(default_factory=list)
 
 
+def _expand_node(node: _Node[Block]) -> list[tuple[_Node[Block], list[_Node[Block]]]]:
+    """Add the children that need to be sent together with the block of the node, e.g. the rows of a table.
+
+    Returned are the deeper children that need to be appended later to the respective blocks. They are
+    collected in separate nodes of those blocks, as the nodes of this batch must not change after it is
+    yielded, e.g. when all batches are created before the first one is sent.
+    Tables with more than `MAX_BLOCK_CHILDREN` rows are sent with the first rows and the remaining
+    rows are appended to the table later.
+    """
+    deferred: list[tuple[_Node[Block], list[_Node[Block]]]] = []
+    match node.block:
+        case Columns() as cols:
+            node.children.extend(_Node(block=col) for col in cols.columns)
+            deferred.extend((_Node(block=col), [_Node(block=child) for child in col.blocks]) for col in cols.columns)
+        case Tabs() as tabs:
+            node.children.extend(_Node(block=tab) for tab in tabs.tabs)
+            deferred.extend((_Node(block=tab), [_Node(block=child) for child in tab.blocks]) for tab in tabs.tabs)
+        case Table() as table:
+            row_nodes: list[_Node[Block]] = [_Node(block=row) for row in table.rows]
+            node.children.extend(row_nodes[:MAX_BLOCK_CHILDREN])
+            if len(row_nodes) > MAX_BLOCK_CHILDREN:
+                deferred.append((_Node(block=node.block), row_nodes[MAX_BLOCK_CHILDREN:]))
+        case ParentBlock() as parent_block if parent_block.has_children:
+            deferred.append((_Node(block=node.block), [_Node(block=child) for child in parent_block.blocks]))
+    return deferred
+
+
+def _node_size(node: _Node[Block]) -> int:
+    """Return the size in bytes of the serialized block of the node including the children sent with it."""
+    # ASCII-only JSON with the default separators is an upper bound of the size of the encoded request
+    return len(json.dumps(_build_obj_ref(node).obj_ref.serialize_for_api()))
+
+
+def _shrink_table_node(
+    node: _Node[Block], deferred: list[tuple[_Node[Block], list[_Node[Block]]]], max_size: int
+) -> int:
+    """Defer rows of a table node until it fits into `max_size` and return its size.
+
+    The deferred rows are appended to the table in later requests, which keeps their order. They are
+    collected in a separate node of the table, as the node itself is sent with the current batch.
+    """
+    node_size = _node_size(node)
+    while node_size > max_size and len(node.children) > 1:
+        n_keep = len(node.children) // 2
+        moved_rows = node.children[n_keep:]
+        del node.children[n_keep:]
+        if deferred and deferred[0][0].block is node.block:
+            deferred[0][1][:0] = moved_rows
+        else:
+            deferred.insert(0, (_Node(block=node.block), moved_rows))
+        node_size = _node_size(node)
+    return node_size
+
+
 def _chunk_blocks_for_api(parent: Block | Page, blocks: Sequence[Block]) -> Iterator[_Node]:
     """Yield batches of blocks with a parent so that each batch fulfills the Notion API requirements.
 
@@ -1741,17 +2008,17 @@ def _chunk_blocks_for_api(parent: Block | Page, blocks: Sequence[Block]) -> Iter
     - Maximum of 1000 blocks per request
     - Maximum of 100 blocks in an array, also when appending children of a block
     - Maximum nesting level of 2, i.e. great grandchildren are not allowed
+    - Maximum of 500KB payload per request
 
-    We won't adhere to the 500KB limit per request here, as this is hard to check without
-    knowing the exact size of the serialized request. If you hit this limit, reduce the number
-    of blocks you append at once. This is quite unlikely to happen in practice as the current implementation
-    appends only single-level blocks at a time adhering to the 100 blocks per array limit.
+    Each batch is packed with as many consecutive blocks of the same parent as possible. For this, the size
+    of the serialized blocks is measured one by one while filling the batch. Tables exceeding the limits
+    are sent with only part of their rows and the remaining rows are appended to the table afterwards.
+    A single block exceeding the size limit on its own is still sent alone in a batch.
 
-    Source: https://developers.notion.com/reference/request-limits#limits-for-property-values
+    Source: https://developers.notion.com/reference/request-limits
     """
     # Breadth-first traversal to create batches of blocks which handles special blocks like columns and tables correctly
-    # Note that there are a few edge cases where this can still fail, e.g. a table with >100 rows or many tables with
-    # a total of more than 1000 rows/blocks. These cases are quite unlikely in practice.
+    max_size = MAX_REQUEST_SIZE - _REQUEST_SIZE_RESERVE
     batch = _Node(block=parent, is_root=True)
     batch_blocks = [_Node(block=block) for block in blocks]
     queue = deque([(batch, batch_blocks)])
@@ -1760,26 +2027,32 @@ def _chunk_blocks_for_api(parent: Block | Page, blocks: Sequence[Block]) -> Iter
         if not batch_blocks:
             continue
 
-        curr_nodes, next_nodes = batch_blocks[:MAX_BLOCK_CHILDREN], batch_blocks[MAX_BLOCK_CHILDREN:]
-        batch.children.extend(curr_nodes)
-
-        for node in curr_nodes:
-            match node.block:
-                case Columns() as cols:
-                    col_nodes = [_Node(block=col) for col in cols.columns]
-                    node.children.extend(col_nodes)
-                    for col_node, col in zip(col_nodes, cols.columns, strict=True):
-                        queue.append((col_node, [_Node(block=child) for child in col.blocks]))
-                case Tabs() as tabs:
-                    tab_nodes = [_Node(block=tab) for tab in tabs.tabs]
-                    node.children.extend(tab_nodes)
-                    for tab_node, tab in zip(tab_nodes, tabs.tabs, strict=True):
-                        queue.append((tab_node, [_Node(block=child) for child in tab.blocks]))
-                case Table() as table:
-                    node.children.extend([_Node(block=row) for row in table.rows])
-                case ParentBlock() as parent_block if parent_block.has_children:
-                    queue.append((node, [_Node(block=child) for child in parent_block.blocks]))
-        if next_nodes:
+        n_added = n_blocks = batch_size = 0
+        deferred: list[tuple[_Node[Block], list[_Node[Block]]]] = []
+        for node in batch_blocks:
+            if n_added == MAX_BLOCK_CHILDREN:
+                break
+            node_deferred = _expand_node(node)
+            if isinstance(node.block, Table):
+                node_size = _shrink_table_node(node, node_deferred, max_size)
+            else:
+                node_size = _node_size(node)
+            node_blocks = 1 + len(node.children)
+            # separate the blocks within the array of children by `, `
+            exceeds_limits = batch_size + node_size + 2 > max_size or n_blocks + node_blocks > MAX_BLOCKS_PER_REQUEST
+            if n_added and exceeds_limits:
+                node.children.clear()  # expanded again when the node is sent in the next batch
+                break
+            if node_size > max_size:
+                _logger.warning(f'Block {node.block} exceeds the maximum request size of {MAX_REQUEST_SIZE} bytes.')
+            batch.children.append(node)
+            deferred.extend(node_deferred)
+            n_added += 1
+            n_blocks += node_blocks
+            batch_size += node_size + 2
+
+        queue.extend(deferred)
+        if next_nodes := batch_blocks[n_added:]:
             queue.append((_Node(block=batch.block, is_root=batch.is_root), next_nodes))
         yield batch
 
@@ -1796,12 +2069,46 @@ def _build_obj_ref(node: _Node[Block]) -> Block:
     return block
 
 
-def _append_block_chunks(batch_trees: Iterator[_Node], *, after: Block | None = None) -> None:
-    """Append chunks of blocks to a parent block, respecting API limits."""
+def _schedule_batches(batches: Sequence[_Node]) -> list[list[_Node]]:
+    """Group batches into waves of independent batches that can be appended at the same time.
+
+    A batch depends on the batch sending its parent block, as the parent needs to exist in Notion first,
+    and on the previous batch with the same parent to keep the order of the appended children.
+    The order of the batches is kept within each wave.
+    """
+    sent_in_wave: dict[int, int] = {}  # maps the id of a block object to the wave of the batch sending it
+    last_wave: dict[int, int] = {}  # maps the id of a parent block object to the wave of its last batch
+    waves: list[list[_Node]] = []
+    for batch in batches:
+        parent_key = id(batch.block)
+        wave = 1 + max(sent_in_wave.get(parent_key, -1), last_wave.get(parent_key, -1))
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(batch)
+        last_wave[parent_key] = wave
+        for node in batch.children:
+            sent_in_wave[id(node.block)] = wave
+            for child_node in node.children:  # e.g. columns or table rows, whose ids are known after the batch
+                sent_in_wave[id(child_node.block)] = wave
+    return waves
+
+
+def _append_block_chunks(batch_trees: Iterator[_Node], *, after: Block | None = None, concurrency: int = 1) -> None:
+    """Append chunks of blocks to a parent block, respecting API limits.
+
+    The batches are scheduled in waves by `_schedule_batches`. With `concurrency > 1`, all batches of a wave,
+    e.g. the children of different toggles or columns, are appended concurrently. Thus the number of sequential
+    requests is close to the depth of the block tree instead of the number of batches. Batches of the same parent,
+    like the root-level batches continuing after `after`, are always appended one after another.
+    """
     session = get_active_session()
     curr_after = after
 
-    for parent_node in batch_trees:
+    def list_child_objs(node: _Node[Block]) -> list[obj_blocks.Block]:
+        return list(session.api.blocks.children.list(node.block.obj_ref))
+
+    def append_batch(parent_node: _Node) -> None:
+        nonlocal curr_after
         parent = parent_node.block
         blocks = [_build_obj_ref(child) for child in parent_node.children]
 
@@ -1811,6 +2118,8 @@ def _append_block_chunks(batch_trees: Iterator[_Node], *, after: Block | None =
         after_obj = None if after is None else after.obj_ref
         block_objs, after_block_objs = session.api.blocks.children.append(parent.obj_ref, block_objs, after=after_obj)
         parent.obj_ref.has_children = True
+        if isinstance(parent, ChildrenMixin):
+            parent._invalidate_children_response()
 
         if parent_node.is_root and isinstance(parent, ChildrenMixin):
             parent._children = [] if parent._children is None else parent._children
@@ -1829,8 +2138,15 @@ def _append_block_chunks(batch_trees: Iterator[_Node], *, after: Block | None =
             # update the appended blocks with the returned objects from the API. This only works at the top level.
             block_node.block.obj_ref.update(**block_obj.model_dump())
             session.cache[block_node.block.id] = block_node.block
-            if block_node.children:  # we need to update explicitly the first level for Table, Columns, etc.
-                child_objs = session.api.blocks.children.list(block_node.block.obj_ref)
-                for child_node, child_obj in zip(block_node.children, child_objs, strict=True):
-                    child_node.block.obj_ref.update(**child_obj.model_dump())
-                    session.cache[child_node.block.id] = child_node.block
+
+        # we need to update explicitly the first level for Table, Columns, etc., which is retrieved for all of them,
+        # concurrently if requested, at the end of the batch before their children are appended in the next batches.
+        nested_nodes = [block_node for block_node in parent_node.children if block_node.children]
+        nested_child_objs = run_concurrently(list_child_objs, nested_nodes, concurrency=concurrency)
+        for block_node, child_objs in zip(nested_nodes, nested_child_objs, strict=True):
+            for child_node, child_obj in zip(block_node.children, child_objs, strict=True):
+                child_node.block.obj_ref.update(**child_obj.model_dump())
+                session.cache[child_node.block.id] = child_node.block
+
+    for wave in _schedule_batches(list(batch_trees)):
+        run_concurrently(append_batch, wave, concurrency=concurrency)
@@ -0,0 +1,165 @@
+"""Object cache of a session to avoid unnecessary calls to the Notion API.
+
+The cache keeps the most recently used objects with strong references up to a maximum size and
+for a maximum idle time. Objects that were evicted but are still referenced elsewhere, e.g. a page
+that is still used by the application, are tracked with weak references. Looking them up again
+returns the very same object, so the identity of live objects is preserved while objects that
+are no longer used can be garbage collected.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from contextlib import suppress
+from dataclasses import dataclass
+from threading import RLock
+from typing import Generic, TypeVar
+from uuid import UUID
+
+# ToDo: Use new syntax when requires-python >= 3.12
+V = TypeVar('V')
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Statistics of an `ObjectCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+
+class ObjectCache(MutableMapping[UUID, V], Generic[V]):
+    """Cache mapping object ids to objects with an LRU size bound and an idle-time based expiry.
+
+    Args:
+        maxsize: maximum number of objects kept with strong references, `None` for no limit
+        ttl: seconds after which an object that was not accessed expires, `None` for no expiry
+        clock: function returning the current time in seconds to determine the idle time of objects
+    """
+
+    def __init__(
+        self, *, maxsize: int | None = None, ttl: float | None = None, clock: Callable[[], float] = time.monotonic
+    ):
+        if maxsize is not None and maxsize < 0:
+            msg = f'Maximum size must not be negative, got {maxsize}.'
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = f'TTL must be positive, got {ttl}.'
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[V, float]] = OrderedDict()  # value and time of last access
+        self._evicted: weakref.WeakValueDictionary[UUID, V] = weakref.WeakValueDictionary()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the statistics of this cache."""
+        return CacheStats(
+            hits=self.hits, misses=self.misses, evictions=self.evictions, size=len(self._entries), maxsize=self.maxsize
+        )
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        return self.ttl is not None and now - last_access > self.ttl
+
+    def _evict(self, key: UUID) -> None:
+        value, _ = self._entries.pop(key)
+        with suppress(TypeError):  # object does not support weak references
+            self._evicted[key] = value
+        self.evictions += 1
+
+    def _enforce_limits(self) -> None:
+        """Evict expired and least recently used objects, which are at the front of the LRU order."""
+        now = self._clock()
+        while self._entries:
+            key, (_, last_access) = next(iter(self._entries.items()))
+            if self._is_expired(last_access, now) or (self.maxsize is not None and len(self._entries) > self.maxsize):
+                self._evict(key)
+            else:
+                break
+
+    def _lookup(self, key: UUID) -> V:
+        """Return the object and mark it as recently used without counting a hit or miss."""
+        now = self._clock()
+        if (entry := self._entries.get(key)) is not None:
+            if not self._is_expired(entry[1], now):
+                self._entries[key] = (entry[0], now)
+                self._entries.move_to_end(key)
+                return entry[0]
+            self._evict(key)
+        # an evicted object that is still alive is promoted again to keep its identity
+        value = self._evicted.pop(key)
+        self._entries[key] = (value, now)
+        self._enforce_limits()
+        return value
+
+    def __getitem__(self, key: UUID) -> V:
+        with self._lock:
+            try:
+                value = self._lookup(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            self.hits += 1
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        """Check if an object is cached without marking it as recently used or counting a hit or miss."""
+        with self._lock:
+            if not isinstance(key, UUID):
+                return False
+            if (entry := self._entries.get(key)) is not None:
+                return not self._is_expired(entry[1], self._clock())
+            return key in self._evicted
+
+    def __setitem__(self, key: UUID, value: V) -> None:
+        with self._lock:
+            self._evicted.pop(key, None)
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            self._enforce_limits()
+
+    def __delitem__(self, key: UUID) -> None:
+        with self._lock:
+            found = self._entries.pop(key, None) is not None
+            found |= self._evicted.pop(key, None) is not None
+            if not found:
+                raise KeyError(key)
+
+    def __iter__(self) -> Iterator[UUID]:
+        with self._lock:
+            self._enforce_limits()
+            keys = [*self._entries, *self._evicted]  # both are disjoint
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._enforce_limits()
+            return len(self._entries) + len(self._evicted)
+
+    def setdefault(self, key: UUID, default: V) -> V:
+        with self._lock:
+            try:
+                return self[key]
+            except KeyError:
+                self[key] = default
+                return default
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._evicted.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__}: {self.stats}>'
@@ -44,6 +44,13 @@ class UNOCfg(BaseModel):
     token: str | None = None
     debug: bool = False
     sync_state_dir: Path = Path('sync_states')
+    requests_per_second: float = 3.0  # average request rate of a session, 0 disables rate limiting
+    request_burst: int = 10  # number of requests that can be sent at once before rate limiting starts
+    max_retries: int = 5  # retries of rate-limited requests and idempotent requests failing with server errors
+    cache_maxsize: int | None = None  # maximum number of objects kept in the session cache, no limit by default
+    cache_ttl: float | None = None  # seconds after which unused objects expire from the session cache
+    concurrency: int = 4  # number of concurrent requests of batch operations like resolving page references
+    response_cache: Path | None = None  # SQLite file persisting retrieved page content, disabled by default
     cfg_path: FilePath  # will be set automatically
 
 
@@ -67,6 +74,8 @@ class Config(BaseModel):
             value.sync_state_dir = value.cfg_path.parent / value.sync_state_dir
             if not value.sync_state_dir.exists():
                 value.sync_state_dir.mkdir(parents=True)
+        if value.response_cache is not None and not value.response_cache.is_absolute():
+            value.response_cache = value.cfg_path.parent / value.response_cache
         return value
 
     @field_validator('google')
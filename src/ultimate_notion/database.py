@@ -7,7 +7,10 @@ In API version 2025-09-03+:
 
 from __future__ import annotations
 
-from typing import Any
+import datetime as dt
+import logging
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import Any, cast
 from uuid import UUID
 
 from pydantic import ValidationError
@@ -16,18 +19,30 @@ from typing_extensions import Self, TypeVar
 from ultimate_notion.blocks import ChildrenMixin, DataObject, wrap_icon
 from ultimate_notion.core import NotionEntity, WorkspaceType, get_active_session, get_repr, resolve_ref
 from ultimate_notion.emoji import BuiltInIcon, CustomEmoji, Emoji
-from ultimate_notion.errors import InvalidAPIUsageError, ReadOnlyPropertyError, SchemaError, SListError, UnsetError
+from ultimate_notion.errors import (
+    BatchError,
+    InvalidAPIUsageError,
+    ReadOnlyPropertyError,
+    SchemaError,
+    SListError,
+    UnsetError,
+)
 from ultimate_notion.file import AnyFile
 from ultimate_notion.obj_api import blocks as obj_blocks
 from ultimate_notion.obj_api import objects as objs
+from ultimate_notion.obj_api import props as obj_props
+from ultimate_notion.obj_api import query as obj_query
 from ultimate_notion.obj_api.core import is_unset
 from ultimate_notion.page import Page
-from ultimate_notion.query import Query
+from ultimate_notion.props import PropertyValue
+from ultimate_notion.query import Condition, Query
 from ultimate_notion.rich_text import Text, camel_case
-from ultimate_notion.schema import Property, Schema
-from ultimate_notion.utils import SList
+from ultimate_notion.schema import Property, Schema, SchemaModel
+from ultimate_notion.utils import SList, run_concurrently
 from ultimate_notion.view import View
 
+_logger = logging.getLogger(__name__)
+
 # ToDo: Use new syntax when requires-python >= 3.12
 DC_co = TypeVar('DC_co', bound=obj_blocks.Database | obj_blocks.DataSource, covariant=True)
 
@@ -105,6 +120,7 @@ class DataSource(DataContainer[obj_blocks.DataSource], wraps=obj_blocks.DataSour
     """
 
     _schema: type[Schema] | None = None
+    _synced_view: View | None = None
 
     def __str__(self) -> str:
         if self.title:
@@ -223,7 +239,7 @@ class DataSource(DataContainer[obj_blocks.DataSource], wraps=obj_blocks.DataSour
         self.obj_ref = session.api.data_sources.retrieve(self.id)
         for parent in (old_parent, database.parent):
             if isinstance(parent, ChildrenMixin):
-                parent._children = None  # forces a new retrieval of children next time
+                parent._reset_children()
         return self
 
     def delete(self) -> Self:
@@ -240,7 +256,7 @@ class DataSource(DataContainer[obj_blocks.DataSource], wraps=obj_blocks.DataSour
             session = get_active_session()
             session.api.data_sources.restore(self.obj_ref)
             if isinstance(self.parent, ChildrenMixin):
-                self.parent._children = None  # this forces a new retrieval of children next time
+                self.parent._reset_children()
         return self
 
     def reload(self, *, rebind_schema: bool = True) -> Self:
@@ -267,14 +283,72 @@ class DataSource(DataContainer[obj_blocks.DataSource], wraps=obj_blocks.DataSour
         """Retrieve all pages and return a view."""
         return self.query.execute()
 
+    def changed_since(self, watermark: dt.datetime | None = None) -> tuple[View, dt.datetime | None]:
+        """Retrieve only the pages edited since `watermark` and merge them into the previously retrieved view.
+
+        Without a `watermark`, all pages are retrieved. With a `watermark`, only pages with a `last_edited_time`
+        on or after it are queried. Already known pages of the view retrieved by the previous call are updated
+        in place, keeping their identity, and new pages are appended to the view. If there is no previous view,
+        e.g. in a new session, the returned view holds only the changed pages.
+        Returned is the merged view and the watermark to pass to the next call,
+        which is `None` as long as the data source is empty.
+
+        !!! note
+            Notion reports the `last_edited_time` of pages with a precision of one minute. Pages edited within
+            the minute of the `watermark` are thus retrieved again. Pages that were deleted or moved to another
+            data source are not detected incrementally, so use
+            [get_all_pages][ultimate_notion.database.DataSource.get_all_pages] for a full synchronization.
+        """
+        if watermark is None:
+            view = self.get_all_pages()
+        else:
+            _logger.info(f'Querying pages of data source `{self}` edited since {watermark}.')
+            session = get_active_session()
+            edited_filter = obj_query.LastEditedTimeFilter(
+                last_edited_time=obj_query.DateCondition(on_or_after=watermark)
+            )
+            query_obj = session.api.data_sources.query(self.obj_ref).filter(edited_filter)
+            pages: dict[Any, Page] = {}
+            if self._synced_view is not None:
+                pages.update((page.id, page) for page in self._synced_view._pages)
+            for page_obj in query_obj.execute():
+                if (page := pages.get(page_obj.id)) is None:
+                    page = session._cache_add(Page.wrap_obj_ref(page_obj))
+                if page.obj_ref is not page_obj:  # update the known, outdated page in place
+                    page._refresh(page_obj)
+                pages[page.id] = page
+            view = View(ds=self, pages=list(pages.values()), query=self.query)
+
+        self._synced_view = view
+        edited_times = [page.last_edited_time for page in view.to_pages()]
+        if watermark is not None:
+            edited_times.append(watermark)
+        return view, max(edited_times, default=None)
+
+    def iter_pages(self, *, cache: bool = True, prefetch: int = 0) -> Iterator[Page]:
+        """Yield all pages as they are retrieved without collecting them in a view.
+
+        Use `cache=False` to not add the pages to the session cache, e.g. to process large data sources
+        in constant memory. See [Query.iter][ultimate_notion.query.Query.iter] for details.
+        """
+        return self.query.iter(cache=cache, prefetch=prefetch)
+
+    def count(self, condition: Condition | None = None) -> int:
+        """Return the number of pages in this data source, optionally only those matching `condition`.
+
+        The pages are counted by paging through the raw query results without retrieving them as pages.
+        """
+        query = self.query if condition is None else self.query.filter(condition)
+        return query.count()
+
     def __len__(self) -> int:
         """Return the number of pages in this data source."""
-        return len(self.get_all_pages())
+        return self.count()
 
     @property
     def is_empty(self) -> bool:
         """Return whether the data source is empty."""
-        return len(self) == 0
+        return not self.query.exists()
 
     @property
     def parent(self) -> NotionEntity | WorkspaceType | None:
@@ -312,31 +386,160 @@ class DataSource(DataContainer[obj_blocks.DataSource], wraps=obj_blocks.DataSour
         msg = 'Use .is_empty instead of bool(ds) to check if a data source is empty.'
         raise RuntimeError(msg)
 
-    def create_page(self, **kwargs: Any) -> Page:
-        """Create a page with properties according to the schema within the corresponding data source."""
+    def _validate_page_props(self, validator: type[SchemaModel], attrs: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate the property values given by attribute name and return them for the API."""
         attr_to_name = {prop.attr_name: prop.name for prop in self.schema.get_props()}
-        if not set(kwargs).issubset(set(attr_to_name)):
-            add_kwargs = set(kwargs) - set(attr_to_name)
+        if not set(attrs).issubset(set(attr_to_name)):
+            add_kwargs = set(attrs) - set(attr_to_name)
             msg = f'Attributes {", ".join(add_kwargs)} not defined for properties in schema {self.__class__.__name__}'
             raise SchemaError(msg)
-        if ro_props := set(kwargs) & {prop.attr_name for prop in self.schema.get_ro_props()}:
+        if ro_props := set(attrs) & {prop.attr_name for prop in self.schema.get_ro_props()}:
             msg = f'Read-only properties {", ".join(ro_props)} cannot be set'
             raise ReadOnlyPropertyError(msg)
 
-        schema_kwargs = {attr_to_name[attr]: value for attr, value in kwargs.items()}
-        validator = self.schema.to_pydantic_model(with_ro_props=False)
+        schema_kwargs = {attr_to_name[attr]: value for attr, value in attrs.items()}
         try:
             schema = validator(**schema_kwargs)
         except ValidationError as e:
             msg = f'Invalid keyword arguments or read-only properties are overwritten:\n{e}'
             raise SchemaError(msg) from e
+        return schema.to_dict()
+
+    def create_page(self, **kwargs: Any) -> Page:
+        """Create a page with properties according to the schema within the corresponding data source."""
+        validator = self.schema.to_pydantic_model(with_ro_props=False)
+        properties = self._validate_page_props(validator, kwargs)
 
         session = get_active_session()
-        page_obj = session.api.pages.create(parent=self.obj_ref, properties=schema.to_dict())
+        page_obj = session.api.pages.create(parent=self.obj_ref, properties=properties)
         page = Page.wrap_obj_ref(page_obj)
         session.cache[page.id] = page
         return page
 
+    def create_pages(self, rows: Iterable[Mapping[str, Any]], *, concurrency: int | None = None) -> list[Page]:
+        """Create a page for each row of property values by attribute name like in `create_page`.
+
+        All rows are validated against the schema upfront, then the pages are created with up to `concurrency`
+        concurrent requests, which defaults to the `concurrency` setting, and returned in the order of the rows.
+        If some rows are invalid or their pages cannot be created, all other pages are still created and
+        a [BatchError][ultimate_notion.errors.BatchError] is raised at the end, holding the created pages and
+        the errors by row index.
+        """
+        validator = self.schema.to_pydantic_model(with_ro_props=False)
+        rows = list(rows)
+        errors: dict[int, Exception] = {}
+        writes: list[tuple[int, Page | None, dict[str, Any]]] = []
+        for idx, row in enumerate(rows):
+            try:
+                writes.append((idx, None, self._validate_page_props(validator, row)))
+            except SchemaError as e:
+                errors[idx] = e
+
+        return self._write_pages([None] * len(rows), writes, errors, concurrency=concurrency)
+
+    def upsert(self, rows: Iterable[Mapping[str, Any]], *, key: str, concurrency: int | None = None) -> list[Page]:
+        """Update the pages matching the rows by the value of the `key` property or create them otherwise.
+
+        The rows hold property values by attribute name like in `create_page` and `key` is the name or attribute
+        name of a property with unique values, e.g. an SKU. All pages of the data source are queried once to find
+        the matching pages by their key. Only the properties that differ from the page are updated and rows
+        without any change cost no request at all. The writes are sent with up to `concurrency` concurrent
+        requests, which defaults to the `concurrency` setting. The pages are returned in the order of the rows.
+        Like in `create_pages`, failed rows are reported with a [BatchError][ultimate_notion.errors.BatchError]
+        after all other rows were written.
+        """
+        key_prop = next((prop for prop in self.schema.get_props() if key in {prop.name, prop.attr_name}), None)
+        if key_prop is None:
+            msg = f'Key `{key}` is not a property of data source `{self}`'
+            raise SchemaError(msg)
+
+        def key_value(prop_obj: obj_props.PropertyValue) -> Hashable:
+            value = PropertyValue.wrap_obj_ref(prop_obj).value
+            return str(value) if isinstance(value, str) else value
+
+        pages_by_key: dict[Hashable, Page] = {}
+        for page in self.get_all_pages():
+            if (prop_obj := page.obj_ref.properties.get(key_prop.name)) is not None:
+                pages_by_key.setdefault(key_value(prop_obj), page)
+
+        validator = self.schema.to_pydantic_model(with_ro_props=False)
+        rows = list(rows)
+        results: list[Page | None] = [None] * len(rows)
+        errors: dict[int, Exception] = {}
+        writes: list[tuple[int, Page | None, dict[str, Any]]] = []
+        row_keys: set[Hashable] = set()
+        for idx, row in enumerate(rows):
+            try:
+                props = self._validate_page_props(validator, row)
+                if key_prop.name not in props:
+                    msg = f'Row lacks a value for the key property `{key_prop.name}`'
+                    raise SchemaError(msg)
+                if (row_key := key_value(props[key_prop.name])) in row_keys:
+                    msg = f'Key `{row_key}` of property `{key_prop.name}` is not unique within the rows'
+                    raise SchemaError(msg)
+            except SchemaError as e:
+                errors[idx] = e
+                continue
+            row_keys.add(row_key)
+
+            if (key_page := pages_by_key.get(row_key)) is None:
+                writes.append((idx, None, props))
+                continue
+
+            page_props = key_page.obj_ref.properties
+            changed_props = {
+                name: prop_obj
+                for name, prop_obj in props.items()
+                if name not in page_props
+                or PropertyValue.wrap_obj_ref(prop_obj) != PropertyValue.wrap_obj_ref(page_props[name])
+            }
+            if changed_props:
+                writes.append((idx, key_page, changed_props))
+            else:
+                results[idx] = key_page
+
+        return self._write_pages(results, writes, errors, concurrency=concurrency)
+
+    def _write_pages(
+        self,
+        results: list[Page | None],
+        writes: list[tuple[int, Page | None, dict[str, Any]]],
+        errors: dict[int, Exception],
+        *,
+        concurrency: int | None,
+    ) -> list[Page]:
+        """Concurrently create or update pages with the given properties and collect them in `results`.
+
+        Each write consists of the index within `results`, the page to update or `None` to create a new one, and
+        the properties. Failed writes are added to `errors` and a `BatchError` is raised at the end if any.
+        """
+        session = get_active_session()
+        concurrency = session.concurrency if concurrency is None else concurrency
+        # the written pages resolve their parent from the cache instead of retrieving it in every thread
+        session._cache_add(self)
+
+        def write(item: tuple[int, Page | None, dict[str, Any]]) -> Page | None:
+            idx, page, properties = item
+            try:
+                if page is None:
+                    page = Page.wrap_obj_ref(session.api.pages.create(parent=self.obj_ref, properties=properties))
+                else:
+                    session.api.pages.update(page.obj_ref, properties=properties)
+            except Exception as e:  # reported after all rows are processed
+                _logger.warning(f'Failed to write page of row {idx} in data source `{self}`: {e}')
+                errors[idx] = e
+                return None
+            return page
+
+        for (idx, _, _), page in zip(writes, run_concurrently(write, writes, concurrency=concurrency), strict=True):
+            if page is not None:
+                session.cache[page.id] = page
+                results[idx] = page
+
+        if errors:
+            raise BatchError(results, dict(sorted(errors.items())))
+        return cast(list[Page], results)
+
     def to_markdown(self) -> str:
         """Return the reference to this data source as Markdown."""
         return self._to_markdown()
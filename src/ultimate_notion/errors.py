@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ultimate_notion.schema import SchemaType
@@ -43,6 +43,21 @@ class InvalidAPIUsageError(UltimateNotionError):
     """Raised when the API is used in an invalid way."""
 
 
+class BatchError(UltimateNotionError):
+    """Raised after a batch operation when some of the items failed while the others were processed.
+
+    `results` holds the results of all items in order, which is `None` for the failed ones,
+    and `errors` maps the index of each failed item to its exception.
+    """
+
+    def __init__(self, results: list[Any], errors: dict[int, Exception]):
+        self.results = results
+        self.errors = errors
+        idx, error = next(iter(errors.items()))
+        msg = f'{len(errors)} of {len(results)} items failed, first item {idx} with: {error}'
+        super().__init__(msg)
+
+
 class EmptyDataSourceError(UltimateNotionError):
     """A special exception that tells us that a data source is empty during probing."""
 
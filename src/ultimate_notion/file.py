@@ -5,8 +5,11 @@ from __future__ import annotations
 import datetime as dt
 import io
 import mimetypes
+import mmap
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import BinaryIO, Literal
 from urllib.parse import urlparse
@@ -22,10 +25,13 @@ from ultimate_notion.obj_api import objects as objs
 from ultimate_notion.obj_api.core import is_unset
 from ultimate_notion.obj_api.enums import FileUploadStatus
 from ultimate_notion.rich_text import Text, html_img
+from ultimate_notion.utils import run_concurrently
 
 NOTION_HOSTED_DOMAIN = 'secure.notion-static.com'
 MAX_FILE_SIZE = 20_000_000
 """Maximum file size for single part upload. It's 5MB only for the free plan"""
+MAX_POLL_INTERVAL = 30.0
+"""Maximum interval in seconds between polling the status of pending file uploads"""
 
 
 # ToDo: Use new syntax when requires-python >= 3.12
@@ -219,13 +225,37 @@ class UploadedFile(AnyFile[objs.UploadedFile], wraps=objs.UploadedFile):
         return self
 
     def wait_until_uploaded(self) -> Self:
-        """Wait until the uploaded file is fully processed."""
-        while self.status != FileUploadStatus.UPLOADED:
-            time.sleep(self.poll_interval)
-            self.update_status()
+        """Wait until the uploaded file is fully processed.
+
+        Polling stops as well if the upload failed or expired,
+        see [wait_for_uploads][ultimate_notion.file.wait_for_uploads].
+        """
+        wait_for_uploads([self])
         return self
 
 
+def wait_for_uploads(files: Iterable[UploadedFile], *, concurrency: int | None = None) -> None:
+    """Wait until all given uploaded files are processed by Notion, e.g. the imports of external URLs.
+
+    Instead of one polling loop per file, the status of all pending files is retrieved together in rounds on one
+    shared timer, using up to `concurrency` concurrent requests, which defaults to the `concurrency` setting.
+    The interval starts with the `poll_interval` of the files and doubles after each round up to `MAX_POLL_INTERVAL`.
+    Files that failed or expired are not polled any further, so check their `status` afterwards.
+    """
+    pending = [file for file in files if file.status == FileUploadStatus.PENDING]
+    if not pending:
+        return
+
+    session = get_active_session()
+    concurrency = session.concurrency if concurrency is None else concurrency
+    interval = min(file.poll_interval for file in pending)
+    while pending:
+        time.sleep(interval)
+        run_concurrently(UploadedFile.update_status, pending, concurrency=concurrency)
+        pending = [file for file in pending if file.status == FileUploadStatus.PENDING]
+        interval = min(MAX_POLL_INTERVAL, 2 * interval)
+
+
 def is_notion_hosted(url: str) -> bool:
     """Check if the URL is hosted on Notion."""
     return urlparse(url).netloc == NOTION_HOSTED_DOMAIN
@@ -249,6 +279,75 @@ def get_file_size(file: BinaryIO) -> int:
     return file_size
 
 
+@contextmanager
+def file_buffer(file: BinaryIO) -> Iterator[memoryview]:
+    """Provide the whole content of a file as memory view, avoiding to copy it if possible.
+
+    Regular files are memory-mapped and in-memory files like `BytesIO` expose their buffer directly.
+    All other files are read into memory. Slices of the memory view must be released before leaving the context.
+    """
+    if isinstance(file, io.BytesIO):
+        with file.getbuffer() as buffer:
+            yield buffer
+        return
+
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):  # e.g. no file descriptor or an empty file
+        file.seek(0)
+        with memoryview(file.read()) as buffer:
+            yield buffer
+        return
+
+    with mapped, memoryview(mapped) as buffer:
+        yield buffer
+
+
+class BufferReader(io.RawIOBase):
+    """Read-only binary stream over a memory view, e.g. a part of a memory-mapped file, without copying it upfront.
+
+    Closing the stream releases the memory view.
+    """
+
+    def __init__(self, buffer: memoryview):
+        super().__init__()
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def seekable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def readinto(self, b: bytearray | memoryview) -> int:  # type: ignore[override]
+        n_bytes = max(0, min(len(b), len(self._buffer) - self._pos))
+        b[:n_bytes] = self._buffer[self._pos : self._pos + n_bytes]
+        self._pos += n_bytes
+        return n_bytes
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                self._pos = offset
+            case io.SEEK_CUR:
+                self._pos += offset
+            case io.SEEK_END:
+                self._pos = len(self._buffer) + offset
+            case _:
+                msg = f'Invalid whence value: {whence}'
+                raise ValueError(msg)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._buffer.release()
+        super().close()
+
+
 def get_mime_type(file: BinaryIO | str | Path) -> str:
     """Detect the MIME type of a file.
 
@@ -82,8 +82,22 @@ def sorted_md_spans(md_spans: NDArray[np.int_]) -> Iterator[tuple[int, int, str]
     return reversed(sorted_spans)
 
 
+def is_unstyled(rich_text: RichTextBase) -> bool:
+    """Return whether the rich text is a plain text without any style, link or mention."""
+    if not rich_text.is_text or rich_text.obj_ref.href is not None:
+        return False
+    if is_unset(annotations := rich_text.obj_ref.annotations):
+        return False
+    return not (
+        annotations.bold or annotations.italic or annotations.strikethrough or annotations.code or annotations.underline
+    )
+
+
 def rich_texts_to_markdown(rich_texts: Sequence[RichTextBase]) -> str:
     """Convert a list of rich texts to markdown."""
+    rich_texts = list(rich_texts)
+    if all(is_unstyled(rich_text) for rich_text in rich_texts):  # fast path for the most common case
+        return ''.join(rich_text.obj_ref.plain_text for rich_text in rich_texts)
 
     def has_only_ws_chars(text: str) -> bool:
         return re.match(r'^\s*$', text) is not None
@@ -170,7 +184,6 @@ def rich_texts_to_markdown(rich_texts: Sequence[RichTextBase]) -> str:
             md_rich_texts[left] = '<u>' + md_rich_texts[left]
             md_rich_texts[right] += '</u>'
 
-    rich_texts = list(rich_texts)
     md_rich_texts = [rich_text.obj_ref.plain_text for rich_text in rich_texts]
     add_mentions(md_rich_texts, rich_texts)
     add_all_md_styles(md_rich_texts, rich_texts)
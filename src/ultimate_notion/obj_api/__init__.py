@@ -23,7 +23,9 @@ import notion_client
 
 from ultimate_notion import __version__
 from ultimate_notion.config import get_cfg_file
+from ultimate_notion.obj_api.async_endpoints import AsyncNotionAPI
 from ultimate_notion.obj_api.endpoints import NotionAPI
+from ultimate_notion.obj_api.ratelimit import AsyncRateLimitedTransport, RateLimitedTransport, RetryPolicy, TokenBucket
 
 if TYPE_CHECKING:
     from ultimate_notion.config import Config
@@ -54,8 +56,44 @@ def _get_default_user_agent() -> str:
     )
 
 
-def create_notion_client(cfg: Config, **kwargs: Any) -> notion_client.Client:
-    """Create a Notion client with the given authentication token."""
+def _log_request(request: httpx.Request) -> None:
+    msg = f'Request: {request.method} {request.url}'
+    try:
+        if request.content:
+            msg += f'\n{request.content.decode("utf-8") if isinstance(request.content, bytes) else request.content}'
+    except httpx.RequestNotRead:
+        # For streaming requests (like file uploads), we can't access content without reading it first
+        msg += '\n<streaming content>'
+    _logger.debug(msg)
+
+
+def _log_response(response: httpx.Response) -> None:
+    msg = f'Response: {response.status_code} {response.url}'
+    response.read()  # Ensure that the response content is fully loaded. Memory schouldn't be an issue here.
+    if response.content:
+        msg += f'\n{response.content.decode("utf-8") if isinstance(response.content, bytes) else response.content}'
+    _logger.debug(msg)
+
+
+async def _alog_request(request: httpx.Request) -> None:  # noqa: RUF029  # httpx awaits hooks of async clients
+    _log_request(request)
+
+
+async def _alog_response(response: httpx.Response) -> None:
+    await response.aread()  # `_log_response` would otherwise try a blocking read on an async stream
+    _log_response(response)
+
+
+def _get_limiter(cfg: Config) -> TokenBucket | None:
+    """Return the token bucket to throttle all requests of a client or `None` if rate limiting is disabled."""
+    uno_cfg = cfg.ultimate_notion
+    if uno_cfg.requests_per_second <= 0:
+        return None
+    return TokenBucket(rate=uno_cfg.requests_per_second, burst=uno_cfg.request_burst)
+
+
+def _get_client_kwargs(cfg: Config, kwargs: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
+    """Return the token, user agent and keyword arguments shared by the sync and async Notion clients."""
     if (auth := cfg.ultimate_notion.token) is None:
         msg = f'No Notion token found! Check {get_cfg_file()}.'
         raise RuntimeError(msg)
@@ -64,33 +102,53 @@ def create_notion_client(cfg: Config, **kwargs: Any) -> notion_client.Client:
     kwargs.setdefault('logger', logging.getLogger('notion_client'))
     kwargs.setdefault('log_level', logging.NOTSET)
     kwargs.setdefault('notion_version', NOTION_API_VERSION)
+    # Retrying is done by our transport, which also covers read-only POST requests and 502/504 responses
+    kwargs.setdefault('retry', False)
+    user_agent = kwargs.pop('user_agent', _get_default_user_agent())
+    return auth, user_agent, kwargs
 
-    def log_request(request: httpx.Request) -> None:
-        msg = f'Request: {request.method} {request.url}'
-        try:
-            if request.content:
-                msg += f'\n{request.content.decode("utf-8") if isinstance(request.content, bytes) else request.content}'
-        except httpx.RequestNotRead:
-            # For streaming requests (like file uploads), we can't access content without reading it first
-            msg += '\n<streaming content>'
-        _logger.debug(msg)
-
-    def log_response(response: httpx.Response) -> None:
-        msg = f'Response: {response.status_code} {response.url}'
-        response.read()  # Ensure that the response content is fully loaded. Memory schouldn't be an issue here.
-        if response.content:
-            msg += f'\n{response.content.decode("utf-8") if isinstance(response.content, bytes) else response.content}'
-        _logger.debug(msg)
 
-    user_agent = kwargs.pop('user_agent', _get_default_user_agent())
+def create_notion_client(cfg: Config, **kwargs: Any) -> notion_client.Client:
+    """Create a Notion client with the given authentication token.
+
+    All requests of the client are throttled by a shared token bucket and retried according
+    to the rate limiting and retry settings of the configuration.
+    """
+    auth, user_agent, kwargs = _get_client_kwargs(cfg, kwargs)
     # Retry transient connection failures (e.g. ephemeral-port exhaustion under heavy use). This applies only to
     # establishing the connection, not to requests that already reached the server, so it cannot cause duplicate writes.
-    transport = httpx.HTTPTransport(retries=3)
-    httpx_client = httpx.Client(transport=transport, event_hooks={'request': [log_request], 'response': [log_response]})
+    transport = RateLimitedTransport(
+        httpx.HTTPTransport(retries=3),
+        limiter=_get_limiter(cfg),
+        retry=RetryPolicy(max_retries=cfg.ultimate_notion.max_retries),
+    )
+    httpx_client = httpx.Client(
+        transport=transport, event_hooks={'request': [_log_request], 'response': [_log_response]}
+    )
     client = notion_client.Client(auth=auth, client=httpx_client, **kwargs)
     # we need to set the user agent manually, because notion_client ovewrites it during initialization
     httpx_client.headers['User-Agent'] = user_agent
     return client
 
 
-__all__ = ['NotionAPI', 'create_notion_client']
+def create_async_notion_client(cfg: Config, **kwargs: Any) -> notion_client.AsyncClient:
+    """Create an asynchronous Notion client with the given authentication token.
+
+    All requests of the returned client share a single `httpx.AsyncClient` and thus its connection pool.
+    Wrap it with `AsyncNotionAPI` to work with the object-based API.
+    """
+    auth, user_agent, kwargs = _get_client_kwargs(cfg, kwargs)
+    transport = AsyncRateLimitedTransport(
+        httpx.AsyncHTTPTransport(retries=3),  # see `create_notion_client` for the reasoning
+        limiter=_get_limiter(cfg),
+        retry=RetryPolicy(max_retries=cfg.ultimate_notion.max_retries),
+    )
+    httpx_client = httpx.AsyncClient(
+        transport=transport, event_hooks={'request': [_alog_request], 'response': [_alog_response]}
+    )
+    client = notion_client.AsyncClient(auth=auth, client=httpx_client, **kwargs)
+    httpx_client.headers['User-Agent'] = user_agent
+    return client
+
+
+__all__ = ['AsyncNotionAPI', 'NotionAPI', 'create_async_notion_client', 'create_notion_client']
@@ -0,0 +1,580 @@
+"""Provides an asynchronous object-based Notion API with all endpoints.
+
+This is the counterpart of [endpoints][ultimate_notion.obj_api.endpoints] for the `AsyncClient` of the
+[Notion Client SDK library](https://github.com/ramnes/notion-sdk-py). All endpoints return the same pydantic
+objects but are coroutine functions, and paginated results are returned as async iterators. This allows
+to run many requests concurrently over the connection pool of a single `httpx.AsyncClient`, e.g.:
+
+    async with AsyncNotionAPI(create_async_notion_client(cfg)) as api:
+        pages = await asyncio.gather(*(api.pages.retrieve(page_id) for page_id in page_ids))
+"""
+
+from __future__ import annotations
+
+import builtins
+import logging
+from collections.abc import AsyncIterator, Awaitable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+from uuid import UUID
+
+from pydantic import SerializeAsAny, TypeAdapter
+from typing_extensions import Self
+
+from ultimate_notion.obj_api.blocks import Block, Database, DataSource, Page
+from ultimate_notion.obj_api.core import GenericObject, ObjectRef, ParentRef, Unset, UnsetType, UserRef
+from ultimate_notion.obj_api.endpoints import (
+    BlocksEndpoint,
+    DatabasesEndpoint,
+    DataSourcesEndpoint,
+    Endpoint,
+    PagesEndpoint,
+    UploadsEndpoint,
+)
+from ultimate_notion.obj_api.enums import FileUploadMode, FileUploadStatus
+from ultimate_notion.obj_api.iterator import AsyncEndpointIterator, PropertyItemList
+from ultimate_notion.obj_api.objects import (
+    Bot,
+    Comment,
+    CustomEmojiObject,
+    DatabaseRef,
+    DataSourceRef,
+    EmojiObject,
+    FileObject,
+    FileUpload,
+    PageRef,
+    RichTextBaseObject,
+    User,
+)
+from ultimate_notion.obj_api.props import PropertyItem, PropertyValue, Title
+from ultimate_notion.obj_api.query import DataSourceQueryBuilder, SearchQueryBuilder
+from ultimate_notion.obj_api.schema import Property, RenameProp
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from notion_client import AsyncClient as NCAsyncClient
+    from notion_client.api_endpoints import BlocksChildrenEndpoint as NCBlocksChildrenEndpoint
+    from notion_client.api_endpoints import BlocksEndpoint as NCBlocksEndpoint
+    from notion_client.api_endpoints import CommentsEndpoint as NCCommentsEndpoint
+    from notion_client.api_endpoints import DatabasesEndpoint as NCDatabasesEndpoint
+    from notion_client.api_endpoints import DataSourcesEndpoint as NCDataSourcesEndpoint
+    from notion_client.api_endpoints import FileUploadsEndpoint as NCFileUploadsEndpoint
+    from notion_client.api_endpoints import PagesEndpoint as NCPagesEndpoint
+    from notion_client.api_endpoints import PagesPropertiesEndpoint as NCPagesPropertiesEndpoint
+    from notion_client.api_endpoints import UsersEndpoint as NCUsersEndpoint
+
+_logger = logging.getLogger(__name__)
+
+
+async def _await(data: Any | Awaitable[Any]) -> Any:
+    """Await a response of the `AsyncClient`, which the Notion SDK types as `Any | Awaitable[Any]`."""
+    return await cast(Awaitable[Any], data)
+
+
+class AsyncNotionAPI:
+    """Asynchronous object-based Notion API (pydantic) with all endpoints.
+
+    The API can be used as async context manager to close the underlying client when done.
+    """
+
+    def __init__(self, client: NCAsyncClient):
+        self.client = client
+        self.blocks = AsyncBlocksEndpoint(self)
+        self.data_sources = AsyncDataSourcesEndpoint(self)
+        self.databases = AsyncDatabasesEndpoint(self)
+        self.pages = AsyncPagesEndpoint(self)
+        self.search = AsyncSearchEndpoint(self)
+        self.users = AsyncUsersEndpoint(self)
+        self.comments = AsyncCommentsEndpoint(self)
+        self.uploads = AsyncUploadsEndpoint(self)
+
+    async def aclose(self) -> None:
+        """Close the underlying client and its connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+@dataclass
+class AsyncEndpoint:
+    """Baseclass of the asynchronous Notion API endpoints."""
+
+    api: AsyncNotionAPI
+
+    _as_dict = staticmethod(Endpoint._as_dict)
+
+
+class AsyncBlocksEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the 'blocks' endpoint of the Notion API"""
+
+    class ChildrenEndpoint(AsyncEndpoint):
+        """Asynchronous interface to the API 'blocks/children' endpoint."""
+
+        @property
+        def raw_api(self) -> NCBlocksChildrenEndpoint:
+            """Return the underlying endpoint in the Notion SDK."""
+            return self.api.client.blocks.children
+
+        # https://developers.notion.com/reference/patch-block-children
+        async def append(
+            self,
+            parent: ParentRef | GenericObject | UUID | str,
+            blocks: builtins.list[Block],
+            *,
+            after: Block | None = None,
+        ) -> tuple[builtins.list[Block], builtins.list[Block]]:
+            """Add the given blocks as children of the specified parent.
+
+            The blocks info of the passed blocks will be updated and returned as first part of a tuple.
+            The second party of the tuple is an empty list or the updated blocks after the specified block
+            if `after` was specified.
+            """
+            request = BlocksEndpoint.ChildrenEndpoint._build_append_request(parent, blocks, after=after)
+            block_iter = AsyncEndpointIterator[Block](endpoint=self.raw_api.append, pagination=self.raw_api.list)
+            appended_blocks = [block async for block in block_iter(**request)]
+            return BlocksEndpoint.ChildrenEndpoint._update_appended(blocks, appended_blocks, after=after)
+
+        # https://developers.notion.com/reference/get-block-children
+        def list(self, parent: ParentRef | GenericObject | UUID | str) -> AsyncIterator[Block]:
+            """Return all Blocks contained by the specified parent."""
+            parent_id = ObjectRef.build(parent).id
+            _logger.debug(f'Listing all blocks for parent with id `{parent_id}`.')
+            block_iter = AsyncEndpointIterator[Block](endpoint=self.raw_api.list)
+            return block_iter(block_id=parent_id)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the `blocks` endpoint for the Notion API."""
+        super().__init__(*args, **kwargs)
+        self.children = AsyncBlocksEndpoint.ChildrenEndpoint(*args, **kwargs)
+
+    @property
+    def raw_api(self) -> NCBlocksEndpoint:
+        """Return the underlying endpoint in the Notion SDK."""
+        return self.api.client.blocks
+
+    # https://developers.notion.com/reference/delete-a-block
+    async def delete(self, block: Block | UUID | str) -> Block:
+        """Delete (archive) the specified Block."""
+        block_id = str(ObjectRef.build(block).id)
+        _logger.debug(f'Deleting block with id `{block_id}`.')
+        data = await _await(self.raw_api.delete(block_id))
+        return Block.model_validate(data)
+
+    async def restore(self, block: Block | UUID | str) -> Block:
+        """Restore (unarchive) the specified Block."""
+        block_id = str(ObjectRef.build(block).id)
+        _logger.debug(f'Restoring block with id `{block_id}`.')
+        data = await _await(self.raw_api.update(block_id, in_trash=False))
+        return Block.model_validate(data)
+
+    # https://developers.notion.com/reference/retrieve-a-block
+    async def retrieve(self, block: Block | UUID | str) -> Block:
+        """Return the requested Block."""
+        block_id = str(ObjectRef.build(block).id)
+        _logger.debug(f'Retrieving block with id `{block_id}`.')
+        data = await _await(self.raw_api.retrieve(block_id))
+        return Block.model_validate(data)
+
+    # https://developers.notion.com/reference/update-a-block
+    async def update(self, block: Block) -> None:
+        """Update the block object on the server.
+
+        The block info will be updated to the latest version from the server.
+        """
+        block_id, params = BlocksEndpoint._build_update_request(block)
+        data = self._as_dict(await _await(self.raw_api.update(block_id.hex, **params)))
+        block.update(**data)
+
+
+class AsyncDataSourcesEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the 'data_sources' endpoint of the Notion API."""
+
+    @property
+    def raw_api(self) -> NCDataSourcesEndpoint:
+        """Return the underlying endpoint in the Notion SDK."""
+        return self.api.client.data_sources
+
+    # https://developers.notion.com/reference/create-a-data-source
+    async def create(
+        self,
+        parent: Database,
+        schema: Mapping[str, Property],
+        *,
+        title: list[RichTextBaseObject] | None = None,
+    ) -> DataSource:
+        """Add an additional data source to an existing database container."""
+        parent_ref = DatabaseRef.build(parent)
+        _logger.debug(f'Creating new data source in database with id `{parent_ref.database_id}`.')
+        request = DataSourcesEndpoint._build_request(parent=parent_ref, schema=schema, title=title)
+        data = await _await(self.raw_api.create(**request))
+        return DataSource.model_validate(data)
+
+    # https://developers.notion.com/reference/retrieve-a-data-source
+    async def retrieve(self, dsref: DataSource | str | UUID) -> DataSource:
+        """Return the DataSource with the given ID."""
+        ds_id = DataSourceRef.build(dsref).data_source_id
+        _logger.debug(f'Retrieving data source with id `{ds_id}`.')
+        data = await _await(self.raw_api.retrieve(str(ds_id)))
+        return DataSource.model_validate(data)
+
+    async def update(
+        self,
+        ds: DataSource,
+        *,
+        parent: SerializeAsAny[ParentRef] | None = None,
+        title: list[RichTextBaseObject] | None = None,
+        description: list[RichTextBaseObject] | None = None,
+        inline: bool | None = None,
+        schema: Mapping[str, Property | RenameProp | None] | None = None,
+        in_trash: bool | None = None,
+    ) -> None:
+        """Update the DataSource object on the server.
+
+        The data source info will be updated to the latest version from the server.
+        """
+        _logger.debug(f'Updating info of data source with id `{ds.id}`.')
+
+        if request := DataSourcesEndpoint._build_request(
+            parent=parent, schema=schema, title=title, description=description, inline=inline, in_trash=in_trash
+        ):
+            data = self._as_dict(await _await(self.raw_api.update(str(ds.id), **request)))
+            ds.update(**data)
+
+    async def delete(self, ds: DataSource) -> DataSource:
+        """Delete (archive) the database containing the specified DataSource."""
+        db_id = DataSourcesEndpoint._container_db_id(ds)
+        _logger.debug(f'Deleting database `{db_id}` containing data source `{ds.id}`.')
+        block_obj = await self.api.blocks.delete(str(db_id))
+        ds.archived = block_obj.archived  # ToDo: Remove when `archived` is completely deprecated
+        ds.in_trash = block_obj.in_trash
+        return ds
+
+    async def restore(self, ds: DataSource) -> DataSource:
+        """Restore (unarchive) the database containing the specified DataSource."""
+        db_id = DataSourcesEndpoint._container_db_id(ds)
+        _logger.debug(f'Restoring database `{db_id}` containing data source `{ds.id}`.')
+        block_obj = await self.api.blocks.restore(str(db_id))
+        ds.archived = block_obj.archived  # ToDo: Remove when `archived` is completely deprecated
+        ds.in_trash = block_obj.in_trash
+        return ds
+
+    # https://developers.notion.com/reference/post-data-source-query
+    def query(self, ds: DataSource | UUID | str) -> DataSourceQueryBuilder:
+        """Initialize a new Query object for the data source.
+
+        Use `aexecute` of the returned query builder to iterate over the results.
+        """
+        ds_id = DataSourceRef.build(ds).data_source_id
+        _logger.debug(f'Initializing query for data source with id `{ds_id}`.')
+        return DataSourceQueryBuilder(endpoint=self.raw_api.query, data_source_id=str(ds_id))
+
+
+class AsyncDatabasesEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the 'databases' endpoint of the Notion API."""
+
+    @property
+    def raw_api(self) -> NCDatabasesEndpoint:
+        """Return the underlying endpoint in the Notion SDK."""
+        return self.api.client.databases
+
+    # https://developers.notion.com/reference/create-a-database
+    async def create(
+        self,
+        parent: Page,
+        *,
+        schema: Mapping[str, Property] | None = None,
+        title: list[RichTextBaseObject] | None = None,
+        inline: bool = False,
+    ) -> Database:
+        """Create a new database container in the given Page parent."""
+        parent_ref = PageRef.build(parent)
+        _logger.debug(f'Creating new database below page with id `{parent_ref.page_id}`.')
+        request = DatabasesEndpoint._build_request(parent=parent_ref, title=title, inline=inline)
+        if schema is not None:
+            request['initial_data_source'] = {
+                'properties': {name: value.serialize_for_api() for name, value in schema.items()}
+            }
+        data = await _await(self.raw_api.create(**request))
+        return Database.model_validate(data)
+
+    # https://developers.notion.com/reference/retrieve-a-database
+    async def retrieve(self, dbref: Database | str | UUID) -> Database:
+        """Return the Database with the given ID."""
+        db_id = DatabaseRef.build(dbref).database_id
+        _logger.debug(f'Retrieving database with id `{db_id}`.')
+        data = await _await(self.raw_api.retrieve(str(db_id)))
+        return Database.model_validate(data)
+
+    async def update(
+        self,
+        db: Database,
+        *,
+        title: list[RichTextBaseObject] | None = None,
+        description: list[RichTextBaseObject] | None = None,
+        inline: bool | None = None,
+        is_locked: bool | None = None,
+    ) -> None:
+        """Update the Database object on the server.
+
+        The database info will be updated to the latest version from the server.
+        """
+        _logger.debug(f'Updating info of database with id `{db.id}`.')
+
+        if request := DatabasesEndpoint._build_request(
+            title=title, description=description, inline=inline, is_locked=is_locked
+        ):
+            data = self._as_dict(await _await(self.raw_api.update(str(db.id), **request)))
+            db.update(**data)
+
+
+class AsyncPagesEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the API 'pages' endpoint."""
+
+    class PropertiesEndpoint(AsyncEndpoint):
+        """Asynchronous interface to the API 'pages/properties' endpoint."""
+
+        @property
+        def raw_api(self) -> NCPagesPropertiesEndpoint:
+            """Return the underlying endpoint in the Notion SDK"""
+            return self.api.client.pages.properties
+
+        # https://developers.notion.com/reference/retrieve-a-page-property
+        def retrieve(
+            self,
+            page: Page | UUID | str,
+            property: PropertyValue | str,  # noqa: A002
+        ) -> AsyncIterator[PropertyItem]:
+            """Return the Property on a specific Page with the given ID"""
+            page_id = str(PageRef.build(page).page_id)
+            property_id = property.id if isinstance(property, PropertyValue) else property
+            _logger.debug(f'Retrieving property with id `{property_id}` from page with id `{page_id}`.')
+            prop_iter = AsyncEndpointIterator[PropertyItem](
+                endpoint=self.raw_api.retrieve,
+                model_validate=TypeAdapter(PropertyItemList | PropertyItem).validate_python,
+            )
+            return prop_iter(page_id=page_id, property_id=property_id)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the `pages` endpoint for the Notion API"""
+        super().__init__(*args, **kwargs)
+        self.properties = AsyncPagesEndpoint.PropertiesEndpoint(*args, **kwargs)
+
+    @property
+    def raw_api(self) -> NCPagesEndpoint:
+        """Return the underlying endpoint in the Notion SDK"""
+        return self.api.client.pages
+
+    # https://developers.notion.com/reference/post-page
+    async def create(
+        self,
+        parent: ParentRef | Page | DataSource,
+        *,
+        title: Title | None = None,
+        properties: dict[str, PropertyValue] | None = None,
+        children: list[Block] | None = None,
+        cover: FileObject | None = None,
+        icon: FileObject | EmojiObject | CustomEmojiObject | None = None,
+    ) -> Page:
+        """Add a page to the given parent (Page or DataSource)."""
+        request = PagesEndpoint._build_create_request(
+            parent, title=title, properties=properties, children=children, cover=cover, icon=icon
+        )
+        data = await _await(self.raw_api.create(**request))
+        return Page.model_validate(data)
+
+    async def delete(self, page: Page) -> None:
+        """Delete (archive) the specified Page."""
+        await self.set_attr(page, in_trash=True)
+
+    async def restore(self, page: Page) -> None:
+        """Restore (unarchive) the specified Page."""
+        await self.set_attr(page, in_trash=False)
+
+    # https://developers.notion.com/reference/retrieve-a-page
+    async def retrieve(self, page: Page | UUID | str) -> Page:
+        """Return the requested Page.
+
+        !!! warning
+
+            This method will only retrieve up to 25 items per property.
+            Use `pages.properties.retrieve` to retrieve all items of a specific property.
+        """
+        page_id = str(PageRef.build(page).page_id)
+        _logger.debug(f'Retrieving page with id `{page_id}`.')
+        data = await _await(self.raw_api.retrieve(page_id))
+        return Page.model_validate(data)
+
+    # https://developers.notion.com/reference/patch-page
+    async def update(
+        self,
+        page: Page,
+        *,
+        properties: dict[str, PropertyValue] | None = None,
+        cover: FileObject | UnsetType | None = Unset,
+        icon: FileObject | EmojiObject | CustomEmojiObject | UnsetType | None = Unset,
+        in_trash: bool | UnsetType = Unset,
+        is_locked: bool | UnsetType = Unset,
+    ) -> None:
+        """Update the Page object properties on the server."""
+        page_id, request = PagesEndpoint._build_update_request(
+            page, properties=properties, cover=cover, icon=icon, in_trash=in_trash, is_locked=is_locked
+        )
+        data = self._as_dict(await _await(self.raw_api.update(page_id.hex, **request)))
+        page.update(**data)
+
+    async def set_attr(
+        self,
+        page: Page,
+        *,
+        cover: FileObject | UnsetType | None = Unset,
+        icon: FileObject | EmojiObject | CustomEmojiObject | UnsetType | None = Unset,
+        in_trash: bool | UnsetType = Unset,
+        is_locked: bool | UnsetType = Unset,
+    ) -> None:
+        """Set specific page attributes (such as cover, icon, etc.) on the server.
+
+        To remove an attribute, set its value to None.
+        """
+        page_id = PageRef.build(page).page_id
+        props = PagesEndpoint._build_attr_request(
+            page_id, cover=cover, icon=icon, in_trash=in_trash, is_locked=is_locked
+        )
+        data = self._as_dict(await _await(self.raw_api.update(page_id.hex, **props)))
+        page.update(**data)
+
+
+class AsyncSearchEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the API 'search' endpoint."""
+
+    # https://developers.notion.com/reference/post-search
+    def __call__(self, text: str | None = None) -> SearchQueryBuilder:
+        """Perform a search with the optional text.
+
+        Use `aexecute` of the returned query builder to iterate over the results.
+        """
+        return SearchQueryBuilder(endpoint=self.api.client.search, text=text)
+
+
+class AsyncUsersEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the API 'users' endpoint."""
+
+    @property
+    def raw_api(self) -> NCUsersEndpoint:
+        """Return the underlying endpoint in the Notion SDK"""
+        return self.api.client.users
+
+    # https://developers.notion.com/reference/get-users
+    def list(self) -> AsyncIterator[User]:
+        """Return an async iterator for all users in the workspace."""
+        _logger.debug('Retrieving all known users.')
+        user_iter = AsyncEndpointIterator[User](endpoint=self.raw_api.list)
+        return user_iter()
+
+    # https://developers.notion.com/reference/get-user
+    async def retrieve(self, user: User | UUID | str) -> User:
+        """Return the User with the given ID."""
+        user_id = str(UserRef.build(user).id)
+        _logger.debug(f'Retrieving user with id `{user_id}`.')
+        data = await _await(self.raw_api.retrieve(user_id))
+        return User.model_validate(data)
+
+    # https://developers.notion.com/reference/get-self
+    async def me(self) -> Bot:
+        """Return the current bot User."""
+        _logger.debug('Retrieving current integration bot')
+        data = await _await(self.raw_api.me())
+        return Bot.model_validate(data)
+
+
+class AsyncCommentsEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the API 'comments' endpoint."""
+
+    @property
+    def raw_api(self) -> NCCommentsEndpoint:
+        """Return the underlying endpoint in the Notion SDK"""
+        return self.api.client.comments
+
+    # https://developers.notion.com/reference/create-a-comment
+    async def create(self, page: Page | UUID | str, rich_text: builtins.list[RichTextBaseObject]) -> Comment:
+        """Create a comment on the specified Page."""
+        page_ref = PageRef.build(page)
+        _logger.debug(f'Creating a comment on page with id `{page_ref.page_id}.')
+        rich_text_json = [rt.serialize_for_api() for rt in rich_text]
+        data = await _await(self.raw_api.create(parent=page_ref.serialize_for_api(), rich_text=rich_text_json))
+        return Comment.model_validate(data)
+
+    # https://developers.notion.com/reference/create-a-comment
+    async def append(self, discussion_id: UUID | str, rich_text: builtins.list[RichTextBaseObject]) -> Comment:
+        """Append a comment to the specified discussion."""
+        _logger.debug(f'Appending a comment to discussion with id `{discussion_id}`.')
+        rich_text_json = [rt.serialize_for_api() for rt in rich_text]
+        data = await _await(self.raw_api.create(discussion_id=str(discussion_id), rich_text=rich_text_json))
+        return Comment.model_validate(data)
+
+    # https://developers.notion.com/reference/retrieve-a-comment
+    def list(self, block: Block | Page | UUID | str) -> AsyncIterator[Comment]:
+        """Return all comments on the specified page or block."""
+        block_id = str(ObjectRef.build(block).id)
+        _logger.debug(f'Listing comments on block with id `{block_id}`.')
+        comment_iter = AsyncEndpointIterator[Comment](endpoint=self.raw_api.list)
+        return comment_iter(block_id=block_id)
+
+
+class AsyncUploadsEndpoint(AsyncEndpoint):
+    """Asynchronous interface to the API 'file uploads' endpoint."""
+
+    @property
+    def raw_api(self) -> NCFileUploadsEndpoint:
+        """Return the underlying endpoint in the Notion SDK"""
+        return self.api.client.file_uploads
+
+    # https://developers.notion.com/reference/create-a-file-upload
+    async def create(
+        self,
+        name: str | None = None,
+        n_parts: int | None = None,
+        mode: FileUploadMode = FileUploadMode.SINGLE_PART,
+        external_url: str | None = None,
+        content_type: str | None = None,
+    ) -> FileUpload:
+        """Create a file upload."""
+        kwargs = UploadsEndpoint._build_create_request(name, n_parts, mode, external_url, content_type)
+        data = await _await(self.raw_api.create(**kwargs))
+        return FileUpload.model_validate(data)
+
+    # https://developers.notion.com/reference/send-a-file-upload
+    async def send(self, file_upload: FileUpload, file: BinaryIO, part: int | None = None) -> None:
+        """Send a file upload and update the file_upload object."""
+        kwargs = UploadsEndpoint._build_send_request(file_upload, file, part)
+        data = self._as_dict(await _await(self.raw_api.send(**kwargs)))
+        file_upload.update(**data)
+
+    # https://developers.notion.com/reference/complete-a-file-upload
+    async def complete(self, file_upload: FileUpload) -> None:
+        """Complete the file upload and update the file_upload object."""
+        _logger.debug(f'Completing file upload with id `{file_upload.id}`.')
+        data = self._as_dict(await _await(self.raw_api.complete(file_upload_id=str(file_upload.id))))
+        file_upload.update(**data)
+
+    # https://developers.notion.com/reference/retrieve-a-file-upload
+    async def retrieve(self, upload_id: UUID | str) -> FileUpload:
+        """Return the FileUpload with the given ID."""
+        _logger.debug(f'Retrieving file upload with id `{upload_id}`.')
+        data = await _await(self.raw_api.retrieve(file_upload_id=str(upload_id)))
+        return FileUpload.model_validate(data)
+
+    # https://developers.notion.com/reference/list-file-uploads
+    def list(self, status: FileUploadStatus | None = None, page_size: int = 100) -> AsyncIterator[FileUpload]:
+        """Return all file uploads."""
+        file_upload_iter = AsyncEndpointIterator[FileUpload](endpoint=self.raw_api.list)
+        return file_upload_iter(**UploadsEndpoint._build_list_request(status, page_size))
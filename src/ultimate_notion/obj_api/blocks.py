@@ -31,6 +31,7 @@ from ultimate_notion.obj_api.core import (
     Unset,
     UnsetType,
     UserRef,
+    _value_eq_data,
     is_unset,
 )
 from ultimate_notion.obj_api.enums import BGColor, CodeLang, Color
@@ -177,6 +178,10 @@ class Block(TypedObject[GO_co], DataObject, object='block', polymorphic_base=Tru
         # ignore meta fields, e.g. id, created_time, etc. for equality, only use content
         return self.type == other.type and self.value == other.value
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        value, exact = _value_eq_data(self.value)
+        return {'type': self.type, 'value': value}, exact
+
     def serialize_for_api(self) -> dict[str, Any]:
         """Serialize the block for sending it to the Notion API."""
         data = super().serialize_for_api()
@@ -15,10 +15,13 @@ from __future__ import annotations
 
 import builtins
 import logging
+import operator
 import re
+import types
 from abc import ABC
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, cast
+from collections.abc import Callable, Sequence
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Generic, Union, cast, get_args, get_origin
 from uuid import UUID
 
 from pydantic import (
@@ -26,11 +29,13 @@ from pydantic import (
     ConfigDict,
     Field,
     SerializeAsAny,
+    TypeAdapter,
     ValidationError,
     ValidatorFunctionWrapHandler,
     field_validator,
     model_validator,
 )
+from pydantic.functional_validators import AfterValidator, BeforeValidator
 from typing_extensions import Self, TypeIs, TypeVar
 
 from ultimate_notion.obj_api.enums import Color
@@ -153,9 +158,46 @@ class GenericObject(BaseModel):
         if type(self) is not type(other):
             return NotImplemented
 
-        # _freeze is used to guarantee the consistency with __hash__.
+        # comparing the plain data avoids copying both objects for normalization in most cases
+        data, exact = self._eq_data()
+        other_data, other_exact = other._eq_data()
+        if data != other_data:
+            return False
+        elif exact and other_exact:
+            return True
+
+        # some nested objects define their own equality, e.g. `User`, so we need to compare all fields
         return BaseModel.__eq__(_normalize_model(self), _normalize_model(other))
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        """Return the JSON-like data equality is based on and whether it determines equality exactly.
+
+        Subclasses overriding `__eq__` must override this method accordingly, otherwise the full comparison is used.
+        """
+        cls = type(self)
+        if not _has_exact_eq_data(cls):
+            return '<custom>', False
+
+        data: dict[str, Any] = {'__class__': f'{cls.__module__}.{cls.__qualname__}'}
+        exact = True
+        is_mention = isinstance(self, TypedObject) and self.type == 'mention'
+        for field_name in cls.model_fields:
+            field_value = getattr(self, field_name)
+            if field_name in {'id', 'option_ids'} or (is_mention and field_name in {'plain_text', 'href'}):
+                continue  # ignored like in `_normalize_model`
+            elif field_name == 'color' and is_unset(field_value):
+                field_value = _normalize_color(field_value)
+            elif field_name == 'annotations' and is_unset(field_value):
+                from ultimate_notion.obj_api.objects import Annotations  # noqa: PLC0415  # Avoid circular import.
+
+                field_value = Annotations()
+            data[field_name], field_exact = _value_eq_data(field_value)
+            exact &= field_exact
+        if self.__pydantic_extra__:
+            data['__extra__'], extra_exact = _value_eq_data(self.__pydantic_extra__)
+            exact &= extra_exact
+        return data, exact
+
     @classmethod
     def _set_field_default(cls, name: str, default: str) -> None:
         """Modify the `BaseModel` field information for a specific class instance.
@@ -185,18 +227,24 @@ class GenericObject(BaseModel):
         # More details here: https://github.com/pydantic/pydantic/issues/6966
         cls.model_rebuild(force=True)
 
-    # https://github.com/pydantic/pydantic/discussions/3139
     def update(self, **data: Any) -> None:
-        """Update the internal attributes with new data in place."""
-
-        new_obj_dct = self.model_dump()
-        new_obj_dct.update(data)
-        new_obj = self.model_validate(new_obj_dct)
+        """Update the internal attributes with new data in place.
 
-        for k, v in new_obj.model_dump(exclude_unset=True).items():
-            # exclude_unset avoids overwriting for instance known children that need to be retrieved separately
-            _logger.debug('updating object data: %s => %s', k, v)
-            setattr(self, k, getattr(new_obj, k))
+        Only the given fields are validated against their types, all other fields are left untouched,
+        e.g. known children that need to be retrieved separately. Unknown fields are ignored unless
+        extra fields are forbidden.
+        """
+        model_fields = type(self).model_fields
+        aliases = {field.alias: name for name, field in model_fields.items() if field.alias is not None}
+        forbid_extra = self.model_config.get('extra') == 'forbid'
+
+        for key, value in data.items():
+            name = aliases.get(key, key)
+            if name not in model_fields and not forbid_extra:
+                continue
+            _logger.debug('updating object data: %s => %s', name, value)
+            # validates the value like an assignment, including field validators, and sets it in place
+            self.__pydantic_validator__.validate_assignment(self, name, value)
 
     def serialize_for_api(self) -> dict[str, Any]:
         """Serialize the object for sending it to the Notion API."""
@@ -215,6 +263,32 @@ class GenericObject(BaseModel):
         """Use the standard constructur to build the instance. Will be overwritten for more complex types."""
         return cls(*args, **kwargs)
 
+    @classmethod
+    def construct_trusted(cls, data: dict[str, Any]) -> Self:
+        """Construct an instance from trusted data, e.g. a response of the Notion API, without validating it.
+
+        Nested objects are constructed recursively and polymorphic types are dispatched like in `model_validate`.
+        Only leaf values like UUIDs, dates and enums are still converted by pydantic. This is considerably faster
+        than `model_validate` but the data must be well-formed, as no error is raised otherwise.
+        """
+        if isinstance(data, cls):
+            return data
+
+        model_cls = cls._trusted_cls(data)
+        fields = {}
+        for name, (key, decode) in _trusted_field_decoders(model_cls).items():
+            if key in data:
+                fields[name] = decode(data[key])
+        if model_cls.model_config.get('extra') == 'allow':
+            keys = {key for key, _ in _trusted_field_decoders(model_cls).values()}
+            fields |= {key: value for key, value in data.items() if key not in keys}
+        return cast(Self, model_cls.model_construct(_fields_set=set(fields), **fields))
+
+    @classmethod
+    def _trusted_cls(cls, data: dict[str, Any]) -> builtins.type[GenericObject]:
+        """Return the class to construct for the given trusted data."""
+        return cls
+
 
 T = TypeVar('T', default=Any)  # ToDo: use new syntax in Python 3.12 and consider using default = in Python 3.13+
 
@@ -231,6 +305,42 @@ def _normalize_color(val: Color | UnsetType) -> Color:
     return val
 
 
+_EXACT_EQ_DATA: dict[builtins.type[GenericObject], bool] = {}
+"""Cache whether `_eq_data` of a class matches its `__eq__`"""
+
+
+def _has_exact_eq_data(cls: builtins.type[GenericObject]) -> bool:
+    """Check that `__eq__` is not overridden in a more derived class than `_eq_data`."""
+    if (exact := _EXACT_EQ_DATA.get(cls)) is None:
+        mro = cls.__mro__
+        eq_cls = next(c for c in mro if '__eq__' in c.__dict__)
+        eq_data_cls = next(c for c in mro if '_eq_data' in c.__dict__)
+        exact = mro.index(eq_data_cls) <= mro.index(eq_cls)
+        _EXACT_EQ_DATA[cls] = exact
+    return exact
+
+
+def _value_eq_data(value: Any) -> tuple[Any, bool]:
+    """Return the plain data of any value for comparing objects and whether it determines equality exactly."""
+    match value:
+        case GenericObject():
+            return value._eq_data()
+        case UnsetType():
+            return '<unset>', True
+        case dict():
+            items = {str(key): _value_eq_data(item) for key, item in value.items()}
+            return {key: data for key, (data, _) in items.items()}, all(exact for _, exact in items.values())
+        case list() | tuple():
+            elems = [_value_eq_data(elem) for elem in value]
+            return [data for data, _ in elems], all(exact for _, exact in elems) and isinstance(value, list)
+        case float() if value.is_integer():
+            return int(value), True
+        case str() | int() | float() | None:
+            return value, True
+        case _:
+            return value, isinstance(value, datetime | date | UUID)
+
+
 def _normalize_model(obj: T) -> T:
     """Normalize the model for comparison and hashing.
 
@@ -374,6 +484,10 @@ class UserRef(NotionObject, object='user'):
         ref = ObjectRef.build(user_ref)
         return UserRef.model_construct(id=ref.id)
 
+    def _eq_data(self) -> tuple[Any, bool]:  # noqa: PLR6301
+        # ids are ignored and users compare equal to references, see `User.__eq__`
+        return '<user>', True
+
 
 class NotionEntity(NotionObject):
     """A materialized entity, which was created by a user."""
@@ -387,6 +501,106 @@ class NotionEntity(NotionObject):
     last_edited_time: datetime | UnsetType = Unset
 
 
+_TRUSTED_PASSTHROUGH: tuple[Any, ...] = (str, int, bool, Any, type(None), UnsetType)
+"""Types whose trusted values are used as is"""
+_TRUSTED_DECODERS: dict[builtins.type[GenericObject], dict[str, tuple[str, Callable[[Any], Any]]]] = {}
+"""Cache of the field decoders of each class used by `GenericObject.construct_trusted`"""
+
+
+def _trusted_field_decoders(cls: builtins.type[GenericObject]) -> dict[str, tuple[str, Callable[[Any], Any]]]:
+    """Return the key in the data and the decoder for each field of the given class."""
+    if (decoders := _TRUSTED_DECODERS.get(cls)) is None:
+        decoders = {
+            name: (field.alias or name, _trusted_decoder(field.annotation, field.metadata))
+            for name, field in cls.model_fields.items()
+        }
+        _TRUSTED_DECODERS[cls] = decoders
+    return decoders
+
+
+def _is_union(tp: Any) -> bool:
+    return get_origin(tp) in {Union, types.UnionType}
+
+
+def _contains_model(tp: Any) -> bool:
+    """Check if the given type is or contains an API object, neglecting `UnsetType`."""
+    if isinstance(tp, builtins.type) and issubclass(tp, BaseModel):
+        return tp is not UnsetType
+    return any(_contains_model(arg) for arg in get_args(tp))
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _trusted_decoder(tp: Any, metadata: Sequence[Any] = ()) -> Callable[[Any], Any]:
+    """Return a function converting trusted data of the given type without validating it.
+
+    Leaf types are still converted by a `TypeAdapter`, e.g. strings to UUIDs or datetimes.
+    """
+    if get_origin(tp) is Annotated:
+        tp, *inner_metadata = get_args(tp)
+        metadata = [*inner_metadata, *metadata]
+
+    if not _contains_model(tp):
+        if not metadata and all(arg in _TRUSTED_PASSTHROUGH for arg in (get_args(tp) if _is_union(tp) else (tp,))):
+            return _passthrough
+        if metadata:
+            tp = operator.getitem(Annotated, (tp, *metadata))
+        return TypeAdapter(tp).validate_python
+
+    before_funcs: list[Callable[[Any], Any]] = []
+    after_funcs: list[Callable[[Any], Any]] = []
+    for meta in metadata:
+        # the validators of the API objects only take the value and no `ValidationInfo`
+        if isinstance(meta, BeforeValidator):
+            before_funcs.append(cast(Callable[[Any], Any], meta.func))
+        elif isinstance(meta, AfterValidator):
+            after_funcs.append(cast(Callable[[Any], Any], meta.func))
+    if before_funcs or after_funcs:
+        decode = _trusted_decoder(tp)
+
+        def decode_with_validators(value: Any) -> Any:
+            for func in before_funcs:
+                value = func(value)
+            value = decode(value)
+            for func in after_funcs:
+                value = func(value)
+            return value
+
+        return decode_with_validators
+
+    if _is_union(tp):
+        union_args = [arg for arg in get_args(tp) if arg not in {type(None), UnsetType}]
+        if len(union_args) > 1:  # no cheap way to decide which model to construct
+            return TypeAdapter(tp).validate_python
+        decode_arg = _trusted_decoder(union_args[0])
+
+        def decode_optional(value: Any) -> Any:
+            return None if value is None else decode_arg(value)
+
+        return decode_optional
+
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is list:
+        decode_item = _trusted_decoder(args[0])
+
+        def decode_list(value: list[Any]) -> list[Any]:
+            return [decode_item(item) for item in value]
+
+        return decode_list
+    if origin is dict:
+        decode_value = _trusted_decoder(args[1])
+
+        def decode_dict(value: dict[str, Any]) -> dict[str, Any]:
+            return {key: decode_value(item) for key, item in value.items()}
+
+        return decode_dict
+    if isinstance(tp, builtins.type) and issubclass(tp, GenericObject):
+        return tp.construct_trusted
+    return TypeAdapter(tp).validate_python
+
+
 TO_co = TypeVar('TO_co', covariant=True, default=Any)  # ToDo: use new syntax in Python 3.12
 
 
@@ -495,6 +709,23 @@ class TypedObject(GenericObject, Generic[TO_co]):
             raise RuntimeError(msg) from e
         return typed_obj
 
+    @classmethod
+    def _trusted_cls(cls, data: dict[str, Any]) -> builtins.type[GenericObject]:
+        """Dispatch to the registered subclass like `_resolve_type` does."""
+        if not cls._polymorphic_base:
+            return cls
+
+        if (type_name := data.get('type')) is None:
+            if data.get('object') == 'user':
+                return UserRef
+            msg = f"Missing 'type' in data {data}"
+            raise ValueError(msg)
+
+        if cls._typemap is None or (sub_cls := cls._typemap.get(type_name)) is None:
+            msg = f'Unsupported sub-type: {type_name}'
+            raise ValueError(msg)
+        return sub_cls
+
     @classmethod
     def build(cls, *args: Any, **kwargs: Any) -> Self:
         """Build non-polymorphic instances of TypedObject by adding the proper `type` parameter."""
@@ -122,23 +122,36 @@ class BlocksEndpoint(Endpoint):
             The second party of the tuple is an empty list or the updated blocks after the specified block
             if `after` was specified. Use this to update the blocks with the latest version from the server.
             """
+            request = self._build_append_request(parent, blocks, after=after)
+            block_iter = EndpointIterator[Block](endpoint=self.raw_api.append, pagination=self.raw_api.list)
+            appended_blocks = list(block_iter(**request))
+            return self._update_appended(blocks, appended_blocks, after=after)
+
+        @staticmethod
+        def _build_append_request(
+            parent: ParentRef | GenericObject | UUID | str, blocks: builtins.list[Block], *, after: Block | None
+        ) -> dict[str, Any]:
+            """Build the request parameters for appending `blocks` to `parent`."""
             parent_id = ObjectRef.build(parent).id
             children = [block.serialize_for_api() for block in blocks if block is not None]
             _logger.debug(f'Appending {len(children)} blocks to parent with id `{parent_id}`.')
-
-            block_iter = EndpointIterator[Block](endpoint=self.raw_api.append, pagination=self.raw_api.list)
-            if after is None:
-                appended_blocks = list(block_iter(block_id=parent_id, children=children))
-                if len(appended_blocks) != len(blocks):
-                    msg = 'Number of appended blocks does not match the number of provided blocks.'
-                    raise ValueError(msg)
-            else:
+            request: dict[str, Any] = {'block_id': parent_id, 'children': children}
+            if after is not None:
                 if is_unset(after_id := after.id):
                     raise UnsetError()
                 # API 2026-03-11 replaced the `after` parameter with a typed `position` object:
                 # `{"type": "after_block", "after_block": {"id": <block-id>}}`.
-                position = {'type': 'after_block', 'after_block': {'id': str(after_id)}}
-                appended_blocks = list(block_iter(block_id=parent_id, children=children, position=position))
+                request['position'] = {'type': 'after_block', 'after_block': {'id': str(after_id)}}
+            return request
+
+        @staticmethod
+        def _update_appended(
+            blocks: builtins.list[Block], appended_blocks: builtins.list[Block], *, after: Block | None
+        ) -> tuple[builtins.list[Block], builtins.list[Block]]:
+            """Update the passed blocks with the appended blocks returned by the API."""
+            if after is None and len(appended_blocks) != len(blocks):
+                msg = 'Number of appended blocks does not match the number of provided blocks.'
+                raise ValueError(msg)
 
             # the first len(blocks) of appended_blocks correspond to the blocks we passed, the rest are updated
             # blocks after the specified block, where we append the blocks.
@@ -148,11 +161,14 @@ class BlocksEndpoint(Endpoint):
             return blocks, appended_blocks[len(blocks) :]
 
         # https://developers.notion.com/reference/get-block-children
-        def list(self, parent: ParentRef | GenericObject | UUID | str) -> Iterator[Block]:
-            """Return all Blocks contained by the specified parent."""
+        def list(self, parent: ParentRef | GenericObject | UUID | str, *, prefetch: int = 0) -> Iterator[Block]:
+            """Return all Blocks contained by the specified parent.
+
+            With `prefetch > 0`, up to this number of result pages are fetched ahead in the background.
+            """
             parent_id = ObjectRef.build(parent).id
             _logger.debug(f'Listing all blocks for parent with id `{parent_id}`.')
-            block_iter = EndpointIterator[Block](endpoint=self.raw_api.list)
+            block_iter = EndpointIterator[Block](endpoint=self.raw_api.list, prefetch=prefetch)
             return block_iter(block_id=parent_id)
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -194,6 +210,13 @@ class BlocksEndpoint(Endpoint):
 
         The block info will be updated to the latest version from the server.
         """
+        block_id, params = self._build_update_request(block)
+        data = self._as_dict(self.raw_api.update(block_id.hex, **params))
+        block.update(**data)
+
+    @staticmethod
+    def _build_update_request(block: Block) -> tuple[UUID, dict[str, Any]]:
+        """Return the block id and the request parameters to update the block on the server."""
         if is_unset(block_id := block.id):
             raise UnsetError()
         if not isinstance(block_id, UUID):
@@ -209,8 +232,7 @@ class BlocksEndpoint(Endpoint):
             dtype = params[block_type].pop('type')
             del params[block_type][dtype]
 
-        data = self._as_dict(self.raw_api.update(block_id.hex, **params))
-        block.update(**data)
+        return block_id, params
 
 
 class DataSourcesEndpoint(Endpoint):
@@ -511,6 +533,23 @@ class PagesEndpoint(Endpoint):
         icon: FileObject | EmojiObject | CustomEmojiObject | None = None,
     ) -> Page:
         """Add a page to the given parent (Page or DataSource)."""
+        request = self._build_create_request(
+            parent, title=title, properties=properties, children=children, cover=cover, icon=icon
+        )
+        data = self.raw_api.create(**request)
+        return Page.model_validate(data)
+
+    @staticmethod
+    def _build_create_request(
+        parent: ParentRef | Page | DataSource,
+        *,
+        title: Title | None = None,
+        properties: dict[str, PropertyValue] | None = None,
+        children: list[Block] | None = None,
+        cover: FileObject | None = None,
+        icon: FileObject | EmojiObject | CustomEmojiObject | None = None,
+    ) -> dict[str, Any]:
+        """Build the request payload to create a page below the given parent."""
         if parent is None:
             msg = "'parent' must be provided"
             raise ValueError(msg)
@@ -549,8 +588,7 @@ class PagesEndpoint(Endpoint):
             request['icon'] = icon.serialize_for_api()
 
         _logger.debug(f'Creating new page below page with id `{parent_id}`.')
-        data = self.raw_api.create(**request)
-        return Page.model_validate(data)
+        return request
 
     def delete(self, page: Page) -> None:
         """Delete (archive) the specified Page."""
@@ -586,45 +624,9 @@ class PagesEndpoint(Endpoint):
         is_locked: bool | UnsetType = Unset,
     ) -> None:
         """Update the Page object properties on the server."""
-        if is_unset(page_id := page.id):
-            raise UnsetError()
-        _logger.debug(f'Updating info on page with id `{page_id}`.')
-
-        request: dict[str, Any] = {}
-
-        if properties is not None:
-            request['properties'] = {
-                name: value.serialize_for_api() if value is not None else None for name, value in properties.items()
-            }
-
-        if not is_unset(cover):
-            if cover is None:
-                _logger.debug(f'Removing cover from page with id `{page_id}`.')
-                request['cover'] = None
-            else:
-                _logger.debug(f'Setting cover on page with id `{page_id}`.')
-                request['cover'] = cover.serialize_for_api()
-
-        if not is_unset(icon):
-            if icon is None:
-                _logger.debug(f'Removing icon from page with id `{page_id}`.')
-                request['icon'] = None
-            else:
-                _logger.debug(f'Setting icon on page with id `{page_id}`.')
-                request['icon'] = icon.serialize_for_api()
-
-        if in_trash is not Unset:
-            if in_trash:
-                _logger.debug(f'Deleting page with id `{page_id}`.')
-                request['in_trash'] = True
-            else:
-                _logger.debug(f'Restoring page with id `{page_id}`.')
-                request['in_trash'] = False
-
-        if not is_unset(is_locked):
-            _logger.debug(f'Setting `is_locked={is_locked}` on page with id `{page_id}`.')
-            request['is_locked'] = is_locked
-
+        page_id, request = self._build_update_request(
+            page, properties=properties, cover=cover, icon=icon, in_trash=in_trash, is_locked=is_locked
+        )
         data = self._as_dict(self.raw_api.update(page_id.hex, **request))
         page.update(**data)
 
@@ -644,38 +646,77 @@ class PagesEndpoint(Endpoint):
         To remove an attribute, set its value to None.
         """
         page_id = PageRef.build(page).page_id
-        props: dict[str, Any] = {}
+        props = self._build_attr_request(page_id, cover=cover, icon=icon, in_trash=in_trash, is_locked=is_locked)
+        data = self._as_dict(self.raw_api.update(page_id.hex, **props))
+        page.update(**data)
+
+    @classmethod
+    def _build_update_request(
+        cls,
+        page: Page,
+        *,
+        properties: dict[str, PropertyValue] | None = None,
+        cover: FileObject | UnsetType | None = Unset,
+        icon: FileObject | EmojiObject | CustomEmojiObject | UnsetType | None = Unset,
+        in_trash: bool | UnsetType = Unset,
+        is_locked: bool | UnsetType = Unset,
+    ) -> tuple[UUID, dict[str, Any]]:
+        """Return the page id and the request payload to update the page on the server."""
+        if is_unset(page_id := page.id):
+            raise UnsetError()
+        _logger.debug(f'Updating info on page with id `{page_id}`.')
+
+        request: dict[str, Any] = {}
+
+        if properties is not None:
+            request['properties'] = {
+                name: value.serialize_for_api() if value is not None else None for name, value in properties.items()
+            }
+
+        request |= cls._build_attr_request(page_id, cover=cover, icon=icon, in_trash=in_trash, is_locked=is_locked)
+        return page_id, request
+
+    @staticmethod
+    def _build_attr_request(
+        page_id: UUID,
+        *,
+        cover: FileObject | UnsetType | None = Unset,
+        icon: FileObject | EmojiObject | CustomEmojiObject | UnsetType | None = Unset,
+        in_trash: bool | UnsetType = Unset,
+        is_locked: bool | UnsetType = Unset,
+    ) -> dict[str, Any]:
+        """Build the request payload to set or remove the given page attributes."""
+        request: dict[str, Any] = {}
 
         if not is_unset(cover):
             if cover is None:
                 _logger.debug(f'Removing cover from page with id `{page_id}`.')
-                props['cover'] = None
+                request['cover'] = None
             else:
                 _logger.debug(f'Setting cover on page with id `{page_id}`.')
-                props['cover'] = cover.serialize_for_api()
+                request['cover'] = cover.serialize_for_api()
 
         if not is_unset(icon):
             if icon is None:
                 _logger.debug(f'Removing icon from page with id `{page_id}`.')
-                props['icon'] = None
+                request['icon'] = None
             else:
                 _logger.debug(f'Setting icon on page with id `{page_id}`.')
-                props['icon'] = icon.serialize_for_api()
+                request['icon'] = icon.serialize_for_api()
 
         if in_trash is not Unset:
             if in_trash:
                 _logger.debug(f'Deleting page with id `{page_id}`.')
-                props['in_trash'] = True
+                request['in_trash'] = True
             else:
                 _logger.debug(f'Restoring page with id `{page_id}`.')
-                props['in_trash'] = False
+                request['in_trash'] = False
 
         if not is_unset(is_locked):
             _logger.debug(f'Setting `is_locked={is_locked}` on page with id `{page_id}`.')
-            props['is_locked'] = is_locked
+            request['is_locked'] = is_locked
 
-        data = self._as_dict(self.raw_api.update(page_id.hex, **props))
-        page.update(**data)
+        return request
 
 
 class SearchEndpoint(Endpoint):
@@ -770,6 +811,19 @@ class UploadsEndpoint(Endpoint):
         content_type: str | None = None,
     ) -> FileUpload:
         """Create a file upload."""
+        kwargs = self._build_create_request(name, n_parts, mode, external_url, content_type)
+        data = self.raw_api.create(**kwargs)
+        return FileUpload.model_validate(data)
+
+    @staticmethod
+    def _build_create_request(
+        name: str | None,
+        n_parts: int | None,
+        mode: FileUploadMode,
+        external_url: str | None,
+        content_type: str | None,
+    ) -> dict[str, Any]:
+        """Build the request parameters to create a file upload."""
         _logger.debug(f'Creating a file upload with mode `{mode}`.')
         kwargs = {
             'filename': name,
@@ -778,19 +832,23 @@ class UploadsEndpoint(Endpoint):
             'external_url': external_url,
             'content_type': content_type,
         }
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}  # Notion API doesn't like nulls
-        data = self.raw_api.create(**kwargs)
-        return FileUpload.model_validate(data)
+        return {k: v for k, v in kwargs.items() if v is not None}  # Notion API doesn't like nulls
 
     # https://developers.notion.com/reference/send-a-file-upload
     def send(self, file_upload: FileUpload, file: BinaryIO, part: int | None = None) -> None:
         """Send a file upload and update the file_upload object."""
+        kwargs = self._build_send_request(file_upload, file, part)
+        data = self._as_dict(self.raw_api.send(**kwargs))
+        file_upload.update(**data)
+
+    @staticmethod
+    def _build_send_request(file_upload: FileUpload, file: BinaryIO, part: int | None) -> dict[str, Any]:
+        """Build the request parameters to send (a part of) a file upload."""
         _logger.debug(f'Sending file upload with id `{file_upload.id}`.')
         file_param = (file_upload.filename, file, file_upload.content_type)  # see issue #127 for reasons
         # Notion API doesn't like nulls, so we eliminate them
         kwargs = {k: v for k, v in (('file', file_param), ('part_number', part)) if v is not None}
-        data = self._as_dict(self.raw_api.send(file_upload_id=str(file_upload.id), **kwargs))
-        file_upload.update(**data)
+        return {'file_upload_id': str(file_upload.id)} | kwargs
 
     # https://developers.notion.com/reference/complete-a-file-upload
     def complete(self, file_upload: FileUpload) -> None:
@@ -810,6 +868,11 @@ class UploadsEndpoint(Endpoint):
     def list(self, status: FileUploadStatus | None = None, page_size: int = 100) -> Iterator[FileUpload]:
         """Return all file uploads."""
         file_upload_iter = EndpointIterator[FileUpload](endpoint=self.raw_api.list)
+        return file_upload_iter(**self._build_list_request(status, page_size))
+
+    @staticmethod
+    def _build_list_request(status: FileUploadStatus | None, page_size: int) -> dict[str, Any]:
+        """Build the request parameters to list file uploads."""
         kwargs: dict[str, Any] = {'page_size': page_size}
         if status is not None:
             kwargs['status'] = status.value
@@ -817,4 +880,4 @@ class UploadsEndpoint(Endpoint):
         else:
             suffix = '.'
         _logger.debug(f'Listing all file uploads{suffix}')
-        return file_upload_iter(**kwargs)
+        return kwargs
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable, Iterator
+import queue
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Annotated, Any, Generic, TypeVar, cast
 
 from pydantic import ConfigDict, Field, ValidationError
@@ -16,10 +18,19 @@ from ultimate_notion.obj_api.objects import Comment, FileUpload, User
 from ultimate_notion.obj_api.props import PropertyItem
 
 MAX_PAGE_SIZE = 100
+PREFETCH_PAGES = 2
+"""Number of result pages read ahead by endpoints whose results are consumed completely anyway"""
 
 _logger = logging.getLogger(__name__)
 
 
+OBJECT_MODELS: dict[str | None, type[NotionObject]] = {
+    model.model_fields['object'].default: model
+    for model in (Block, Page, Database, DataSource, PropertyItem, User, Comment, FileUpload)
+}
+"""Mapping from the `object` field of the Notion API results to the corresponding model class"""
+
+
 def convert_to_notion_obj(
     data: dict[str, Any],
 ) -> Block | Page | Database | DataSource | PropertyItem | User | GenericObject | FileUpload:
@@ -27,27 +38,32 @@ def convert_to_notion_obj(
 
     Used in the ObjectList below to convert the results from the Notion API.
     """
-    obj_field = 'object'
-
-    if obj_field not in data:
+    if 'object' not in data:
         msg = 'Unknown object in results'
         raise ValueError(msg)
 
-    models: tuple[type[NotionObject], ...] = (
-        Block,
-        Page,
-        Database,
-        DataSource,
-        PropertyItem,
-        User,
-        Comment,
-        FileUpload,
-    )
-    model_mapping = {model.model_fields[obj_field].default: model for model in models}
-    model_class = model_mapping.get(data[obj_field], GenericObject)
+    model_class = OBJECT_MODELS.get(data['object'], GenericObject)
     return model_class.model_validate(data)
 
 
+def construct_object_list(data: dict[str, Any]) -> ObjectList:
+    """Construct an `ObjectList` from a trusted response of the Notion API without validating it.
+
+    Can be used as `model_validate` of the endpoint iterators to speed up parsing large results considerably.
+    """
+    results: list[NotionObject] = []
+    for item in data.get('results', []):
+        if 'object' not in item:
+            msg = 'Unknown object in results'
+            raise ValueError(msg)
+        model_class = OBJECT_MODELS.get(item['object'], GenericObject)
+        results.append(cast(NotionObject, model_class.construct_trusted(item)))
+
+    obj_list = ObjectList.construct_trusted(data | {'results': []})
+    obj_list.results = results
+    return obj_list
+
+
 class ObjectList(NotionObject, TypedObject, object='list', polymorphic_base=True):
     """A paginated list of objects returned by the Notion API.
 
@@ -130,13 +146,8 @@ class FileUploadList(ObjectList, type='file_upload'):
 T = TypeVar('T', bound=NotionObject)
 
 
-class EndpointIterator(Generic[T]):
-    """Functor to iterate over results from a potentially paginated API response.
-
-    In most cases `notion_obj` should be `ObjectList`. For some endpoints, like `PropertiesEndpoint`, and
-    endpoint returns a list of property items or s single property item. In this case, `model_validate` should be
-    `TypeAdapter(PropertyItemList | PropertyItem).validate_python` or whatever you expect to be returned.
-    """
+class _BaseEndpointIterator(Generic[T]):
+    """Pagination state and result processing shared by the sync and async endpoint iterators."""
 
     has_more: bool | None = None
     page_num: int = -1
@@ -155,9 +166,8 @@ class EndpointIterator(Generic[T]):
         self._pagination = pagination
         self._model_validate = model_validate
 
-    def __call__(self, **kwargs: Any) -> Iterator[T]:
-        """Return a generator for this endpoint using the given parameters."""
-
+    def _start(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Reset the pagination state and return the parameters for the endpoint."""
         self.has_more = True
         self.page_num = 0
         self.total_items = 0
@@ -166,38 +176,164 @@ class EndpointIterator(Generic[T]):
             kwargs['page_size'] = MAX_PAGE_SIZE
 
         self.next_cursor = kwargs.pop('start_cursor', None)
+        return kwargs
+
+    def _next_page(self) -> None:
+        self.page_num += 1
+
+        if self.next_cursor is None:
+            msg = f'Fetching last page {self.page_num} of endpoint.'
+        else:
+            msg = f'Fetching page {self.page_num} of endpoint with next cursor {self.next_cursor}.'
+        _logger.debug(msg)
+
+    def _validate(self, result_page: Any) -> NotionObject:
+        """Validate a raw result page of the endpoint."""
+        try:
+            return self._model_validate(result_page)
+        except ValidationError as e:
+            if get_cfg().ultimate_notion.debug:
+                _logger.exception('Validation error when parsing endpoint result:\n %s', e.errors())
+            raise
+
+    @staticmethod
+    def _cursor_after(obj_or_list: NotionObject) -> str | None:
+        """Return the cursor of the result page following the given one or `None` if it is the last one."""
+        if isinstance(obj_or_list, ObjectList) and obj_or_list.has_more:
+            return obj_or_list.next_cursor
+        return None
+
+    def _advance(self, obj_or_list: NotionObject) -> None:
+        """Advance the pagination state after the given result page."""
+        self.next_cursor = self._cursor_after(obj_or_list)
+        self.has_more = self.next_cursor is not None
+        if self.has_more and self._pagination is not None:
+            # Some endpoints like `blocks.children.append` use a different endpoint for pagination.
+            # If not used, the action, e.g. appending blocks, will be repeated.
+            # You gotta love the Notion API...
+            self._endpoint = self._pagination
+
+    def _items(self, obj_or_list: NotionObject) -> Iterator[T]:
+        """Yield the objects of a validated result page."""
+        if isinstance(obj_or_list, ObjectList):
+            for obj in obj_or_list.results:
+                self.total_items += 1
+                yield cast(T, obj)
+        else:
+            self.total_items += 1
+            yield cast(T, obj_or_list)
+
+    def _process_page(self, result_page: Any) -> Iterator[T]:
+        """Validate a raw result page, yield its objects and advance the pagination state."""
+        obj_or_list = self._validate(result_page)
+        yield from self._items(obj_or_list)
+        self._advance(obj_or_list)
+        _logger.debug(f'Fetched {self.total_items} item(s) in total over {self.page_num} page(s).')
+
+
+class EndpointIterator(_BaseEndpointIterator[T]):
+    """Functor to iterate over results from a potentially paginated API response.
 
-        while self.has_more:
-            self.page_num += 1
+    In most cases `notion_obj` should be `ObjectList`. For some endpoints, like `PropertiesEndpoint`, and
+    endpoint returns a list of property items or s single property item. In this case, `model_validate` should be
+    `TypeAdapter(PropertyItemList | PropertyItem).validate_python` or whatever you expect to be returned.
 
-            if self.next_cursor is None:
-                msg = f'Fetching last page {self.page_num} of endpoint.'
-            else:
-                msg = f'Fetching page {self.page_num} of endpoint with next cursor {self.next_cursor}.'
-            _logger.debug(msg)
+    With `prefetch > 0`, the result pages are fetched and validated in a background thread while the
+    consumer processes the previous pages. At most `prefetch` validated pages are buffered, so network
+    latency and parsing overlap. Only use it if the results are consumed completely, as the next page is
+    requested before the consumer asks for it.
+    """
 
+    def __init__(
+        self,
+        endpoint: Callable[..., Any | Awaitable[Any]],
+        *,
+        pagination: Callable[..., Any | Awaitable[Any]] | None = None,
+        model_validate: Callable[[Any], NotionObject] = ObjectList.model_validate,
+        prefetch: int = 0,
+    ):
+        super().__init__(endpoint, pagination=pagination, model_validate=model_validate)
+        self._prefetch = prefetch
+
+    def __call__(self, **kwargs: Any) -> Iterator[T]:
+        """Return a generator for this endpoint using the given parameters."""
+        kwargs = self._start(kwargs)
+        if self._prefetch > 0:
+            yield from self._read_ahead(kwargs)
+            return
+
+        while self.has_more:
+            self._next_page()
             result_page = self._endpoint(start_cursor=self.next_cursor, **kwargs)
+            yield from self._process_page(result_page)
+
+    def _read_ahead(self, kwargs: dict[str, Any]) -> Iterator[T]:
+        """Yield the objects of the result pages, fetching all pages after the first one in a background thread.
+
+        The thread is only started if there is more than one result page. It follows the cursors on its own
+        and only hands the validated pages over through a queue, so that the pagination state of the iterator
+        is solely updated in the consuming thread.
+        """
+        self._next_page()
+        first_page = self._validate(self._endpoint(start_cursor=self.next_cursor, **kwargs))
+        self._advance(first_page)
+        if not self.has_more:
+            yield from self._items(first_page)
+            return
+
+        pages: queue.Queue[NotionObject | BaseException | None] = queue.Queue(maxsize=self._prefetch)
+        stop = threading.Event()
+
+        def put(item: NotionObject | BaseException | None) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                else:
+                    return
+
+        def fetch_pages(endpoint: Callable[..., Any], next_cursor: str | None) -> None:
             try:
-                obj_or_list = self._model_validate(result_page)
-            except ValidationError as e:
-                if get_cfg().ultimate_notion.debug:
-                    _logger.exception('Validation error when parsing endpoint result:\n %s', e.errors())
-                raise
-
-            if isinstance(obj_or_list, ObjectList):
-                for obj in obj_or_list.results:
-                    self.total_items += 1
-                    yield cast(T, obj)
-
-                self.next_cursor = obj_or_list.next_cursor
-                self.has_more = obj_or_list.has_more and self.next_cursor is not None
-                if self.has_more and self._pagination is not None:
-                    # Some endpoints like `blocks.children.append` use a different endpoint for pagination.
-                    # If not used, the action, e.g. appending blocks, will be repeated.
-                    # You gotta love the Notion API...
-                    self._endpoint = self._pagination
-            else:
-                yield cast(T, obj_or_list)
-                self.has_more = False
-
-            _logger.debug(f'Fetched {self.total_items} item(s) in total over {self.page_num} page(s).')
+                while next_cursor is not None and not stop.is_set():
+                    obj_or_list = self._validate(endpoint(start_cursor=next_cursor, **kwargs))
+                    next_cursor = self._cursor_after(obj_or_list)
+                    put(obj_or_list)
+            except Exception as e:  # re-raised in the consuming thread
+                put(e)
+            put(None)  # signals the end of the results
+
+        fetcher = threading.Thread(
+            target=fetch_pages, args=(self._endpoint, self.next_cursor), name='EndpointIterator-prefetch', daemon=True
+        )
+        fetcher.start()
+        try:
+            yield from self._items(first_page)
+            while (item := pages.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                self._next_page()
+                yield from self._items(item)
+                self._advance(item)
+                _logger.debug(f'Fetched {self.total_items} item(s) in total over {self.page_num} page(s).')
+        finally:
+            stop.set()
+
+
+class AsyncEndpointIterator(_BaseEndpointIterator[T]):
+    """Functor to asynchronously iterate over results from a potentially paginated API response.
+
+    Same as `EndpointIterator` but for the coroutine functions of `notion_client.AsyncClient`, e.g.:
+
+        async for block in AsyncEndpointIterator[Block](client.blocks.children.list)(block_id=block_id):
+            ...
+    """
+
+    async def __call__(self, **kwargs: Any) -> AsyncIterator[T]:
+        """Return an async generator for this endpoint using the given parameters."""
+        kwargs = self._start(kwargs)
+        while self.has_more:
+            self._next_page()
+            result_page = await cast(Awaitable[Any], self._endpoint(start_cursor=self.next_cursor, **kwargs))
+            for obj in self._process_page(result_page):
+                yield obj
@@ -38,6 +38,7 @@ from ultimate_notion.obj_api.core import (
     UnsetType,
     UserRef,
     _normalize_color,
+    _value_eq_data,
     is_unset,
 )
 from ultimate_notion.obj_api.enums import BGColor, Color, FileUploadStatus
@@ -72,6 +73,10 @@ class SelectOption(GenericObject):
         my_color, other_color = _normalize_color(self.color), _normalize_color(other.color)
         return self.name == other.name and my_color == other_color and self.description == other.description
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        description, exact = _value_eq_data(self.description)
+        return {'name': self.name, 'color': _normalize_color(self.color), 'description': description}, exact
+
 
 class SelectGroup(GenericObject):
     """Group of options for status objects."""
@@ -88,6 +93,9 @@ class SelectGroup(GenericObject):
         my_color, other_color = _normalize_color(self.color), _normalize_color(other.color)
         return self.name == other.name and my_color == other_color
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        return {'name': self.name, 'color': _normalize_color(self.color)}, True
+
 
 class MentionMixin(ABC):
     """Mixin for objects that can be mentioned in Notion.
@@ -261,6 +269,10 @@ class User(TypedObject[GO_co], UserRef, MentionMixin, polymorphic_base=True):
             return self.id == other.id
         return super().__eq__(other)
 
+    def _eq_data(self) -> tuple[Any, bool]:  # noqa: PLR6301
+        # same as for `UserRef` but two users with equal references might still differ
+        return '<user>', False
+
     def build_mention(self, style: Annotations | None = None) -> MentionObject:
         return MentionUser.build_mention_from(self, style=style)
 
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
-from collections.abc import Awaitable, Callable, Iterator, Mapping
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
 from datetime import date, datetime
-from typing import Any, Generic, Literal, TypeAlias
+from typing import Any, ClassVar, Generic, Literal, TypeAlias, cast
 from uuid import UUID
 
 from pydantic import ConfigDict, Field, SerializeAsAny, field_validator
@@ -15,7 +15,13 @@ from typing_extensions import TypeVar
 from ultimate_notion.obj_api.blocks import DataSource, Page
 from ultimate_notion.obj_api.core import GenericObject
 from ultimate_notion.obj_api.enums import SortDirection, TimestampKind
-from ultimate_notion.obj_api.iterator import MAX_PAGE_SIZE, EndpointIterator
+from ultimate_notion.obj_api.iterator import (
+    MAX_PAGE_SIZE,
+    AsyncEndpointIterator,
+    EndpointIterator,
+    ObjectList,
+    construct_object_list,
+)
 
 NCEndpointCall: TypeAlias = Callable[..., Any | Awaitable[Any]]  # ToDo: `type` instead of `TypeAlias` in Python 3.12
 
@@ -276,17 +282,56 @@ class QueryBuilder(Generic[T], ABC):
     query: Query
     endpoint: NCEndpointCall
     params: dict[str, str]
+    count_params: ClassVar[dict[str, Any]] = {}
+    """Additional parameters of the requests of `count` and `exists` to keep their responses small"""
 
     def __init__(self, endpoint: NCEndpointCall, query: Query, params: Mapping[str, str | None]):
         self.endpoint = endpoint
         self.query = query
         self.params = {k: v for k, v in params.items() if v is not None}  # API doesn't like "undefined" values
 
-    def execute(self, **nc_params: int | str) -> Iterator[T]:
-        """Execute the current query and return an iterator for the results."""
+    def _build_query(self, nc_params: Mapping[str, Any]) -> dict[str, Any]:
         query = self.query.serialize_for_api()
-        query |= self.params | nc_params
-        return EndpointIterator[T](self.endpoint)(**query)
+        query |= {**self.params, **nc_params}
+        return query
+
+    def execute(self, *, prefetch: int = 0, validate: bool = True, **nc_params: int | str) -> Iterator[T]:
+        """Execute the current query and return an iterator for the results.
+
+        With `prefetch > 0`, up to this number of result pages are fetched ahead in the background.
+        With `validate=False`, the results are constructed from the trusted API response without a
+        full pydantic validation, which is considerably faster for large results.
+        """
+        model_validate = ObjectList.model_validate if validate else construct_object_list
+        endpoint_iter = EndpointIterator[T](self.endpoint, model_validate=model_validate, prefetch=prefetch)
+        return endpoint_iter(**self._build_query(nc_params))
+
+    def count(self, **nc_params: int | str) -> int:
+        """Count the results of the current query by walking through the cursors of the raw responses.
+
+        The results are neither validated nor wrapped, so at most one page of raw results is held in memory.
+        """
+        query = self._build_query({**self.count_params, **nc_params})
+        n_results, next_cursor = 0, query.pop('start_cursor', None)
+        while True:
+            result_page = cast(dict[str, Any], self.endpoint(start_cursor=next_cursor, **query))
+            n_results += len(result_page['results'])
+            next_cursor = result_page.get('next_cursor')
+            if not result_page.get('has_more') or next_cursor is None:
+                return n_results
+
+    def exists(self, **nc_params: int | str) -> bool:
+        """Return whether the current query has at least one result by requesting only a single result."""
+        query = self._build_query({**self.count_params, **nc_params, 'page_size': 1})
+        result_page = cast(dict[str, Any], self.endpoint(**query))
+        return len(result_page['results']) > 0
+
+    def aexecute(self, **nc_params: int | str) -> AsyncIterator[T]:
+        """Execute the current query and return an async iterator for the results.
+
+        Requires the builder to be created with an endpoint of `notion_client.AsyncClient`.
+        """
+        return AsyncEndpointIterator[T](self.endpoint)(**self._build_query(nc_params))
 
 
 class SearchQueryBuilder(QueryBuilder[T]):
@@ -302,7 +347,7 @@ class SearchQueryBuilder(QueryBuilder[T]):
     def __init__(self, endpoint: NCEndpointCall, text: str | None = None):
         super().__init__(endpoint=endpoint, query=SearchQuery(), params={'query': text})
 
-    def execute(self, **nc_params: int | str) -> Iterator[T]:
+    def execute(self, *, prefetch: int = 0, validate: bool = True, **nc_params: int | str) -> Iterator[T]:
         match self.filter:
             case SearchFilter(property='object', value='page'):
                 _logger.debug(f'Searching for pages with title: {self.params["query"]}')
@@ -310,7 +355,7 @@ class SearchQueryBuilder(QueryBuilder[T]):
                 _logger.debug(f'Searching for data sources with title: {self.params["query"]}')
             case None:
                 _logger.debug(f'Searching for pages and data sources with title: {self.params["query"]}')
-        return super().execute(**nc_params)
+        return super().execute(prefetch=prefetch, validate=validate, **nc_params)
 
     def filter(self, *, page_only: bool = False, datasource_only: bool = False) -> SearchQueryBuilder[T]:
         """Filter for pages or data sources only."""
@@ -342,13 +387,14 @@ class DataSourceQueryBuilder(QueryBuilder[Page]):
     """
 
     query: DataSourceQuery
+    count_params: ClassVar[dict[str, Any]] = {'filter_properties': ['title']}  # only the title of each page
 
     def __init__(self, endpoint: NCEndpointCall, data_source_id: str):
         super().__init__(endpoint=endpoint, query=DataSourceQuery(), params={'data_source_id': data_source_id})
 
-    def execute(self, **nc_params: int | str) -> Iterator[Page]:
+    def execute(self, *, prefetch: int = 0, validate: bool = True, **nc_params: int | str) -> Iterator[Page]:
         _logger.debug(f'Searching for pages in data source with id: {self.params["data_source_id"]}')
-        return super().execute(**nc_params)
+        return super().execute(prefetch=prefetch, validate=validate, **nc_params)
 
     def filter(self, condition: QueryFilter) -> DataSourceQueryBuilder:
         """Add the given filter to the query."""
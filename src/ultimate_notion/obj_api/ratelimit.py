@@ -0,0 +1,212 @@
+"""Client-side rate limiting and retrying of requests to the Notion API.
+
+Notion allows an average of about three requests per second per integration and answers
+with `429 rate_limited` (and a `Retry-After` header) if this is exceeded. The transports
+in this module wrap the httpx transports used by the Notion client to
+
+* throttle all requests of a client with a shared token bucket, so that bursts are allowed
+  but the average rate stays within the limit, and to
+* retry rate-limited requests and transient server errors with a jittered exponential
+  backoff that honours the `Retry-After` header of the response.
+
+Requests rejected with 429 were not processed by Notion and are thus always retried.
+Server errors like 502/503 are only retried for idempotent requests, i.e. `GET`/`DELETE`
+and the read-only `POST` endpoints for querying data sources and searching, as the
+request might have been processed already.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_SECOND = 3.0
+"""Average number of requests per second allowed by Notion"""
+DEFAULT_BURST = 10
+"""Default number of requests that can be sent at once before throttling starts"""
+
+_IDEMPOTENT_POST_PATHS = re.compile(r'/v1/(search|data_sources/[^/]+/query)/?$')
+"""Notion endpoints using `POST` that only read data and thus can be retried safely"""
+_STREAMED_FILE_PATHS = re.compile(r'/v1/file_uploads/[^/]+/send/?$')
+"""Notion endpoints streaming a file, which needs to be rewound by the caller before sending it again"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket that limits the average rate of requests while allowing bursts.
+
+    Each request takes a token, which are refilled at `rate` tokens per second up to `burst` tokens.
+    If no token is available, the caller has to wait until the next token is due. Tokens are
+    reserved under a lock, so the bucket can be shared by sync and async code of several threads.
+    """
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = DEFAULT_BURST):
+        if rate <= 0:
+            msg = f'Rate must be positive, got {rate}.'
+            raise ValueError(msg)
+        if burst < 1:
+            msg = f'Burst must be at least 1, got {burst}.'
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the time in seconds to wait until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            # a negative balance means the token is borrowed from the future
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        if (delay := self.reserve()) > 0:
+            _logger.debug(f'Rate limit reached, waiting {delay:.2f}s.')
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait asynchronously until a token is available."""
+        if (delay := self.reserve()) > 0:
+            _logger.debug(f'Rate limit reached, waiting {delay:.2f}s.')
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class RetryPolicy:
+    """Policy on which responses to retry and how long to wait in between."""
+
+    max_retries: int = 5
+    """Maximum number of retries of a single request, 0 disables retrying"""
+    backoff_base: float = 1.0
+    """Initial backoff in seconds, doubled for each retry"""
+    backoff_max: float = 60.0
+    """Maximum time in seconds to wait before a retry"""
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({500, 502, 503, 504}))
+    """Status codes of transient server errors that are retried for idempotent requests"""
+    retry_non_idempotent: bool = False
+    """Also retry non-idempotent requests on server errors, which might duplicate writes"""
+
+    @staticmethod
+    def is_idempotent(request: httpx.Request) -> bool:
+        """Return whether the request can be repeated without side effects."""
+        if request.method in {'GET', 'HEAD', 'OPTIONS', 'DELETE'}:
+            return True
+        return request.method == 'POST' and _IDEMPOTENT_POST_PATHS.search(request.url.path) is not None
+
+    def should_retry(self, request: httpx.Request, response: httpx.Response, attempt: int) -> bool:
+        """Return whether the request should be retried after receiving the response."""
+        if attempt >= self.max_retries or _STREAMED_FILE_PATHS.search(request.url.path) is not None:
+            return False
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            return True  # Notion did not process the request, so it is safe to repeat it
+        if response.status_code in self.retry_statuses:
+            return self.retry_non_idempotent or self.is_idempotent(request)
+        return False
+
+    def delay(self, response: httpx.Response, attempt: int) -> float:
+        """Return the seconds to wait before the next retry, honouring the `Retry-After` header."""
+        backoff = min(self.backoff_max, self.backoff_base * 2**attempt)
+        if (retry_after := parse_retry_after(response.headers.get('Retry-After'))) is not None:
+            # add a bit of jitter so that concurrent clients do not retry at the very same time
+            return min(self.backoff_max, retry_after) + random.uniform(0, self.backoff_base)  # noqa: S311
+        return random.uniform(backoff / 2, backoff)  # noqa: S311
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a `Retry-After` header, i.e. delta-seconds or an HTTP-date, into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_date - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Transport throttling all requests with a token bucket and retrying them according to a retry policy."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = None,
+    ):
+        self._transport = transport
+        self.limiter = limiter
+        self.retry = RetryPolicy(max_retries=0) if retry is None else retry
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            response = self._transport.handle_request(request)
+            if not self.retry.should_retry(request, response, attempt):
+                return response
+            delay = self.retry.delay(response, attempt)
+            response.close()
+            attempt += 1
+            _logger.info(
+                f'Request {request.method} {request.url} failed with status {response.status_code}, '
+                f'retry {attempt}/{self.retry.max_retries} in {delay:.2f}s.'
+            )
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async variant of `RateLimitedTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = None,
+    ):
+        self._transport = transport
+        self.limiter = limiter
+        self.retry = RetryPolicy(max_retries=0) if retry is None else retry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                await self.limiter.aacquire()
+            response = await self._transport.handle_async_request(request)
+            if not self.retry.should_retry(request, response, attempt):
+                return response
+            delay = self.retry.delay(response, attempt)
+            await response.aclose()
+            attempt += 1
+            _logger.info(
+                f'Request {request.method} {request.url} failed with status {response.status_code}, '
+                f'retry {attempt}/{self.retry.max_retries} in {delay:.2f}s.'
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -16,12 +16,13 @@ when constructing the property objects. For this reason `name` is `Unset` by def
 
 from __future__ import annotations
 
+from typing import Any
 from uuid import UUID
 
 from pydantic import Field, field_validator
 from typing_extensions import TypeVar
 
-from ultimate_notion.obj_api.core import GenericObject, TypedObject, Unset, UnsetType
+from ultimate_notion.obj_api.core import GenericObject, TypedObject, Unset, UnsetType, _value_eq_data
 from ultimate_notion.obj_api.enums import AggFunc, NumberFormat
 from ultimate_notion.obj_api.objects import SelectGroup, SelectOption
 
@@ -221,6 +222,9 @@ class FormulaTypeData(GenericObject):
         # ToDo: Implement a way to compare these expressions, which is possible in principle.
         return isinstance(other, FormulaTypeData)
 
+    def _eq_data(self) -> tuple[Any, bool]:  # noqa: PLR6301
+        return '<formula>', True
+
 
 class Formula(Property[FormulaTypeData], type='formula'):
     """Defines the formula configuration for a data source property."""
@@ -247,6 +251,9 @@ class PropertyRelation(TypedObject[GO_co], polymorphic_base=True):
             return NotImplemented
         return self.data_source_id == other.data_source_id
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        return {'data_source_id': str(self.data_source_id)}, True
+
 
 class SinglePropertyRelationTypeData(GenericObject):
     """Type data for `SinglePropertyRelation`."""
@@ -280,6 +287,9 @@ class DualPropertyRelationTypeData(GenericObject):
         # we skip the id as this is set by the Notion API.
         return self.synced_property_name == other.synced_property_name
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        return _value_eq_data(self.synced_property_name)
+
 
 class DualPropertyRelation(PropertyRelation[DualPropertyRelationTypeData], type='dual_property'):
     """Defines a two-way relation configuration for a data source property.
@@ -336,6 +346,14 @@ class RollupTypeData(GenericObject):
             and self.rollup_property_name == other.rollup_property_name
         )
 
+    def _eq_data(self) -> tuple[Any, bool]:
+        data = {
+            'function': self.function,
+            'relation_property_name': self.relation_property_name,
+            'rollup_property_name': self.rollup_property_name,
+        }
+        return _value_eq_data(data)
+
 
 class Rollup(Property[RollupTypeData], type='rollup'):
     """Defines the rollup configuration for a data source property."""
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import io
 from collections.abc import Iterator, Mapping
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from typing_extensions import Self, TypeIs
 
@@ -299,28 +300,64 @@ class Page(
         """
         return self._get_property(prop_name).value
 
-    def to_markdown(self) -> str:
+    def to_markdown(self, *, nested: bool = False) -> str:
         """Return the content of the page as Markdown.
 
         !!! note
 
-            This will not include nested blocks, i.e. the children of top-level blocks.
+            Nested blocks, i.e. the children of top-level blocks, are only included if `nested` is `True`.
+            In this case, the whole block tree is retrieved upfront, see `export_markdown`.
         """
+        if nested:
+            buffer = io.StringIO()
+            self.export_markdown(buffer)
+            return buffer.getvalue()
         md = f'# {self.title}\n\n'
         md += '\n'.join(block._to_markdown() for block in self.children)
         return md
 
+    def export_markdown(self, file: TextIO, *, concurrency: int | None = None) -> None:
+        """Write the content of the page including all nested blocks as Markdown to a file-like object.
+
+        The whole block tree is retrieved concurrently upfront and then written block by block, which makes
+        this method suitable for exporting many and large pages. Only the Markdown is streamed, the retrieved
+        blocks are still kept in memory.
+
+        Args:
+            file: text file-like object to write to, e.g. an opened file or `io.StringIO`
+            concurrency: maximum number of concurrent requests, defaults to the `concurrency` setting
+        """
+        self.fetch_tree(concurrency=concurrency)
+        file.write(f'# {self.title}\n\n')
+        self._write_nested_markdown(file)
+
     def _to_markdown(self) -> str:
         """Return the reference to this page as Markdown."""
         return f'[📄 **<u>{self.title}</u>**]({self.url})\n'
 
-    def to_html(self, *, raw: bool = False) -> str:
-        """Return the content of the page as HTML."""
-        html = render_md(self.to_markdown())
+    def to_html(self, *, raw: bool = False, nested: bool = False) -> str:
+        """Return the content of the page as HTML.
+
+        Nested blocks are only included if `nested` is `True`, see [to_markdown][ultimate_notion.page.Page.to_markdown].
+        """
+        html = render_md(self.to_markdown(nested=nested))
         if not raw:
             html = page_html(html, title=self.title or 'Untitled Page')
         return html
 
+    def export_html(self, file: TextIO, *, raw: bool = False, concurrency: int | None = None) -> None:
+        """Write the content of the page including all nested blocks as HTML to a file-like object.
+
+        See [export_markdown][ultimate_notion.page.Page.export_markdown] for details. In contrast to it,
+        the whole Markdown is buffered in memory before rendering, as the renderer needs the complete document.
+        """
+        buffer = io.StringIO()
+        self.export_markdown(buffer, concurrency=concurrency)
+        html = render_md(buffer.getvalue())
+        if not raw:
+            html = page_html(html, title=self.title or 'Untitled Page')
+        file.write(html)
+
     def show(self, *, simple: bool | None = None) -> None:
         """Show the content of the page, rendered in JupyterLab"""
         simple = simple if simple is not None else not is_notebook()
@@ -352,13 +389,17 @@ class Page(
             session = get_active_session()
             session.api.pages.restore(self.obj_ref)
             if isinstance(self.parent, ChildrenMixin):
-                self.parent._children = None  # forces a new retrieval of the parent's children next time
+                self.parent._reset_children()
         return self
 
     def reload(self) -> Self:
         """Reload this page."""
         session = get_active_session()
-        self.obj_ref = session.api.pages.retrieve(self.id)
+        return self._refresh(session.api.pages.retrieve(self.id))
+
+    def _refresh(self, obj_ref: obj_blocks.Page) -> Self:
+        """Replace the low-level page object with a more recent version of it."""
+        self.obj_ref = obj_ref
         self._children = None  # forces a new retrieval of children next time
         self._comments = None  # forces a new retrieval of comments next time
         return self
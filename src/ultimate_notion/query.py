@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import operator
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ClassVar
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
+import numpy as np
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
@@ -15,12 +18,15 @@ from ultimate_notion.core import get_active_session
 from ultimate_notion.errors import EmptyDataSourceError, FilterQueryError
 from ultimate_notion.obj_api import query as obj_query
 from ultimate_notion.obj_api.enums import ArrayQuantifier, FormulaType, RollupType, SortDirection
+from ultimate_notion.obj_api.iterator import PREFETCH_PAGES
 from ultimate_notion.option import Option
 from ultimate_notion.page import Page
 from ultimate_notion.user import User
 from ultimate_notion.view import View
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ultimate_notion.database import DataSource
     from ultimate_notion.schema import Property
 
@@ -186,6 +192,11 @@ class Condition(BaseModel, ABC):
     @abstractmethod
     def create_obj_ref(self, ds: DataSource) -> obj_query.QueryFilter: ...
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        """Evaluate the condition locally on the pages of a view and return the mask of matching pages."""
+        msg = f'Condition {self} cannot be evaluated locally, use a query instead.'
+        raise FilterQueryError(msg)
+
 
 class PropertyCondition(Condition, ABC):
     prop: PageProperty
@@ -242,6 +253,20 @@ class PropertyCondition(Condition, ABC):
             msg = f'The property {self.prop.name} is not a rollup property or is missing a type.'
             raise FilterQueryError(msg)
 
+    def _col_array(self, view: View) -> NDArray[Any]:
+        """Return the column array of the property of this condition in the view."""
+        if isinstance(self.prop, RollupArrayProperty):
+            msg = f'Condition {self} on a rollup array cannot be evaluated locally, use a query instead.'
+            raise FilterQueryError(msg)
+        return view._col_array(self.prop.name)
+
+    def _str_col_array(self, view: View) -> NDArray[np.str_]:
+        """Return the column array of the property of this condition in the view, which must hold texts."""
+        if (arr := self._col_array(view)).dtype.kind != 'U':
+            msg = f'Condition {self} can only be evaluated locally on text properties.'
+            raise FilterQueryError(msg)
+        return arr
+
     @property
     def _value_str(self) -> str:
         match self.value:
@@ -339,6 +364,10 @@ class IsEmpty(PropertyCondition):
 
         return obj_query.PropertyFilter.model_validate({'property': self.prop.name, **kwargs})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        self._col_array(view)
+        return view._null_mask(self.prop.name)
+
     def __repr__(self) -> str:
         return f'{self.prop}.{self._condition_kw}()'
 
@@ -347,6 +376,9 @@ class IsNotEmpty(IsEmpty):
     _condition_kw = 'is_not_empty'
     is_method: bool = True
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return ~super()._eval_mask(view)
+
 
 class Equals(PropertyCondition):
     _condition_kw = 'equals'
@@ -429,6 +461,10 @@ class Equals(PropertyCondition):
 
         return obj_query.PropertyFilter.model_validate({'property': self.prop.name, **kwargs})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        arr = self._col_array(view)
+        return np.asarray(arr == view._col_value(self.prop.name, self.value), dtype=np.bool_)
+
     def __repr__(self) -> str:
         return f'{self.prop} == {self._value_str}'
 
@@ -436,6 +472,9 @@ class Equals(PropertyCondition):
 class EqualsNot(Equals):
     _condition_kw = 'does_not_equal'
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return ~super()._eval_mask(view)
+
     def __repr__(self) -> str:
         return f'{self.prop} != {self._value_str}'
 
@@ -443,6 +482,7 @@ class EqualsNot(Equals):
 class InEquality(PropertyCondition, ABC):
     _num_condition_kw: ClassVar[str]
     _date_condition_kw: ClassVar[str]
+    _compare: ClassVar[Callable[[Any, Any], Any]]
 
     def _create_obj_ref_kwargs(self, ds: DataSource, prop_type: Property) -> dict[str, obj_query.Condition]:
         kwargs: dict[str, obj_query.Condition] = {}
@@ -514,6 +554,13 @@ class InEquality(PropertyCondition, ABC):
 
         return obj_query.PropertyFilter.model_validate({'property': self.prop.name, **kwargs})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        if (arr := self._col_array(view)).dtype.kind == 'O':
+            msg = f'Condition {self} can only be evaluated locally on numbers, dates and texts.'
+            raise FilterQueryError(msg)
+        mask = np.asarray(type(self)._compare(arr, view._col_value(self.prop.name, self.value)), dtype=np.bool_)
+        return mask & ~view._null_mask(self.prop.name)
+
     @abstractmethod
     def __repr__(self) -> str: ...
 
@@ -521,6 +568,7 @@ class InEquality(PropertyCondition, ABC):
 class GreaterThan(InEquality):
     _num_condition_kw = 'greater_than'
     _date_condition_kw = 'after'
+    _compare = operator.gt
 
     def __repr__(self) -> str:
         return f'{self.prop} > {self._value_str}'
@@ -529,6 +577,7 @@ class GreaterThan(InEquality):
 class LessThan(InEquality):
     _num_condition_kw = 'less_than'
     _date_condition_kw = 'before'
+    _compare = operator.lt
 
     def __repr__(self) -> str:
         return f'{self.prop} < {self._value_str}'
@@ -537,6 +586,7 @@ class LessThan(InEquality):
 class GreaterThanOrEqualTo(InEquality):
     _num_condition_kw = 'greater_than_or_equal_to'
     _date_condition_kw = 'on_or_after'
+    _compare = operator.ge
 
     def __repr__(self) -> str:
         return f'{self.prop} >= {self._value_str}'
@@ -545,6 +595,7 @@ class GreaterThanOrEqualTo(InEquality):
 class LessThanOrEqualTo(InEquality):
     _num_condition_kw = 'less_than_or_equal_to'
     _date_condition_kw = 'on_or_before'
+    _compare = operator.le
 
     def __repr__(self) -> str:
         return f'{self.prop} <= {self._value_str}'
@@ -611,6 +662,13 @@ class Contains(PropertyCondition):
 
         return obj_query.PropertyFilter.model_validate({'property': self.prop.name, **kwargs})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        arr = self._col_array(view)
+        if arr.dtype.kind == 'U':
+            return np.char.find(arr, str(self.value)) >= 0
+        value = view._col_value(self.prop.name, self.value)
+        return np.array([isinstance(values, list) and value in values for values in arr], dtype=np.bool_)
+
     def __repr__(self) -> str:
         return f'{self.prop}.{self._condition_kw}({self._value_str})'
 
@@ -619,6 +677,9 @@ class ContainsNot(Contains):
     _condition_kw = 'does_not_contain'
     is_method: bool = True
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return ~super()._eval_mask(view)
+
 
 class StartsWith(PropertyCondition):
     _condition_kw = 'starts_with'
@@ -671,6 +732,9 @@ class StartsWith(PropertyCondition):
 
         return obj_query.PropertyFilter.model_validate({'property': self.prop.name, **kwargs})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return np.char.startswith(self._str_col_array(view), str(self.value))
+
     def __repr__(self) -> str:
         return f'{self.prop}.{self._condition_kw}({self._value_str})'
 
@@ -679,6 +743,9 @@ class EndsWith(StartsWith):
     _condition_kw = 'ends_with'
     is_method: bool = True
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return np.char.endswith(self._str_col_array(view), str(self.value))
+
 
 class DateCondition(PropertyCondition, ABC):
     _condition_kw: ClassVar[str]
@@ -781,6 +848,9 @@ class And(Condition):
     def create_obj_ref(self, ds: DataSource) -> obj_query.QueryFilter:
         return obj_query.CompoundFilter.model_validate({'and_': [term.create_obj_ref(ds) for term in self.terms]})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return cast('NDArray[np.bool_]', np.logical_and.reduce([term._eval_mask(view) for term in self.terms]))
+
     def __repr__(self) -> str:
         terms = [f'({term})' if not term.is_method else str(term) for term in self.terms]
         return ' & '.join(str(term) for term in terms)
@@ -792,6 +862,9 @@ class Or(Condition):
     def create_obj_ref(self, ds: DataSource) -> obj_query.QueryFilter:
         return obj_query.CompoundFilter.model_validate({'or_': [term.create_obj_ref(ds) for term in self.terms]})
 
+    def _eval_mask(self, view: View) -> NDArray[np.bool_]:
+        return cast('NDArray[np.bool_]', np.logical_or.reduce([term._eval_mask(view) for term in self.terms]))
+
     def __repr__(self) -> str:
         terms = [f'({term})' if not term.is_method else str(term) for term in self.terms]
         return ' | '.join(str(term) for term in terms)
@@ -817,25 +890,71 @@ class Query:
     def _sorts_obj_ref(self) -> list[obj_query.DataSourceSort]:
         return [obj_query.DataSourceSort(property=prop.name, direction=prop.sort) for prop in self._sorts]
 
-    def execute(self) -> View:
-        """Execute the query and return the resulting pages as a view."""
+    def _query_obj(self) -> obj_query.DataSourceQueryBuilder | None:
+        """Return the low-level query builder or `None` if the query cannot have any results."""
         sorts = ', '.join(f'{prop}.{prop.sort}()' for prop in self._sorts) if self._sorts else ''
         _logger.info(f'Querying data source `{self.ds}` with filter `{self._filter}` and sorts `{sorts}`.')
-        session = get_active_session()
-        query_obj = session.api.data_sources.query(self.ds.obj_ref)
+        query_obj = get_active_session().api.data_sources.query(self.ds.obj_ref)
 
         try:
             if filter_obj := self._filter_obj_ref():
                 query_obj = query_obj.filter(filter_obj)
         except EmptyDataSourceError:
-            return View(ds=self.ds, pages=[], query=self)
+            return None
 
         if sort_objs := self._sorts_obj_ref():
             query_obj = query_obj.sort(sort_objs)
 
-        pages = [session._cache_add(Page.wrap_obj_ref(page)) for page in query_obj.execute()]
+        return query_obj
+
+    def execute(self, *, validate: bool = True) -> View:
+        """Execute the query and return the resulting pages as a view.
+
+        With `validate=False`, the pages are constructed from the trusted API response without a full
+        validation of the data, which speeds up reading large data sources, e.g. for analytics.
+        """
+        if (query_obj := self._query_obj()) is None:
+            return View(ds=self.ds, pages=[], query=self)
+
+        session = get_active_session()
+        page_objs = query_obj.execute(prefetch=PREFETCH_PAGES, validate=validate)
+        pages = [session._cache_add(Page.wrap_obj_ref(page_obj)) for page_obj in page_objs]
         return View(ds=self.ds, pages=pages, query=self)
 
+    def iter(self, *, cache: bool = True, prefetch: int = 0, validate: bool = True) -> Iterator[Page]:
+        """Execute the query and yield the resulting pages as they arrive.
+
+        In contrast to [execute][ultimate_notion.query.Query.execute], the pages are not collected in a view,
+        so processing can start with the first page of results. With `cache=False`, the pages are also not
+        added to the session cache, which allows to process large data sources in constant memory.
+        With `prefetch > 0`, up to this number of result pages are fetched ahead in the background.
+        With `validate=False`, the pages are constructed without a full validation like in
+        [execute][ultimate_notion.query.Query.execute].
+        """
+        if (query_obj := self._query_obj()) is None:
+            return
+
+        session = get_active_session()
+        for page_obj in query_obj.execute(prefetch=prefetch, validate=validate):
+            page = Page.wrap_obj_ref(page_obj)
+            yield session._cache_add(page) if cache else page
+
+    def count(self) -> int:
+        """Count the pages matching the query without retrieving them as pages.
+
+        Only the raw results are paged through on the server side, so the pages are neither wrapped
+        nor added to the session cache, keeping memory and CPU usage low even for large data sources.
+        """
+        if (query_obj := self._query_obj()) is None:
+            return 0
+        return query_obj.count()
+
+    def exists(self) -> bool:
+        """Return whether at least one page matches the query by requesting only a single result."""
+        if (query_obj := self._query_obj()) is None:
+            return False
+        return query_obj.exists()
+
     def filter(self, expr: Condition) -> Query:
         """Filter the query by the given properties.
 
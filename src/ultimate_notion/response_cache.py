@@ -0,0 +1,117 @@
+"""Persistent cache of Notion API responses to avoid downloading unchanged content again.
+
+Retrieving the content of a page needs one request per block with children, which makes loading
+large page trees slow and costly. The response cache stores the raw JSON of such responses in a
+SQLite database, keyed by the id of the object and a version, which is the `last_edited_time`
+of the page the content belongs to. As Notion updates the `last_edited_time` of a page whenever
+its content changes, a cached response is only used if the page, which is retrieved anyway,
+still has the very same `last_edited_time`. Otherwise the content is retrieved and stored again.
+
+As Notion reports the `last_edited_time` only with a precision of minutes, further changes within the
+same minute keep the version. Thus, versions of the current minute are never cached and local changes
+remove the cached responses of the modified content.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from threading import RLock
+from typing import Any
+from uuid import UUID
+
+_logger = logging.getLogger(__name__)
+
+CHILDREN = 'children'
+"""Kind of the cached responses holding all child blocks of a page or block"""
+VERSION_PRECISION = dt.timedelta(minutes=1)
+"""Precision of the `last_edited_time` used as version"""
+
+
+class ResponseCache:
+    """Cache of raw API responses in a SQLite database, keyed by kind, object id and version.
+
+    Only the most recent version of a response is kept per kind and object id.
+
+    Args:
+        path: path to the SQLite database file, which is created if it does not exist
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(kind TEXT NOT NULL, id TEXT NOT NULL, version TEXT NOT NULL, data TEXT NOT NULL, '
+                'PRIMARY KEY (kind, id))'
+            )
+
+    @staticmethod
+    def _version_str(version: dt.datetime) -> str:
+        return version.astimezone(dt.timezone.utc).isoformat()
+
+    @staticmethod
+    def _is_settled(version: dt.datetime) -> bool:
+        """Return whether the version cannot change anymore, i.e. it is not of the current minute."""
+        return dt.datetime.now(dt.timezone.utc) - version.astimezone(dt.timezone.utc) >= VERSION_PRECISION
+
+    def get(self, kind: str, obj_id: UUID, version: dt.datetime) -> Any | None:
+        """Return the cached JSON data of the given version or `None` if it is not cached."""
+        if not self._is_settled(version):
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM responses WHERE kind = ? AND id = ? AND version = ?',
+                (kind, str(obj_id), self._version_str(version)),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        _logger.debug(f'Using cached `{kind}` response of object `{obj_id}` with version {version}.')
+        return json.loads(row[0])
+
+    def put(self, kind: str, obj_id: UUID, version: dt.datetime, data: Any) -> None:
+        """Store the JSON data of the given version, replacing any other version.
+
+        Versions of the current minute are not stored, as the content might still change without a new version.
+        """
+        if not self._is_settled(version):
+            _logger.debug(f'Not caching `{kind}` response of object `{obj_id}` with recent version {version}.')
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (kind, id, version, data) VALUES (?, ?, ?, ?)',
+                (kind, str(obj_id), self._version_str(version), json.dumps(data)),
+            )
+
+    def delete(self, kind: str, obj_id: UUID) -> None:
+        """Remove the cached data of an object, e.g. if it was modified locally."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM responses WHERE kind = ? AND id = ?', (kind, str(obj_id)))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM responses')
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0])
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__}: {self.path}>'
@@ -1004,6 +1004,7 @@ class Schema(metaclass=SchemaType):
     _db_desc: rich_text.Text | None
     _ds: DataSource | None = None
     _props: list[Property]
+    _pydantic_models: dict[bool, tuple[tuple[Any, ...], type[SchemaModel]]]
 
     def __init_subclass__(cls, db_title: str | None = None, db_id: str | None = None, **kwargs: Any):
         if db_title is not None:
@@ -1065,7 +1066,25 @@ class Schema(metaclass=SchemaType):
         and thus `value` needs to be called to retrieve the actual Python type.
 
         If `with_ro_props` is set to `True`, read-only properties are included in the model.
+        The model is cached per schema class and only created again if the properties of the schema changed.
         """
+        signature = (
+            str(cls._db_title),
+            cls._db_id,
+            *((prop.attr_name, prop.name, prop.prop_value, prop.readonly) for prop in cls.get_props()),
+        )
+        if (models := cls.__dict__.get('_pydantic_models')) is None:
+            models = cls._pydantic_models = {}
+        if (cached := models.get(with_ro_props)) is not None and cached[0] == signature:
+            return cached[1]
+
+        model = cls._create_pydantic_model(with_ro_props=with_ro_props)
+        models[with_ro_props] = (signature, model)
+        return model
+
+    @classmethod
+    def _create_pydantic_model(cls, *, with_ro_props: bool) -> type[SchemaModel]:
+        """Create the Pydantic model of this schema, see `to_pydantic_model`."""
 
         # ToDo: Validate the categories in Select and MultiSelect using pydantic!
         def pytype_to_prop_value(py_type: Any, *, prop_value: type[PropertyValue]) -> PropertyValue:
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import io
 import logging
 import os
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from pathlib import Path
 from threading import RLock
 from types import TracebackType
 from typing import Any, BinaryIO, ClassVar, TypeVar, cast
@@ -14,32 +14,45 @@ from uuid import UUID
 
 import httpx
 import notion_client
-from notion_client.errors import APIResponseError
+from notion_client.errors import APIResponseError, HTTPResponseError, RequestTimeoutError
 
 from ultimate_notion.blocks import Block, DataObject, _append_block_chunks, _chunk_blocks_for_api
+from ultimate_notion.cache import ObjectCache
 from ultimate_notion.config import Config, activate_debug_mode, get_or_create_cfg
 from ultimate_notion.database import Database, DataSource
 from ultimate_notion.emoji import CustomEmoji, Emoji
 from ultimate_notion.errors import (
+    BatchError,
     SessionError,
     UnknownDatabaseError,
     UnknownDataSourceError,
     UnknownPageError,
     UnknownUserError,
 )
-from ultimate_notion.file import MAX_FILE_SIZE, AnyFile, UploadedFile, get_file_size, get_mime_type
+from ultimate_notion.file import (
+    MAX_FILE_SIZE,
+    AnyFile,
+    BufferReader,
+    UploadedFile,
+    file_buffer,
+    get_file_size,
+    get_mime_type,
+    wait_for_uploads,
+)
 from ultimate_notion.obj_api import blocks as obj_blocks
 from ultimate_notion.obj_api import create_notion_client
+from ultimate_notion.obj_api import props as obj_props
 from ultimate_notion.obj_api import query as obj_query
 from ultimate_notion.obj_api.endpoints import NotionAPI
 from ultimate_notion.obj_api.enums import FileUploadMode, FileUploadStatus
-from ultimate_notion.obj_api.objects import get_uuid
+from ultimate_notion.obj_api.objects import FileUpload, get_uuid
 from ultimate_notion.page import Page
 from ultimate_notion.props import Title
+from ultimate_notion.response_cache import ResponseCache
 from ultimate_notion.rich_text import Text
 from ultimate_notion.schema import DefaultSchema, Schema
 from ultimate_notion.user import Bot, UnknownUser, User
-from ultimate_notion.utils import SList
+from ultimate_notion.utils import SList, run_concurrently
 
 _logger = logging.getLogger(__name__)
 
@@ -52,6 +65,12 @@ T_cache = TypeVar('T_cache', bound='DataObject | User')
 _CONSISTENCY_POLL_INITIAL_DELAY = 0.2
 _CONSISTENCY_POLL_MAX_DELAY = 2.0
 
+# Files and parts of a multi-part upload failing with a transient error are sent again with exponential backoff.
+# This is not left to the retries of the transport, as the file needs to be rewound before sending it again.
+_UPLOAD_RETRY_INITIAL_DELAY = 1.0
+_UPLOAD_RETRY_MAX_DELAY = 30.0
+_UPLOAD_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 
 def _wait_for_consistency(predicate: Callable[[], bool], description: str) -> None:
     """Poll `predicate` with exponential backoff until it returns `True`.
@@ -69,7 +88,11 @@ class Session:
     """A session for the Notion API.
 
     The session keeps tracks of all objects, e.g. pages, data sources, etc.
-    in an object store to avoid unnecessary calls to the API.
+    in an object store to avoid unnecessary calls to the API. By default, this is an
+    [ObjectCache][ultimate_notion.cache.ObjectCache] bounded by the `cache_maxsize` and `cache_ttl`
+    settings of the configuration, but any mutable mapping can be passed as `cache`.
+    If the `response_cache` setting is configured, the content of pages is additionally persisted
+    in a [ResponseCache][ultimate_notion.response_cache.ResponseCache] across sessions.
     """
 
     client: notion_client.Client
@@ -77,18 +100,35 @@ class Session:
     _active_session: Session | None = None
     _lock = RLock()
     _own_bot_id: UUID | None = None
-    cache: ClassVar[dict[UUID, DataObject | User]] = {}
+    cache: ClassVar[MutableMapping[UUID, DataObject | User]] = ObjectCache()
+    response_cache: ResponseCache | None = None
 
-    def __init__(self, cfg: Config | None = None, *, client: notion_client.Client | None = None, **kwargs: Any):
+    def __init__(
+        self,
+        cfg: Config | None = None,
+        *,
+        client: notion_client.Client | None = None,
+        cache: MutableMapping[UUID, DataObject | User] | None = None,
+        **kwargs: Any,
+    ):
         """Initialize the `Session` object and the raw `api` endpoints.
 
         Args:
             cfg: configuration object
+            client: Notion SDK client to use instead of creating one from the configuration
+            cache: object store to use instead of an `ObjectCache` configured by the configuration
             **kwargs: Arguments for the [Notion SDK Client](https://ramnes.github.io/notion-sdk-py/reference/client/)
         """
         cfg = get_or_create_cfg() if cfg is None else cfg
 
         Session._initialize_once(self)
+        if cache is None:
+            cache = ObjectCache(maxsize=cfg.ultimate_notion.cache_maxsize, ttl=cfg.ultimate_notion.cache_ttl)
+        Session.cache = cache
+        self.concurrency = cfg.ultimate_notion.concurrency
+        self.max_retries = cfg.ultimate_notion.max_retries
+        if (response_cache_path := cfg.ultimate_notion.response_cache) is not None:
+            self.response_cache = ResponseCache(response_cache_path)
 
         if cfg.ultimate_notion.debug:
             activate_debug_mode()
@@ -142,6 +182,8 @@ class Session:
         """Close the session and release resources."""
         _logger.info('Closing connection to Notion.')
         self.client.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
         Session._active_session = None
         Session.cache.clear()
         Session._own_bot_id = None
@@ -178,9 +220,10 @@ class Session:
             raise TypeError(msg)
         return cached
 
-    def _cache_get(self, key: UUID, expected_type: type[T_cache]) -> T_cache:
-        """Return the cached object under `key`, narrowed to `expected_type`."""
-        obj = self.cache[key]
+    def _cache_get(self, key: UUID, expected_type: type[T_cache]) -> T_cache | None:
+        """Return the cached object under `key`, narrowed to `expected_type`, or `None` if it is not cached."""
+        if (obj := self.cache.get(key)) is None:
+            return None
         if not isinstance(obj, expected_type):
             msg = f'Cached object `{key}` is a `{type(obj).__name__}`, expected `{expected_type.__name__}`.'
             raise TypeError(msg)
@@ -189,9 +232,8 @@ class Session:
     def get_block(self, block_ref: UUID | str, *, use_cache: bool = True) -> Block:
         """Retrieve a single block by an object reference."""
         block_uuid = get_uuid(block_ref)
-        if use_cache and block_uuid in self.cache:
+        if use_cache and (cached_obj := self.cache.get(block_uuid)) is not None:
             _logger.info(f'Retrieving cached block with id `{block_uuid}`.')
-            cached_obj = self.cache[block_uuid]
             if not isinstance(cached_obj, Block):
                 msg = f'Cached object `{block_uuid}` is a `{type(cached_obj).__name__}`, expected a `Block`.'
                 raise TypeError(msg)
@@ -306,9 +348,9 @@ class Session:
     def get_ds(self, ds_ref: UUID | str, *, use_cache: bool = True) -> DataSource:
         """Retrieve Notion data source by uuid."""
         ds_uuid = get_uuid(ds_ref)
-        if use_cache and ds_uuid in self.cache:
+        if use_cache and (cached_ds := self._cache_get(ds_uuid, DataSource)) is not None:
             _logger.info(f'Retrieving cached data source with id `{ds_uuid}`.')
-            ds = self._cache_get(ds_uuid, DataSource)
+            ds = cached_ds
         else:
             _logger.info(f'Retrieving data source with id `{ds_uuid}`.')
             try:
@@ -324,9 +366,9 @@ class Session:
     def get_db(self, db_ref: UUID | str, *, use_cache: bool = True) -> Database:
         """Retrieve a Notion database (a container of data sources) by uuid."""
         db_uuid = get_uuid(db_ref)
-        if use_cache and db_uuid in self.cache:
+        if use_cache and (cached_db := self._cache_get(db_uuid, Database)) is not None:
             _logger.info(f'Retrieving cached database with id `{db_uuid}`.')
-            db = self._cache_get(db_uuid, Database)
+            db = cached_db
         else:
             _logger.info(f'Retrieving database with id `{db_uuid}`.')
             try:
@@ -374,9 +416,9 @@ class Session:
     def get_page(self, page_ref: UUID | str, *, use_cache: bool = True) -> Page:
         """Retrieve a page by uuid."""
         page_uuid = get_uuid(page_ref)
-        if use_cache and page_uuid in self.cache:
+        if use_cache and (cached_page := self._cache_get(page_uuid, Page)) is not None:
             _logger.info(f'Retrieving cached page with id `{page_uuid}`.')
-            page = self._cache_get(page_uuid, Page)
+            page = cached_page
         else:
             _logger.info(f'Retrieving page with id `{page_uuid}`.')
             try:
@@ -397,12 +439,14 @@ class Session:
         *,
         cover: AnyFile | None = None,
         icon: AnyFile | Emoji | CustomEmoji | str | None = None,
+        concurrency: int = 1,
     ) -> Page:
         """Create a new page in a `parent` page or data source with a given `title`.
 
         The `blocks` are optional and can be used to create a page with content right away.
         Note that some nested blocks may not be supported by the API and must be created separately, i.e.
-        with an `append` call to a given block.
+        with an `append` call to a given block. With `concurrency > 1`, independent nested blocks are
+        appended with up to `concurrency` concurrent requests, otherwise one after another.
         """
         _logger.info(f'Creating page with title `{title}` in parent `{parent.title}`.')
         title_obj = title if title is None else Title(title).obj_ref
@@ -421,7 +465,7 @@ class Session:
 
         if blocks:
             blocks_iter = _chunk_blocks_for_api(page, blocks)
-            _append_block_chunks(blocks_iter)
+            _append_block_chunks(blocks_iter, concurrency=concurrency)
 
         return page
 
@@ -453,9 +497,9 @@ class Session:
         user_uuid = get_uuid(user_ref)
         self.whoami()  # make sure cache is filled with the uuid of the bot integration
 
-        if use_cache and user_uuid in self.cache:
+        if use_cache and (cached_user := self._cache_get(user_uuid, User)) is not None:
             _logger.info(f'Retrieving cached user with id `{user_uuid}`.')
-            user = self._cache_get(user_uuid, User)
+            user = cached_user
         else:
             _logger.info(f'Retrieving user with id `{user_uuid}`.')
             try:
@@ -483,18 +527,79 @@ class Session:
         _logger.info('Retrieving all users.')
         return [self._cache_add(User.wrap_obj_ref(user)) for user in self.api.users.list()]
 
+    def prefetch_refs(self, pages: Iterable[Page], *, concurrency: int | None = None) -> None:
+        """Resolve all pages and users referenced by the properties of `pages` in one batch.
+
+        Reading the value of a relation or people property retrieves every referenced page or user
+        that is not cached yet with a separate request. This collects the ids of all uncached pages and
+        users referenced by relation, people, created-by and last-edited-by properties of `pages` first.
+        The pages are then retrieved concurrently and the users with a single sweep over all users of
+        the workspace, so that reading the property values afterwards is served from the cache.
+
+        Pages that are not accessible and users that are not part of the workspace are skipped here
+        and handled as usual when the property value is read.
+
+        Args:
+            pages: pages whose references should be resolved
+            concurrency: maximum number of concurrent requests, defaults to the `concurrency` setting
+        """
+        concurrency = self.concurrency if concurrency is None else concurrency
+        page_ids: set[UUID] = set()
+        user_ids: set[UUID] = set()
+        for page in pages:
+            for prop_value in page.obj_ref.properties.values():
+                match prop_value:
+                    case obj_props.Relation(relation=refs):
+                        page_ids.update(ref.id for ref in refs)
+                    case obj_props.People(people=users):
+                        user_ids.update(user.id for user in users)
+                    case obj_props.CreatedBy(created_by=user) | obj_props.LastEditedBy(last_edited_by=user):
+                        user_ids.add(user.id)
+
+        page_ids = {page_id for page_id in page_ids if page_id not in self.cache}
+        if user_ids:
+            self.whoami()  # the bot integration is not part of the user list
+            user_ids = {user_id for user_id in user_ids if user_id not in self.cache}
+        _logger.info(f'Prefetching {len(page_ids)} referenced pages and {len(user_ids)} referenced users.')
+
+        def retrieve_page(page_id: UUID) -> obj_blocks.Page | None:
+            try:
+                return self.api.pages.retrieve(page_id)
+            except APIResponseError:
+                _logger.warning(f'Referenced page with id {page_id} does not exist or is not accessible!')
+                return None
+
+        for page_obj in run_concurrently(retrieve_page, page_ids, concurrency=concurrency):
+            if page_obj is not None:
+                self._cache_add(Page.wrap_obj_ref(page_obj))
+        if user_ids:
+            self.all_users()
+
     def whoami(self) -> Bot:
         """Return the integration as bot object."""
         _logger.info('Retrieving information about this integration bot.')
-        if self._own_bot_id is None:
-            user = self.api.users.me()
-            self._own_bot_id = user.id
-            return self._cache_add(Bot.wrap_obj_ref(user))
-        else:
-            return self._cache_get(self._own_bot_id, Bot)
+        if self._own_bot_id is not None and (bot := self._cache_get(self._own_bot_id, Bot)) is not None:
+            return bot
+        user = self.api.users.me()
+        self._own_bot_id = user.id
+        return self._cache_add(Bot.wrap_obj_ref(user))
 
-    def upload(self, file: BinaryIO, *, file_name: str | None = None, mime_type: str | None = None) -> UploadedFile:
-        """Upload a file to Notion."""
+    def upload(
+        self,
+        file: BinaryIO,
+        *,
+        file_name: str | None = None,
+        mime_type: str | None = None,
+        concurrency: int | None = None,
+    ) -> UploadedFile:
+        """Upload a file to Notion.
+
+        Files larger than the maximum size of a single part are uploaded in several parts, which are sent
+        with up to `concurrency` concurrent requests, defaulting to the `concurrency` setting.
+        The parts are read from a memory-mapped file if possible. A file or part failing with a transient error,
+        e.g. due to rate limiting, is sent again up to `max_retries` times before the upload is aborted.
+        Files that are not seekable are not sent again.
+        """
         if file_name is None:
             try:
                 file_name = os.path.basename(file.name)  # BinaryIO has a 'name' unless it is e.g. a BytesIO
@@ -515,16 +620,76 @@ class Session:
         )
 
         if mode == FileUploadMode.SINGLE_PART:
-            self.api.uploads.send(file_upload=file_upload_obj, file=file)
+            self._send_upload(file_upload_obj, file)
         else:
-            for part in range(1, n_parts + 1):
-                _logger.info(f'Uploading part {part}/{n_parts} of file `{file_name}`.')
-                chunk = file.read(MAX_FILE_SIZE)
-                self.api.uploads.send(file_upload=file_upload_obj, part=part, file=io.BytesIO(chunk))
+            concurrency = self.concurrency if concurrency is None else concurrency
+            with file_buffer(file) as buffer:
+
+                def send_part(part: int) -> None:
+                    _logger.info(f'Uploading part {part}/{n_parts} of file `{file_name}`.')
+                    offset = (part - 1) * MAX_FILE_SIZE
+                    with BufferReader(buffer[offset : offset + MAX_FILE_SIZE]) as part_file:
+                        self._send_upload(file_upload_obj, cast(BinaryIO, part_file), part)
+
+                run_concurrently(send_part, range(1, n_parts + 1), concurrency=concurrency)
             self.api.uploads.complete(file_upload=file_upload_obj)
 
         return UploadedFile.from_file_upload(file_upload_obj)
 
+    def upload_many(
+        self, files: Iterable[str | Path], *, concurrency: int | None = None, block: bool = True
+    ) -> list[UploadedFile]:
+        """Upload many files to Notion concurrently and return the uploaded files in the given order.
+
+        Each file is uploaded like with [upload][ultimate_notion.session.Session.upload], i.e. detecting its MIME
+        type, creating the upload and sending the file, but up to `concurrency` files, defaulting to the
+        `concurrency` setting, are processed at the same time, while the parts of a large file are sent one
+        after another. With `block=True`, the uploads still pending are then waited for together with
+        [wait_for_uploads][ultimate_notion.file.wait_for_uploads].
+
+        Files that fail to upload do not abort the others, but are reported afterwards with a `BatchError`.
+        """
+        paths = [Path(file) for file in files]
+        concurrency = self.concurrency if concurrency is None else concurrency
+        errors: dict[int, Exception] = {}
+
+        def upload_file(item: tuple[int, Path]) -> UploadedFile | None:
+            idx, path = item
+            try:
+                with path.open('rb') as file:
+                    return self.upload(file, file_name=path.name, concurrency=1)
+            except Exception as e:  # reported after all files are processed
+                _logger.warning(f'Failed to upload file `{path}`: {e}')
+                errors[idx] = e
+                return None
+
+        results = run_concurrently(upload_file, enumerate(paths), concurrency=concurrency)
+        if block:
+            wait_for_uploads([file for file in results if file is not None], concurrency=concurrency)
+
+        if errors:
+            raise BatchError(results, dict(sorted(errors.items())))
+        return cast(list[UploadedFile], results)
+
+    def _send_upload(self, file_upload_obj: FileUpload, file: BinaryIO, part: int | None = None) -> None:
+        """Send a file or a part of a multi-part upload, rewinding and sending it again after transient errors."""
+        start = file.tell() if file.seekable() else None
+        what = 'file' if part is None else f'part {part}'
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.api.uploads.send(file_upload=file_upload_obj, part=part, file=file)
+            except (HTTPResponseError, RequestTimeoutError, httpx.TransportError) as e:
+                if isinstance(e, HTTPResponseError) and e.status not in _UPLOAD_RETRY_STATUSES:
+                    raise
+                if attempt == self.max_retries or start is None:
+                    raise
+                delay = min(_UPLOAD_RETRY_MAX_DELAY, _UPLOAD_RETRY_INITIAL_DELAY * 2**attempt)
+                _logger.info(f'Sending {what} failed with `{e}`, retry {attempt + 1} in {delay:.1f}s.')
+                time.sleep(delay)
+                file.seek(start)
+            else:
+                return
+
     def import_url(self, url: str, file_name: str, *, block: bool = True) -> UploadedFile:
         """Import a file from a URL."""
         _logger.info(f'Importing file from URL `{url}`.')
@@ -5,7 +5,8 @@ from __future__ import annotations
 import datetime as dt
 import json
 import re
-from collections.abc import Callable, Generator, Iterator, Mapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from hashlib import sha256
 from typing import Any, TypeAlias, TypeVar
@@ -320,6 +321,26 @@ def rec_apply(func: Callable[[Any], Any], obj: Any) -> Any:
         return func(obj)
 
 
+R = TypeVar('R')  # ToDo: Use new syntax when requires-python >= 3.12
+
+
+def run_concurrently(func: Callable[[T], R], items: Iterable[T], *, concurrency: int) -> list[R]:
+    """Apply `func` to all `items` using up to `concurrency` threads and return the results in order.
+
+    This is used to issue independent, I/O-bound requests to the Notion API concurrently without
+    requiring an event loop, which would interfere with the running loop of e.g. Jupyter notebooks.
+    The first exception raised by `func` is re-raised.
+    """
+    if concurrency < 1:
+        msg = f'Concurrency must be at least 1, got {concurrency}.'
+        raise ValueError(msg)
+    items = list(items)
+    if concurrency == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
 def pydantic_to_toml(model: BaseModel) -> str:
     """Convert a Pydantic model to a TOML string."""
     json_dct = json.loads(model.model_dump_json())
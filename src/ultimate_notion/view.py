@@ -5,17 +5,23 @@ from __future__ import annotations
 import datetime as dt
 from collections.abc import Callable, Iterator, Sequence
 from copy import deepcopy
+from functools import cache
 from html import escape as htmlescape
-from typing import TYPE_CHECKING, Any, TypeVar, overload
+from types import GenericAlias
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
 import numpy as np
-from pydantic import BaseModel
+import pendulum as pnd
+from pydantic import BaseModel, TypeAdapter
 from tabulate import tabulate
 
 from ultimate_notion import props, schema
-from ultimate_notion.core import Wrapper, get_repr
+from ultimate_notion.core import Wrapper, get_active_session, get_repr
 from ultimate_notion.file import ExternalFile, NotionFile
-from ultimate_notion.obj_api.enums import FormulaType, RollupType
+from ultimate_notion.obj_api import props as obj_props
+from ultimate_notion.obj_api.enums import FormulaType, RollupType, SortDirection
+from ultimate_notion.obj_api.objects import DateRange
+from ultimate_notion.obj_api.props import MAX_ITEMS_PER_PROPERTY
 from ultimate_notion.option import Option
 from ultimate_notion.page import Page
 from ultimate_notion.rich_text import html_img
@@ -27,17 +33,20 @@ from ultimate_notion.utils import (
     find_index,
     find_indices,
     is_notebook,
+    parse_dt_str,
     rec_apply,
 )
 
 if TYPE_CHECKING:
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
     from numpy.typing import NDArray
 
     from ultimate_notion.database import DataSource
     from ultimate_notion.props import PropertyValue
-    from ultimate_notion.query import Query
+    from ultimate_notion.query import Condition, PageProperty, Query
+    from ultimate_notion.utils import DateTimeOrRange
 
 T = TypeVar('T')
 
@@ -49,6 +58,8 @@ class View(Sequence[Page]):
         self._title_col = ds.schema.get_title_prop().name
         self._columns = self._get_columns(self._title_col)
         self._pages: NDArray[Any] = np.array(pages)
+        self._col_arrays: dict[str, NDArray[Any]] = {}
+        self._col_categories: dict[str, list[str]] = {}
         self._row_indices: NDArray[Any]
         self._col_indices: NDArray[Any]
         self.default_limit = 10
@@ -66,9 +77,101 @@ class View(Sequence[Page]):
 
     def clone(self) -> View:
         """Clone the current view, sharing the data source, pages and query with the copy."""
-        memo = {id(obj): obj for obj in (self.ds, self._pages, self._query)}
+        shared = (self.ds, self._pages, self._query, self._col_arrays, self._col_categories)
+        memo = {id(obj): obj for obj in shared}
         return deepcopy(self, memo)
 
+    def _col_array(self, col: str) -> NDArray[Any]:
+        """Return the values of a column for all pages as typed array, which is extracted only once.
+
+        Numbers are stored as `float64` with `NaN`, dates as `datetime64[us]` in UTC with `NaT`, checkboxes as `bool`,
+        unique ids as their number and select/status options as integer codes in the order of the options with `-1`
+        for no option. Texts are stored as strings with `''` for no text and all other values as objects.
+        """
+        if (arr := self._col_arrays.get(col)) is not None:
+            return arr
+        if col not in self._columns:
+            msg = f'Column `{col}` is not in view'
+            raise RuntimeError(msg)
+
+        match prop_type := self.ds.schema.to_dict()[col]:
+            case schema.ID():
+                arr = np.array([page.props._get_property(col).number for page in self._pages], dtype=np.int64)
+            case schema.Checkbox():
+                arr = np.array([bool(page.props[col]) for page in self._pages], dtype=np.bool_)
+            case schema.Select() | schema.Status():
+                categories = [option.name for option in prop_type.options]
+                codes = {name: code for code, name in enumerate(categories)}
+                names = [option.name if (option := page.props[col]) is not None else None for page in self._pages]
+                for name in names:
+                    if name is not None and name not in codes:  # option was added after the schema was retrieved
+                        codes[name] = len(categories)
+                        categories.append(name)
+                arr = np.array([-1 if name is None else codes[name] for name in names], dtype=np.int64)
+                self._col_categories[col] = categories
+            case schema.MultiSelect():
+                arr = obj_array([[option.name for option in page.props[col] or []] for page in self._pages])
+            case _:
+                arr = typed_array([page.props[col] for page in self._pages])
+
+        self._col_arrays[col] = arr
+        return arr
+
+    def _null_mask(self, col: str) -> NDArray[np.bool_]:
+        """Return a mask of all pages having no value in the given column."""
+        arr = self._col_array(col)
+        match arr.dtype.kind:
+            case 'b':
+                return np.zeros(len(arr), dtype=np.bool_)
+            case 'f':
+                return cast('NDArray[np.bool_]', np.isnan(arr))
+            case 'M':
+                return cast('NDArray[np.bool_]', np.isnat(arr))
+            case 'i':
+                return arr < 0
+            case 'U':
+                return cast('NDArray[np.bool_]', arr == '')
+            case _:
+                return np.array([value is None or value == [] for value in arr], dtype=np.bool_)
+
+    def _col_value(self, col: str, value: Any) -> Any:
+        """Convert a value to be compared with a column to the type of the column array."""
+        arr = self._col_array(col)
+        match arr.dtype.kind:
+            case 'b':
+                return bool(value)
+            case 'f':
+                return float(value)
+            case 'M':
+                return to_datetime64(value)
+            case 'i' if col in self._col_categories:
+                name = value.name if isinstance(value, Option) else str(value)
+                categories = self._col_categories[col]
+                return categories.index(name) if name in categories else -2  # -2 matches no page
+            case 'i':
+                return int(value.rsplit('-', 1)[-1]) if isinstance(value, str) else int(value)
+            case 'U':
+                return str(value)
+            case _:
+                return value.name if isinstance(value, Option) else value
+
+    def _sort_keys(self, col: str, *, descending: bool = False) -> tuple[NDArray[Any], NDArray[np.bool_]]:
+        """Return numerical sort keys of a column and the null mask to sort pages without value last."""
+        arr = self._col_array(col)
+        nulls = self._null_mask(col)
+        match arr.dtype.kind:
+            case 'b' | 'i':
+                keys = arr.astype(np.int64)
+            case 'f':
+                keys = np.where(nulls, 0.0, arr)
+            case 'M':
+                keys = np.where(nulls, 0, arr.astype(np.int64))
+            case 'U':
+                keys = np.unique(arr, return_inverse=True)[1]
+            case _:
+                keys = np.unique(np.array([str(value) for value in arr], dtype=np.str_), return_inverse=True)[1]
+        return (-keys if descending else keys), nulls
+
     def _get_columns(self, title_col: str) -> NDArray[Any]:
         """Make sure title column is the first columns."""
         cols = list(self.ds.schema.to_dict().keys())
@@ -137,23 +240,77 @@ class View(Sequence[Page]):
         """Convert the view to a simple list of pages."""
         return [self.get_page(idx) for idx in range(len(self))]
 
+    def prefetch_refs(self, *, concurrency: int | None = None) -> View:
+        """Resolve all pages and users referenced by the pages of this view in one batch.
+
+        Use this before reading relation or people properties of many rows, e.g. with
+        [to_rows][ultimate_notion.view.View.to_rows] or [to_polars][ultimate_notion.view.View.to_polars],
+        to avoid one request per cell. See [prefetch_refs][ultimate_notion.session.Session.prefetch_refs].
+        """
+        get_active_session().prefetch_refs(self.to_pages(), concurrency=concurrency)
+        return self
+
     def to_rows(self) -> list[tuple[Any, ...]]:
         return [self.get_row(idx) for idx in range(len(self))]
 
     def to_pydantic(self) -> list[BaseModel]:
-        """Convert the view to a list of Pydantic models."""
+        """Convert the view to a list of Pydantic models.
+
+        All rows are validated at once. Like for `to_json`, the property values are taken directly from the
+        low-level property values and only incomplete ones, e.g. long lists of relations, are retrieved first.
+        """
         model = self.ds.schema.to_pydantic_model(with_ro_props=True)
         is_prop_ro = {prop.name: prop.readonly for prop in self.ds.schema.get_props()}
 
-        def get_prop(page: Page, prop: str) -> PropertyValue | Any:
-            prop_value = page.props._get_property(prop)
-            return prop_value if is_prop_ro[prop] else prop_value.value
+        def get_prop(page: Page, col: str) -> props.PropertyValue | Any:
+            prop_obj = page.obj_ref.properties[col]
+            if is_complete_prop_value(prop_obj):
+                prop_value = props.PropertyValue.wrap_obj_ref(prop_obj)
+            else:
+                prop_value = page.props._get_property(col)
+            # writable properties are validated from their values, empty ones can't be and are kept as they are
+            return prop_value if is_prop_ro[col] or prop_value.value is None else prop_value.value
 
-        models: list[BaseModel] = []
-        for page in self.to_pages():
-            models.append(model(**{col: get_prop(page, col) for col in self.columns}))
+        rows = [{col: get_prop(page, col) for col in self.columns} for page in self.to_pages()]
+        return model_list_adapter(model).validate_python(rows)
 
-        return models
+    def to_json(self, *, indent: int | None = None) -> bytes:
+        """Convert the view to JSON, i.e. a list of objects mapping the columns to the values of a row.
+
+        Like for dataframes, the values are taken directly from the low-level property values
+        without creating Pydantic models or property values for each cell.
+        """
+        columns = {col: [json_value(value) for value in values] for col, values in self._to_columns().items()}
+        rows = [dict(zip(columns, values, strict=True)) for values in zip(*columns.values(), strict=True)]
+        return JSON_ROWS_ADAPTER.dump_json(rows, indent=indent)
+
+    def _export_col(self, col: str, pages: Sequence[Page]) -> list[Any]:
+        """Return the values of a column of the given pages for exporting them, e.g. to a dataframe.
+
+        The values are taken directly from the low-level property values where possible, avoiding the creation
+        of a property value object for each cell. Complex objects are converted to strings. If a column contains
+        a date range, all its dates are returned as a dict of the start and end, the latter being `None`.
+        """
+        if col == self._index_name:
+            return list(range(len(pages)))
+        elif col == self._id_name:
+            return [page.id for page in pages]
+        elif col == self._icon_name:
+            return [None if (icon := page.icon) is None else cmplx_to_str(icon) for page in pages]
+
+        values: list[Any] = []
+        for page in pages:
+            if (value := plain_prop_value(page.obj_ref.properties[col])) is NO_PLAIN_VALUE:
+                value = rec_apply(cmplx_to_str, page.props[col])
+            values.append(value)
+        if any(isinstance(value, dict) for value in values):
+            values = [{'start': value, 'end': None} if isinstance(value, dt.datetime) else value for value in values]
+        return values
+
+    def _to_columns(self) -> dict[str, list[Any]]:
+        """Return the values of the view column by column for exporting them."""
+        pages = self.to_pages()
+        return {col: self._export_col(col, pages) for col in self.columns}
 
     def to_pandas(self) -> pd.DataFrame:
         """Convert the view to a Pandas dataframe."""
@@ -161,9 +318,33 @@ class View(Sequence[Page]):
 
         # remove index as pandas uses its own
         view = self.without_index() if self.has_index else self
-        data = [list(row) for row in rec_apply(cmplx_to_str, self.to_rows())]
+        return pd.DataFrame(view._to_columns())  # the columns are kept in order
 
-        return pd.DataFrame(data, columns=view.columns)
+    def to_arrow(self) -> pa.Table:
+        """Convert the view to a PyArrow table."""
+        import pyarrow as pa  # noqa: PLC0415
+
+        ds_schema = self.ds.schema.to_dict()
+        arrays: dict[str, pa.Array] = {}
+        for col, values in self._to_columns().items():
+            match ds_schema.get(col):
+                case schema.Number():
+                    arrays[col] = pa.array(values, type=pa.float64())
+                case schema.Checkbox():
+                    arrays[col] = pa.array(values, type=pa.bool_())
+                case schema.Date() if any(isinstance(value, dict) for value in values):
+                    range_type = pa.struct([('start', pa.timestamp('ms')), ('end', pa.timestamp('ms'))])
+                    arrays[col] = pa.array(values, type=range_type)
+                case schema.Date() | schema.CreatedTime() | schema.LastEditedTime():
+                    arrays[col] = pa.array(values, type=pa.timestamp('ms'))
+                case schema.Select() | schema.Status():
+                    arrays[col] = pa.array(values, type=pa.string()).dictionary_encode()
+                case _:
+                    try:
+                        arrays[col] = pa.array(values)
+                    except (pa.ArrowInvalid, pa.ArrowTypeError):  # e.g. users or verification objects
+                        arrays[col] = pa.array([None if value is None else str(value) for value in values])
+        return pa.table(arrays)
 
     def _probe_col_type(self, col: str) -> PropertyValue | None:
         """Probe the type of a column by checking the values in the column."""
@@ -204,17 +385,19 @@ class View(Sequence[Page]):
         """Convert the view to a Polars dataframe."""
         import polars as pl  # noqa: PLC0415
 
-        data = rec_apply(cmplx_to_str, self.to_rows())
+        data = self._to_columns()
         schema = self._to_polars_schema()
-        for row in data:
-            for idx, col in enumerate(self.columns):
-                if (
-                    isinstance(schema[col], pl.Datetime)
-                    and isinstance(row[idx], dt.date)
-                    and not isinstance(row[idx], dt.datetime)
-                ):
-                    row[idx] = dt.datetime.combine(row[idx], dt.time())
-        return pl.DataFrame(data=data, schema=schema, orient='row')
+        for col, values in data.items():
+            if any(isinstance(value, dict) for value in values):
+                schema[col] = pl.Struct({'start': pl.Datetime(), 'end': pl.Datetime()})
+            elif isinstance(schema[col], pl.Datetime):
+                data[col] = [
+                    dt.datetime.combine(value, dt.time())
+                    if isinstance(value, dt.date) and not isinstance(value, dt.datetime)
+                    else value
+                    for value in values
+                ]
+        return pl.DataFrame(data=data, schema=schema)
 
     def _html_for_icon(self, rows: list[Any], cols: list[str]) -> list[Any]:
         # escape everything as we ask tabulate not to do it
@@ -416,23 +599,171 @@ class View(Sequence[Page]):
         view._row_indices = view._row_indices[::-1]
         return view
 
-    def sort(self) -> View:
-        """Sort the view with respect to some columns."""
-        # ToDo: Implement me
-        raise NotImplementedError
+    def sort(self, *props: PageProperty | str) -> View:
+        """Sort the view locally by the given properties and directions without querying Notion again.
+
+        The properties are specified like in [Query.sort][ultimate_notion.query.Query.sort], e.g.
+        `view.sort(uno.prop('Age').desc(), 'Name')`. Pages without a value are sorted last.
+        Select and status options are sorted in the order of the options, unique ids by their number.
+        """
+        keys: list[NDArray[Any]] = []
+        for prop in reversed(props):  # `np.lexsort` uses the last key as primary key
+            if isinstance(prop, str):
+                col, descending = prop, False
+            else:
+                col, descending = prop.name, prop.sort == SortDirection.DESCENDING
+            col_keys, nulls = self._sort_keys(col, descending=descending)
+            keys.extend([col_keys[self._row_indices], nulls[self._row_indices]])
+
+        view = self.clone()
+        if keys:
+            view._row_indices = view._row_indices[np.lexsort(keys)]
+        return view
+
+    def filter(self, expr: Condition) -> View:
+        """Filter the view locally by the given condition without querying Notion again.
 
-    def filter(self) -> View:
-        """Filter the view."""
-        # ToDo: Implement me
-        raise NotImplementedError
+        The condition is specified like in [Query.filter][ultimate_notion.query.Query.filter], e.g.
+        `view.filter((uno.prop('Age') > 30) & uno.prop('Name').starts_with('J'))`.
+        Relative date conditions like `past_week` are not supported.
+        """
+        mask = expr._eval_mask(self)
+        view = self.clone()
+        view._row_indices = view._row_indices[mask[view._row_indices]]
+        return view
 
     def reload(self) -> View:
         """Reload all pages by re-executing the query that generated the view."""
         view = self.clone()
         view._pages = np.array(self._query.execute().to_pages())
+        view._col_arrays, view._col_categories = {}, {}
         return view
 
 
+def obj_array(values: Sequence[Any]) -> NDArray[Any]:
+    """Create a 1-dimensional object array, even if the values are sequences themselves."""
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def to_datetime64(value: str | DateTimeOrRange | None) -> np.datetime64:
+    """Convert a date, datetime or the start of an interval to a `datetime64` in UTC."""
+    if isinstance(value, str):
+        value = parse_dt_str(value)
+    if isinstance(value, pnd.Interval):
+        value = value.start
+    match value:
+        case None:
+            return np.datetime64('NaT', 'us')
+        case dt.datetime() if value.tzinfo is not None:
+            return np.datetime64(value.astimezone(dt.timezone.utc).replace(tzinfo=None).isoformat(), 'us')
+        case dt.date():
+            return np.datetime64(value.isoformat(), 'us')
+        case _:
+            msg = f'Cannot convert `{value}` to a date.'
+            raise ValueError(msg)
+
+
+def typed_array(values: Sequence[Any]) -> NDArray[Any]:
+    """Create an array of numbers, dates or strings from the values if possible, otherwise of objects."""
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, int | float) and not isinstance(value, bool) for value in present):
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    if present and all(isinstance(value, dt.date | pnd.Interval) for value in present):
+        return np.array([to_datetime64(value) for value in values], dtype='datetime64[us]')
+    if all(isinstance(value, str) for value in present):
+        return np.array(['' if value is None else str(value) for value in values], dtype=np.str_)
+    return obj_array(values)
+
+
+NO_PLAIN_VALUE = object()
+"""Sentinel for property values that cannot be converted by `plain_prop_value`."""
+
+
+def date_to_dt(value: dt.date, time_zone: str | None = None) -> dt.datetime:
+    """Convert a date or datetime to a naive datetime in UTC, dates are converted to midnight."""
+    if not isinstance(value, dt.datetime):
+        return dt.datetime.combine(value, dt.time())
+    if value.tzinfo is None and time_zone is not None:
+        value = pnd.instance(value, tz=time_zone)
+    return value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+
+
+def date_range_to_dt(date_range: DateRange) -> dt.datetime | dict[str, dt.datetime]:
+    """Convert a date range to a naive datetime in UTC or, if it has an end, to a dict of its start and end."""
+    start = date_to_dt(date_range.start, date_range.time_zone)
+    if date_range.end is None:
+        return start
+    return {'start': start, 'end': date_to_dt(date_range.end, date_range.time_zone)}
+
+
+def is_complete_prop_value(prop_obj: obj_props.PropertyValue) -> bool:
+    """Return whether a low-level property value is complete, i.e. it was not truncated by the Notion API."""
+    match prop_obj:
+        case obj_props.Relation(has_more=has_more):
+            return not has_more
+        case obj_props.People(people=items) | obj_props.Title(title=items) | obj_props.RichText(rich_text=items):
+            return len(items) < MAX_ITEMS_PER_PROPERTY or prop_obj._is_retrieved
+        case _:
+            return True
+
+
+def plain_prop_value(prop_obj: obj_props.PropertyValue) -> Any:
+    """Convert a low-level property value to a plain Python object for exporting it.
+
+    Returns `NO_PLAIN_VALUE` for property values that need to be resolved with the help of the session,
+    e.g. relations and users, or need to be retrieved completely first.
+    """
+    match prop_obj:
+        case obj_props.Title(title=rich_texts) | obj_props.RichText(rich_text=rich_texts):
+            if not is_complete_prop_value(prop_obj):
+                return NO_PLAIN_VALUE  # the text might be truncated
+            return ''.join(rich_text.plain_text for rich_text in rich_texts) or None
+        case obj_props.Number(number=value) | obj_props.Checkbox(checkbox=value):
+            return value
+        case obj_props.URL(url=value) | obj_props.Email(email=value) | obj_props.PhoneNumber(phone_number=value):
+            return value
+        case obj_props.Select(select=option) | obj_props.Status(status=option):
+            return None if option is None else option.name
+        case obj_props.MultiSelect(multi_select=options):
+            return [option.name for option in options] or None
+        case obj_props.Date(date=date_range):
+            return None if date_range is None else date_range_to_dt(date_range)
+        case obj_props.CreatedTime(created_time=value) | obj_props.LastEditedTime(last_edited_time=value):
+            return value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        case obj_props.UniqueID(unique_id=unique_id):
+            return f'{unique_id.prefix}-{unique_id.number}'
+        case obj_props.Formula(formula=obj_props.DateFormula(date=date_range)):
+            return None if date_range is None else date_range_to_dt(date_range)
+        case obj_props.Formula(formula=formula):
+            return None if formula is None else formula.value
+        case _:
+            return NO_PLAIN_VALUE
+
+
+JSON_ROWS_ADAPTER: TypeAdapter[list[dict[str, Any]]] = TypeAdapter(list[dict[str, Any]])
+
+
+@cache
+def model_list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return a cached adapter validating a list of rows as instances of the given model all at once."""
+    return TypeAdapter(GenericAlias(list, (model,)))
+
+
+def json_value(value: Any) -> Any:
+    """Convert an exported value to a JSON-serializable object, using the string representation of complex objects."""
+    match value:
+        case None | bool() | int() | float() | str() | dt.date():
+            return value
+        case list() | tuple():
+            return [json_value(item) for item in value]
+        case dict():
+            return {key: json_value(item) for key, item in value.items()}
+        case _:
+            return str(value)
+
+
 def cmplx_to_str(obj: Wrapper) -> Wrapper | str:
     """Convert complex objects to a string representation."""
     match obj:
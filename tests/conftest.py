@@ -36,10 +36,12 @@ from random import randint
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pydantic
 import pytest
 from _pytest.fixtures import SubRequest
 from google.auth.exceptions import RefreshError
+from notion_client import Client
 from vcr import VCR  # type: ignore[import-untyped]
 from vcr import mode as vcr_mode
 from vcr.errors import CannotOverwriteExistingCassetteException  # type: ignore[import-untyped]
@@ -57,6 +59,7 @@ from ultimate_notion.config import (
     get_cfg_file,
     get_or_create_cfg,
 )
+from ultimate_notion.obj_api import NotionAPI
 from ultimate_notion.utils import temp_attr, temp_timezone
 
 if TYPE_CHECKING:
@@ -806,6 +809,28 @@ def notion(notion_cached: Session) -> Iterator[Session]:
         yield notion_cached
 
 
+MockHandler = Callable[[httpx.Request], httpx.Response]
+"""Function answering the requests of a session instead of the Notion API"""
+MockAPI = Callable[[MockHandler], None]
+"""Function of the `mock_api` fixture to answer all further requests of the session with a handler"""
+
+
+@pytest.fixture(scope='function')
+def mock_api(notion: Session) -> Iterator[MockAPI]:
+    """Return a function to answer all requests of the session with a handler instead of the Notion API.
+
+    This allows testing the handling of specific responses offline, e.g. of paginated or failing requests,
+    without recording a cassette. The API of the session is restored after the test.
+    """
+    with contextlib.ExitStack() as stack:
+
+        def serve(handler: MockHandler) -> None:
+            api = NotionAPI(Client(auth='secret', client=httpx.Client(transport=httpx.MockTransport(handler))))
+            stack.enter_context(temp_attr(notion, api=api))
+
+        yield serve
+
+
 @vcr_fixture(scope='module', shared=True)
 def person(notion_cached: Session) -> User:
     """Return a user object for testing.
@@ -6,7 +6,9 @@ import pytest
 
 from ultimate_notion.obj_api.blocks import Page, Paragraph
 from ultimate_notion.obj_api.core import extract_id
-from ultimate_notion.obj_api.objects import Bot, BuiltInIconObject, Person, User
+from ultimate_notion.obj_api.enums import Color
+from ultimate_notion.obj_api.objects import Bot, BuiltInIconObject, Person, SelectOption, User
+from ultimate_notion.obj_api.props import MultiSelect
 
 
 @pytest.fixture(autouse=True)
@@ -107,3 +109,51 @@ def test_block_serialization_omits_read_only_archive_flags() -> None:
     assert 'in_trash' not in data
     assert 'archived' not in data
     assert 'is_archived' not in data
+
+
+def test_update_validates_only_given_fields() -> None:
+    paragraph = Paragraph.build(paragraph={'rich_text': []})
+    block_id = uuid4()
+
+    paragraph.update(
+        id=str(block_id),
+        has_children=True,
+        paragraph={'rich_text': [], 'color': 'red'},
+    )
+
+    assert paragraph.id == block_id
+    assert paragraph.has_children is True
+    assert paragraph.paragraph.color == Color.RED
+    assert paragraph.in_trash is False
+    assert {'id', 'has_children', 'paragraph'} <= paragraph.model_fields_set
+
+
+def test_equality_reflects_mutations() -> None:
+    def paragraph(text: str) -> Paragraph:
+        return Paragraph.model_validate(
+            {
+                'object': 'block',
+                'id': str(uuid4()),
+                'type': 'paragraph',
+                'paragraph': {'rich_text': [{'type': 'text', 'text': {'content': text}, 'plain_text': text}]},
+            }
+        )
+
+    para, other_para = paragraph('Hello'), paragraph('Hello')
+    assert para == other_para  # ids are ignored
+
+    other_para.paragraph.color = Color.RED
+    assert para != other_para
+    other_para.paragraph.color = para.paragraph.color
+    assert para == other_para
+
+    other_para.paragraph.rich_text.clear()  # in-place changes are detected as well
+    assert para != other_para
+
+    with pytest.raises(TypeError):
+        hash(para)  # mutable objects are not hashable
+
+    # nested objects with their own equality, e.g. options ignoring ids or users equal to references
+    tags = MultiSelect.build([SelectOption(id='a', name='urgent')])
+    other_tags = MultiSelect.build([SelectOption(id='b', name='urgent', color=Color.DEFAULT)])
+    assert tags == other_tags
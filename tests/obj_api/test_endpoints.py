@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
+from notion_client import AsyncClient
 
 import ultimate_notion as uno
-from ultimate_notion.obj_api import objects, props
+from ultimate_notion.obj_api import AsyncNotionAPI, blocks, objects, props
 from ultimate_notion.props import Title
 
 
@@ -81,3 +85,19 @@ def test_update_page(notion: uno.Session, root_page: uno.Page) -> None:
     notion.api.pages.update(page, icon=uno.Emoji(emoji_icon).obj_ref)
     assert isinstance(page.icon, objects.EmojiObject)
     assert page.icon == objects.EmojiObject.build(emoji_icon)
+
+
+def test_async_api_retrieve_pages_concurrently() -> None:
+    page_ids = [f'00000000-0000-4713-920b-61d813bf72a{i}' for i in range(3)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page_id = request.url.path.rsplit('/', 1)[-1]
+        return httpx.Response(200, json={'object': 'page', 'id': page_id})
+
+    async def retrieve_all() -> list[blocks.Page]:
+        client = AsyncClient(auth='secret', client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncNotionAPI(client) as api:
+            return await asyncio.gather(*(api.pages.retrieve(page_id) for page_id in page_ids))
+
+    pages = asyncio.run(retrieve_all())
+    assert [str(page.id) for page in pages] == page_ids
@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from typing import Any
+from uuid import UUID
+
+import pytest
+
 from ultimate_notion.obj_api.blocks import DataSource, Page
-from ultimate_notion.obj_api.iterator import ObjectList
+from ultimate_notion.obj_api.iterator import (
+    AsyncEndpointIterator,
+    EndpointIterator,
+    ObjectList,
+    construct_object_list,
+)
 
 
 def test_object_list_tolerates_pages_without_properties() -> None:
@@ -51,3 +63,149 @@ def test_object_list_tolerates_data_sources_without_properties() -> None:
     for result in obj_list.results:
         assert isinstance(result, DataSource)
         assert result.properties == {}
+
+
+PAGE_IDS = [f'00000000-0000-4713-920b-61d813bf72a{i}' for i in range(5)]
+
+
+def paginated_result(start_cursor: str | None, page_size: int) -> dict[str, Any]:
+    """Return a result page of `PAGE_IDS` like the Notion API does."""
+    start = int(start_cursor or 0)
+    end = start + page_size
+    return {
+        'object': 'list',
+        'type': 'page_or_database',
+        'page_or_database': {},
+        'has_more': end < len(PAGE_IDS),
+        'next_cursor': str(end) if end < len(PAGE_IDS) else None,
+        'results': [{'object': 'page', 'id': page_id} for page_id in PAGE_IDS[start:end]],
+    }
+
+
+def test_construct_object_list_matches_validation() -> None:
+    """Constructing a trusted API response must give the same objects as validating it."""
+    user = {'object': 'user', 'id': '7b5f2d6a-12c4-4c3e-9d7e-3c1b0a4f5e6d'}
+    rich_text = {
+        'type': 'text',
+        'text': {'content': 'Task', 'link': None},
+        'annotations': {
+            'bold': True,
+            'italic': False,
+            'strikethrough': False,
+            'underline': False,
+            'code': False,
+            'color': 'default',
+        },
+        'plain_text': 'Task',
+        'href': None,
+    }
+    page = {
+        'object': 'page',
+        'id': PAGE_IDS[0],
+        'created_time': '2024-05-01T10:00:00.000Z',
+        'last_edited_time': '2024-05-02T12:30:00.000Z',
+        'created_by': user,
+        'last_edited_by': user,
+        'cover': None,
+        'icon': {'type': 'emoji', 'emoji': '🚀'},
+        'parent': {'type': 'data_source_id', 'data_source_id': PAGE_IDS[1], 'database_id': PAGE_IDS[2]},
+        'archived': False,
+        'in_trash': False,
+        'properties': {
+            'Name': {'id': 'title', 'type': 'title', 'title': [rich_text]},
+            'Count': {'id': 'a%3Db', 'type': 'number', 'number': 42},
+            'Done': {'id': 'c%3Dd', 'type': 'checkbox', 'checkbox': True},
+            'Due': {
+                'id': 'e%3Df',
+                'type': 'date',
+                'date': {'start': '2024-05-03', 'end': None, 'time_zone': None},
+            },
+            'Tags': {
+                'id': 'g%3Dh',
+                'type': 'multi_select',
+                'multi_select': [{'id': PAGE_IDS[3], 'name': 'urgent', 'color': 'red'}],
+            },
+        },
+        'url': 'https://www.notion.so/Task-000000004713920b61d813bf72a0',
+        'public_url': None,
+    }
+    data = {
+        'object': 'list',
+        'type': 'page_or_database',
+        'page_or_database': {},
+        'has_more': False,
+        'next_cursor': None,
+        'results': [page],
+    }
+
+    validated = ObjectList.model_validate(data)
+    constructed = construct_object_list(data)
+
+    assert type(constructed) is type(validated)
+    assert constructed.results == validated.results
+    assert constructed.results[0].model_dump() == validated.results[0].model_dump()
+    assert isinstance(constructed.results[0].id, UUID)
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_endpoint_iterator_paginates(prefetch: int) -> None:
+    calls: list[str | None] = []
+
+    def endpoint(start_cursor: str | None, page_size: int) -> dict[str, Any]:
+        calls.append(start_cursor)
+        return paginated_result(start_cursor, page_size)
+
+    page_iter = EndpointIterator[Page](endpoint, prefetch=prefetch)
+    pages = list(page_iter(page_size=2))
+
+    assert [str(page.id) for page in pages] == PAGE_IDS
+    assert calls == [None, '2', '4']
+    assert page_iter.total_items == len(PAGE_IDS)
+
+
+def test_endpoint_iterator_prefetch_reraises_errors() -> None:
+    def endpoint(start_cursor: str | None, page_size: int) -> dict[str, Any]:
+        if start_cursor is not None:
+            msg = 'API failure'
+            raise RuntimeError(msg)
+        return paginated_result(start_cursor, page_size)
+
+    page_iter = EndpointIterator[Page](endpoint, prefetch=2)(page_size=2)
+    assert len([next(page_iter), next(page_iter)]) == 2
+    with pytest.raises(RuntimeError, match='API failure'):
+        next(page_iter)
+
+
+def test_endpoint_iterator_prefetch_starts_thread_lazily() -> None:
+    """The first result page is fetched directly, a background thread only fetches the following ones."""
+    threads: list[str] = []
+
+    def endpoint(start_cursor: str | None, page_size: int) -> dict[str, Any]:
+        threads.append(threading.current_thread().name)
+        return paginated_result(start_cursor, page_size)
+
+    main_thread = threading.current_thread().name
+    assert len(list(EndpointIterator[Page](endpoint, prefetch=2)(page_size=len(PAGE_IDS)))) == len(PAGE_IDS)
+    assert threads == [main_thread]
+
+    threads.clear()
+    assert len(list(EndpointIterator[Page](endpoint, prefetch=2)(page_size=2))) == len(PAGE_IDS)
+    assert threads == [main_thread, 'EndpointIterator-prefetch', 'EndpointIterator-prefetch']
+
+
+def test_async_endpoint_iterator_paginates() -> None:
+    """The async iterator awaits the endpoint and follows `next_cursor` until `has_more` is false."""
+    calls: list[str | None] = []
+
+    async def endpoint(start_cursor: str | None, page_size: int) -> dict[str, Any]:
+        calls.append(start_cursor)
+        await asyncio.sleep(0)  # hand control back to the event loop like a real request
+        return paginated_result(start_cursor, page_size)
+
+    async def collect() -> list[Page]:
+        return [page async for page in AsyncEndpointIterator[Page](endpoint)(page_size=2)]
+
+    pages = asyncio.run(collect())
+
+    assert [str(page.id) for page in pages] == PAGE_IDS
+    assert calls == [None, '2', '4']
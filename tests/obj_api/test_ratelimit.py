@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Coroutine
+from typing import Any
+
+import httpx
+import pytest
+
+from ultimate_notion.obj_api.ratelimit import (
+    AsyncRateLimitedTransport,
+    RateLimitedTransport,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record the delays instead of actually sleeping."""
+    delays: list[float] = []
+    real_async_sleep = asyncio.sleep
+
+    def async_sleep(delay: float) -> Coroutine[Any, Any, None]:
+        delays.append(delay)
+        return real_async_sleep(0)
+
+    monkeypatch.setattr(time, 'sleep', delays.append)
+    monkeypatch.setattr(asyncio, 'sleep', async_sleep)
+    return delays
+
+
+def flaky_handler(statuses: list[int], headers: dict[str, str] | None = None) -> httpx.MockTransport:
+    """Return a mock transport answering with the given status codes one after another."""
+    responses = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(responses)
+        return httpx.Response(status, headers=headers if status != 200 else None, json={'object': 'list'})
+
+    return httpx.MockTransport(handler)
+
+
+def test_token_bucket_allows_burst_then_throttles() -> None:
+    bucket = TokenBucket(rate=2.0, burst=3)
+    delays = [bucket.reserve() for _ in range(5)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.5, abs=0.05)
+    assert delays[4] == pytest.approx(1.0, abs=0.05)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after('0.5') == 0.5
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0  # date in the past
+    assert parse_retry_after('garbage') is None
+
+
+def test_retry_rate_limited_honours_retry_after(no_sleep: list[float]) -> None:
+    transport = RateLimitedTransport(flaky_handler([429, 429, 200], {'Retry-After': '7'}), retry=RetryPolicy())
+    with httpx.Client(transport=transport) as client:
+        response = client.post('https://api.notion.com/v1/pages', json={})
+
+    assert response.status_code == 200
+    assert len(no_sleep) == 2
+    assert all(7.0 <= delay <= 8.0 for delay in no_sleep)
+
+
+def test_retry_server_errors_only_for_idempotent_requests(no_sleep: list[float]) -> None:
+    transport = RateLimitedTransport(flaky_handler([502, 503, 200]), retry=RetryPolicy())
+    with httpx.Client(transport=transport) as client:
+        response = client.post('https://api.notion.com/v1/data_sources/123/query', json={})
+    assert response.status_code == 200
+    assert len(no_sleep) == 2
+
+    transport = RateLimitedTransport(flaky_handler([502, 200]), retry=RetryPolicy())
+    with httpx.Client(transport=transport) as client:
+        response = client.patch('https://api.notion.com/v1/pages/123', json={})
+    assert response.status_code == 502
+
+
+def test_no_retry_of_streamed_files(no_sleep: list[float]) -> None:
+    transport = RateLimitedTransport(flaky_handler([429, 200]), retry=RetryPolicy())
+    with httpx.Client(transport=transport) as client:
+        response = client.post('https://api.notion.com/v1/file_uploads/123/send', files={'file': b'content'})
+
+    assert response.status_code == 429  # the file is sent again by the caller after rewinding it
+    assert not no_sleep
+
+
+def test_retry_gives_up_after_max_retries(no_sleep: list[float]) -> None:
+    transport = RateLimitedTransport(flaky_handler([503] * 3), retry=RetryPolicy(max_retries=2, backoff_base=1.0))
+    with httpx.Client(transport=transport) as client:
+        response = client.get('https://api.notion.com/v1/blocks/123')
+
+    assert response.status_code == 503
+    assert len(no_sleep) == 2
+    assert 0.5 <= no_sleep[0] <= 1.0  # jittered exponential backoff
+    assert 1.0 <= no_sleep[1] <= 2.0
+
+
+def test_async_transport_retries_and_throttles(no_sleep: list[float]) -> None:
+    transport = AsyncRateLimitedTransport(
+        flaky_handler([429, 200, 200]), limiter=TokenBucket(rate=1.0, burst=1), retry=RetryPolicy()
+    )
+
+    async def send_requests() -> list[int]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return [(await client.get('https://api.notion.com/v1/users')).status_code for _ in range(2)]
+
+    assert asyncio.run(send_requests()) == [200, 200]
+    assert len(no_sleep) == 3  # one retry plus waiting twice for a token
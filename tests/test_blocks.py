@@ -1117,6 +1117,57 @@ def test_chunk_deeply_nested_wrapped_blocks() -> None:
     assert request_depths == [[1], [1, 1], [1], [1]]
 
 
+def test_chunk_blocks_within_request_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batches are packed as full as possible without exceeding the limits of blocks, array lengths and size."""
+    parent = uno.Callout('Parent')
+    big_table = uno.Table(12, 2)
+    tables = [uno.Table(4, 2) for _ in range(3)]
+
+    batches = list(uno_blocks._chunk_blocks_for_api(parent, [big_table, *tables]))
+    layout = [(batch.block, [len(node.children) for node in batch.children]) for batch in batches]
+    # at most `MAX_BLOCK_CHILDREN` rows are sent with a table, the others are appended to the table afterwards
+    assert layout == [
+        (parent, [5]),
+        (big_table, [0] * 5),
+        (parent, [4, 4]),  # at most `MAX_BLOCKS_PER_REQUEST` blocks including the rows
+        (big_table, [0, 0]),
+        (parent, [4]),
+    ]
+    assert [batch.is_root for batch in batches] == [True, False, True, False, True]
+    # every row is sent exactly once and in order
+    assert [node.block for node in batches[0].children[0].children] == list(big_table.rows[:5])
+    assert [node.block for node in batches[1].children] == list(big_table.rows[5:10])
+    assert [node.block for node in batches[3].children] == list(big_table.rows[10:])
+
+    paragraphs = [uno.Paragraph('Paragraph') for _ in range(5)]
+    par_size = uno_blocks._node_size(uno_blocks._Node(block=paragraphs[0]))
+    monkeypatch.setattr(uno_blocks, 'MAX_REQUEST_SIZE', uno_blocks._REQUEST_SIZE_RESERVE + 2 * (par_size + 2))
+    batches = list(uno_blocks._chunk_blocks_for_api(parent, paragraphs))
+    assert [len(batch.children) for batch in batches] == [2, 2, 1]
+
+
+def test_schedule_batches_in_waves() -> None:
+    """Batches of different parents can be appended concurrently once their parents exist."""
+    first, second = uno.Callout('First'), uno.Callout('Second')
+    nested = uno.Callout('Nested')
+    nested.append(uno.Paragraph('Deep'))
+    first.append([uno.Paragraph(f'First {idx}') for idx in range(7)] + [nested])
+    second.append([uno.Paragraph(f'Second {idx}') for idx in range(3)])
+    parent = uno.Callout('Parent')
+    root_blocks = [first, second, *[uno.Paragraph(f'Root {idx}') for idx in range(6)]]
+
+    batches = list(uno_blocks._chunk_blocks_for_api(parent, root_blocks))
+    waves = uno_blocks._schedule_batches(batches)
+    assert [[batch.block for batch in wave] for wave in waves] == [
+        [parent],
+        [first, second, parent],  # independent of each other after the first root batch
+        [first],  # the remaining children of `first` after its first batch
+        [nested],
+    ]
+    assert [batch.block for wave in waves for batch in wave if batch.is_root] == [parent, parent]
+    assert len(waves[0][0].children) == uno_blocks.MAX_BLOCK_CHILDREN
+
+
 @pytest.mark.vcr()
 def test_long_code_block(notion: uno.Session, root_page: uno.Page) -> None:
     """Test that a long code block is handled correctly."""
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import gc
+from uuid import UUID, uuid4
+
+import pytest
+
+from ultimate_notion.cache import ObjectCache
+
+
+class Obj:
+    """Simple object supporting weak references like the cached high-level objects."""
+
+
+def test_lru_eviction_and_stats() -> None:
+    cache: ObjectCache[Obj] = ObjectCache(maxsize=2)
+    ids = [uuid4() for _ in range(3)]
+    objs = [Obj() for _ in range(3)]
+    for obj_id, obj in zip(ids[:2], objs[:2], strict=True):
+        cache[obj_id] = obj
+
+    assert cache[ids[0]] is objs[0]  # `ids[1]` is now the least recently used
+    cache[ids[2]] = objs[2]
+
+    assert cache.stats.evictions == 1
+    assert cache.stats.size == 2
+    assert ids[1] in cache  # still alive, hence found again
+    assert cache.stats.evictions == 1  # membership tests don't promote objects
+    assert cache[ids[1]] is objs[1]
+    assert cache.stats.evictions == 2  # promoting `ids[1]` evicted `ids[0]`
+
+    del objs[1]
+    objs.pop(0)
+    gc.collect()
+    assert ids[0] not in cache
+    assert cache.get(ids[0]) is None
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 2  # membership tests don't count as lookups
+    assert set(cache) == {ids[1], ids[2]}
+
+
+def test_live_objects_keep_identity() -> None:
+    cache: ObjectCache[Obj] = ObjectCache(maxsize=0)
+    obj_id, obj = uuid4(), Obj()
+
+    assert cache.setdefault(obj_id, obj) is obj
+    assert cache.setdefault(obj_id, Obj()) is obj
+    assert cache.stats.size == 0  # only weakly referenced
+
+    del obj
+    gc.collect()
+    assert obj_id not in cache
+    assert len(cache) == 0
+
+
+def test_ttl_expiry() -> None:
+    now = 100.0
+    cache: ObjectCache[int] = ObjectCache(ttl=10, clock=lambda: now)  # ints cannot be weakly referenced
+    key = UUID(int=1)
+    cache[key] = 42
+
+    now += 5
+    assert cache[key] == 42  # accessing the object resets its idle time
+    now += 8
+    assert key in cache  # membership tests don't reset the idle time
+    now += 3
+    assert key not in cache
+    assert cache.get(key) is None
+    assert cache.stats.evictions == 1
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        ObjectCache(maxsize=-1)
+    with pytest.raises(ValueError):
+        ObjectCache(ttl=0)
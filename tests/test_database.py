@@ -7,15 +7,21 @@ More details here: https://github.com/python/mypy/issues/3004
 
 from __future__ import annotations
 
+import datetime as dt
+import json
+from typing import Any
 from urllib.parse import urlparse
+from uuid import UUID, uuid4
 
+import httpx
 import pytest
 
 import ultimate_notion as uno
-from ultimate_notion.errors import SchemaError
+from ultimate_notion.errors import BatchError, SchemaError
+from ultimate_notion.obj_api import blocks
 from ultimate_notion.obj_api.iterator import MAX_PAGE_SIZE
 
-from .conftest import CONTACTS_DB
+from .conftest import CONTACTS_DB, MockAPI
 
 
 @pytest.mark.vcr()
@@ -381,3 +387,221 @@ def test_db_add_remove_data_source(notion: uno.Session, root_page: uno.Page) ->
     assert len(db.data_sources) == 2
 
     db.delete()
+
+
+def test_changed_since(notion: uno.Session, mock_api: MockAPI) -> None:
+    ds_id = '00000000-0000-4000-8000-0000000000d5'
+    page_ids = [f'00000000-0000-4000-8000-00000000000{i}' for i in range(3)]
+    edited = {page_ids[0]: '2026-01-01T10:00:00.000Z', page_ids[1]: '2026-01-01T11:00:00.000Z'}
+    query_filters: list[Any] = []
+
+    def page_json(page_id: str) -> dict[str, object]:
+        return {
+            'object': 'page',
+            'id': page_id,
+            'last_edited_time': edited[page_id],
+            'parent': {'type': 'data_source_id', 'data_source_id': ds_id},
+            'properties': {'Name': {'id': 'title', 'type': 'title', 'title': []}},
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query_filter = json.loads(request.content).get('filter')
+        query_filters.append(query_filter)
+        since = '' if query_filter is None else query_filter['last_edited_time']['on_or_after']
+        results = [page_json(page_id) for page_id in edited if edited[page_id] >= since[:19]]
+        page_list = {'object': 'list', 'type': 'page_or_data_source', 'page_or_data_source': {}, 'results': results}
+        return httpx.Response(200, json=page_list)
+
+    ds_obj = {
+        'object': 'data_source',
+        'id': ds_id,
+        'title': [],
+        'parent': {'type': 'database_id', 'database_id': ds_id},
+        'properties': {'Name': {'id': 'title', 'name': 'Name', 'type': 'title', 'title': {}}},
+    }
+    ds = uno.DataSource.wrap_obj_ref(blocks.DataSource.model_validate(ds_obj))
+    notion.cache[ds.id] = ds
+    mock_api(handler)
+    view, watermark = ds.changed_since()
+    assert len(view) == 2
+    assert watermark == dt.datetime(2026, 1, 1, 11, tzinfo=dt.timezone.utc)
+    first_page = view.get_page(0)
+
+    edited[page_ids[0]] = edited[page_ids[2]] = '2026-01-01T12:00:00.000Z'
+    view, watermark = ds.changed_since(watermark)
+    assert query_filters[-1]['timestamp'] == 'last_edited_time'
+    assert [str(page.id) for page in view] == page_ids
+    assert view.get_page(0) is first_page
+    assert first_page.last_edited_time == watermark == dt.datetime(2026, 1, 1, 12, tzinfo=dt.timezone.utc)
+
+    ds._synced_view = None  # e.g. a new session resuming from a stored watermark
+    edited[page_ids[1]] = '2026-01-01T13:00:00.000Z'
+    view, watermark = ds.changed_since(dt.datetime(2026, 1, 1, 12, 30, tzinfo=dt.timezone.utc))
+    assert query_filters[-1] is not None
+    assert [str(page.id) for page in view] == [page_ids[1]]
+    assert watermark == dt.datetime(2026, 1, 1, 13, tzinfo=dt.timezone.utc)
+
+
+def test_count_is_empty(notion: uno.Session, mock_api: MockAPI) -> None:
+    ds_id = '00000000-0000-4000-8000-0000000000d8'
+    n_pages = 5
+    queries: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)
+        queries.append(query | {'filter_properties': request.url.params.get_list('filter_properties')})
+        start = int(query.get('start_cursor') or 0)
+        end = min(start + min(query['page_size'], 2), n_pages)
+        results = [{'object': 'page', 'id': str(uuid4())} for _ in range(start, end)]
+        page_list = {
+            'object': 'list',
+            'type': 'page_or_data_source',
+            'page_or_data_source': {},
+            'results': results,
+            'has_more': end < n_pages,
+            'next_cursor': str(end) if end < n_pages else None,
+        }
+        return httpx.Response(200, json=page_list)
+
+    ds_obj = {
+        'object': 'data_source',
+        'id': ds_id,
+        'title': [],
+        'parent': {'type': 'database_id', 'database_id': ds_id},
+        'properties': {'Name': {'id': 'title', 'name': 'Name', 'type': 'title', 'title': {}}},
+    }
+    ds = uno.DataSource.wrap_obj_ref(blocks.DataSource.model_validate(ds_obj))
+    notion.cache[ds.id] = ds
+    mock_api(handler)
+    assert len(ds) == n_pages
+    assert len(queries) == 3  # walked through all cursors
+    assert ds.count(uno.prop('Name') == 'Item') == n_pages
+    assert queries[-1]['filter']['property'] == 'Name'  # type: ignore[index]
+    assert all(query['filter_properties'] == ['title'] for query in queries)  # only titles are returned
+
+    queries.clear()
+    assert not ds.is_empty
+    assert [query['page_size'] for query in queries] == [1]
+
+    n_pages = 0
+    assert ds.is_empty
+    assert ds.count() == 0
+
+
+def test_create_pages(notion: uno.Session, mock_api: MockAPI) -> None:
+    ds_id = '00000000-0000-4000-8000-0000000000d6'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        props = json.loads(request.content)['properties']
+        if props['Cost']['number'] == 13:
+            error = {'object': 'error', 'status': 400, 'code': 'validation_error', 'message': 'Unlucky number'}
+            return httpx.Response(400, json=error)
+        page_obj = {
+            'object': 'page',
+            'id': str(uuid4()),
+            'parent': {'type': 'data_source_id', 'data_source_id': ds_id},
+            'properties': {
+                'Name': {'id': 'title', 'type': 'title', 'title': props['Name']['title']},
+                'Cost': {'id': 'c%3Dt', 'type': 'number', 'number': props['Cost']['number']},
+            },
+        }
+        return httpx.Response(200, json=page_obj)
+
+    ds_obj = {
+        'object': 'data_source',
+        'id': ds_id,
+        'title': [],
+        'parent': {'type': 'database_id', 'database_id': ds_id},
+        'properties': {
+            'Name': {'id': 'title', 'name': 'Name', 'type': 'title', 'title': {}},
+            'Cost': {'id': 'c%3Dt', 'name': 'Cost', 'type': 'number', 'number': {'format': 'number'}},
+        },
+    }
+    ds = uno.DataSource.wrap_obj_ref(blocks.DataSource.model_validate(ds_obj))
+    notion.cache[ds.id] = ds
+    rows = [{'name': f'Item {cost}', 'cost': cost} for cost in range(12, 16)]
+    mock_api(handler)
+    pages = ds.create_pages(rows[:1] + rows[2:], concurrency=2)
+    assert [page.props['Cost'] for page in pages] == [12, 14, 15]
+
+    with pytest.raises(BatchError) as exc_info:
+        ds.create_pages([*rows, {'name': 'Invalid', 'unknown': 1}], concurrency=3)
+
+    assert set(exc_info.value.errors) == {1, 4}
+    assert isinstance(exc_info.value.errors[4], SchemaError)
+    titles = [page and str(page.title) for page in exc_info.value.results]
+    assert titles == ['Item 12', None, 'Item 14', 'Item 15', None]
+
+
+def test_upsert(notion: uno.Session, mock_api: MockAPI) -> None:
+    ds_id = '00000000-0000-4000-8000-0000000000d7'
+    requests: list[tuple[str, dict[str, Any]]] = []
+
+    def page_json(page_id: str, props: dict[str, Any]) -> dict[str, object]:
+        return {
+            'object': 'page',
+            'id': page_id,
+            'parent': {'type': 'data_source_id', 'data_source_id': ds_id},
+            'properties': {
+                'Name': {'id': 'title', 'type': 'title', 'title': []},
+                'SKU': {'id': 's%3Dk', 'type': 'rich_text', 'rich_text': props['SKU']['rich_text']},
+                'Cost': {'id': 'c%3Dt', 'type': 'number', 'number': props['Cost']['number']},
+            },
+        }
+
+    def sku_props(sku: str, cost: int) -> dict[str, Any]:
+        rich_text = {
+            'type': 'text',
+            'text': {'content': sku, 'link': None},
+            'annotations': {
+                'bold': False,
+                'italic': False,
+                'strikethrough': False,
+                'underline': False,
+                'code': False,
+                'color': 'default',
+            },
+            'plain_text': sku,
+            'href': None,
+        }
+        return {'SKU': {'rich_text': [rich_text]}, 'Cost': {'number': cost}}
+
+    existing = {
+        '00000000-0000-4000-8000-00000000000a': sku_props('A', 1),
+        '00000000-0000-4000-8000-00000000000b': sku_props('B', 2),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request.method, body))
+        if request.url.path.endswith('/query'):
+            results = [page_json(page_id, props) for page_id, props in existing.items()]
+            page_list = {'object': 'list', 'type': 'page_or_data_source', 'page_or_data_source': {}, 'results': results}
+            return httpx.Response(200, json=page_list)
+        elif request.method == 'PATCH':
+            page_id = request.url.path.split('/')[-1]
+            props = existing[str(UUID(page_id))] | body['properties']
+            return httpx.Response(200, json=page_json(str(UUID(page_id)), props))
+        else:
+            return httpx.Response(200, json=page_json(str(uuid4()), body['properties']))
+
+    ds_obj = {
+        'object': 'data_source',
+        'id': ds_id,
+        'title': [],
+        'parent': {'type': 'database_id', 'database_id': ds_id},
+        'properties': {
+            'Name': {'id': 'title', 'name': 'Name', 'type': 'title', 'title': {}},
+            'SKU': {'id': 's%3Dk', 'name': 'SKU', 'type': 'rich_text', 'rich_text': {}},
+            'Cost': {'id': 'c%3Dt', 'name': 'Cost', 'type': 'number', 'number': {'format': 'number'}},
+        },
+    }
+    ds = uno.DataSource.wrap_obj_ref(blocks.DataSource.model_validate(ds_obj))
+    notion.cache[ds.id] = ds
+    rows = [{'sku': 'A', 'cost': 1}, {'sku': 'B', 'cost': 5}, {'sku': 'C', 'cost': 3}]
+    mock_api(handler)
+    pages = ds.upsert(rows, key='SKU', concurrency=2)
+
+    assert [(page.props['SKU'], page.props['Cost']) for page in pages] == [('A', 1), ('B', 5), ('C', 3)]
+    writes = sorted((method, sorted(body['properties'])) for method, body in requests[1:])
+    assert writes == [('PATCH', ['Cost']), ('POST', ['Cost', 'SKU'])]  # unchanged row `A` needs no request
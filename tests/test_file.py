@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import io
+import json
+import re
+from collections import Counter
 from pathlib import Path
+from uuid import uuid4
 
+import httpx
 import pytest
 
 import ultimate_notion as uno
+from ultimate_notion import session as session_module
+from ultimate_notion.errors import BatchError
+from ultimate_notion.file import UploadedFile, wait_for_uploads
+from ultimate_notion.utils import temp_attr
+
+from .conftest import MockAPI
 
 
 @pytest.mark.file_upload
@@ -89,3 +101,96 @@ def test_upload_svg(notion: uno.Session, root_page: uno.Page) -> None:
 
     page = notion.create_page(parent=root_page, title='Test Page with an SVG file')
     page.append(uno.Image(uploaded_file, caption='An uploaded SVG image'))
+
+
+def upload_json(upload_id: str, filename: str, status: str) -> dict[str, object]:
+    return {
+        'object': 'file_upload',
+        'id': upload_id,
+        'created_time': '2026-06-18T17:19:00.000Z',
+        'last_edited_time': '2026-06-18T17:19:00.000Z',
+        'status': status,
+        'filename': filename,
+        'content_type': 'text/plain',
+        'created_by': {'object': 'user', 'id': '00000000-0000-4000-8000-0000000000f1'},
+    }
+
+
+@pytest.mark.parametrize('in_memory', [True, False])
+def test_upload_parts_concurrently(notion: uno.Session, mock_api: MockAPI, tmp_path: Path, *, in_memory: bool) -> None:
+    content = b'aaaabbbbcc'
+    sent_parts: dict[int, bytes] = {}
+    failed_parts: set[int] = set()
+    upload_obj = upload_json('00000000-0000-4000-8000-0000000004bd', 'parts.txt', 'pending')
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        if request.url.path.endswith('/send'):
+            match = re.search(rb'name="part_number"\r\n\r\n(\d+)', request.content)
+            assert match is not None
+            part = int(match.group(1))
+            if part in {2, 3} and part not in failed_parts:  # these parts fail once with a transient error
+                failed_parts.add(part)
+                status, code = (503, 'service_unavailable') if part == 2 else (429, 'rate_limited')
+                error = {'object': 'error', 'status': status, 'code': code, 'message': 'Try again'}
+                return httpx.Response(status, json=error)
+            sent_parts[part] = content[(part - 1) * 4 : part * 4]
+            assert sent_parts[part] in request.content
+        elif request.url.path.endswith('/complete'):
+            assert set(sent_parts) == {1, 2, 3}
+            return httpx.Response(200, json=upload_obj | {'status': 'uploaded'})
+        return httpx.Response(200, json=upload_obj)
+
+    file_path = tmp_path / 'parts.txt'
+    file_path.write_bytes(content)
+    mock_api(handler)
+    with (
+        temp_attr(session_module, MAX_FILE_SIZE=4, _UPLOAD_RETRY_INITIAL_DELAY=0),
+        io.BytesIO(content) if in_memory else open(file_path, 'rb') as file,
+    ):
+        uploaded_file = notion.upload(file, file_name='parts.txt', mime_type='text/plain', concurrency=3)
+
+    assert failed_parts == {2, 3}
+    assert b''.join(sent_parts[part] for part in sorted(sent_parts)) == content
+    assert uploaded_file.status == uno.FileUploadStatus.UPLOADED
+
+
+def test_upload_many_and_wait_for_uploads(notion: uno.Session, mock_api: MockAPI, tmp_path: Path) -> None:
+    upload_ids: dict[str, str] = {}
+    n_polls: Counter[str] = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        upload_id = request.url.path.removeprefix('/v1/file_uploads').strip('/').removesuffix('/send')
+        if request.method == 'POST' and not upload_id:  # create a file upload
+            filename = json.loads(request.content)['filename']
+            if filename == 'broken.txt':
+                error = {'object': 'error', 'status': 400, 'code': 'validation_error', 'message': 'Broken file'}
+                return httpx.Response(400, json=error)
+            upload_id = upload_ids.setdefault(filename, str(uuid4()))
+            return httpx.Response(200, json=upload_json(upload_id, filename, 'pending'))
+
+        filename = next(name for name, id_ in upload_ids.items() if id_ == upload_id)
+        if request.method == 'POST':  # send the file
+            return httpx.Response(200, json=upload_json(upload_id, filename, 'uploaded'))
+        n_polls[filename] += 1  # retrieve the file upload
+        status = 'uploaded' if n_polls[filename] >= int(filename[0]) else 'pending'
+        return httpx.Response(200, json=upload_json(upload_id, filename, status))
+
+    paths = [tmp_path / name for name in ('a.txt', 'broken.txt', 'b.txt')]
+    for path in paths:
+        path.write_bytes(b'content')
+
+    mock_api(handler)
+    with temp_attr(UploadedFile, poll_interval=0):
+        with pytest.raises(BatchError) as exc_info:
+            notion.upload_many(paths, concurrency=3)
+
+        urls = {'1.mp4': 'https://example.com/1.mp4', '3.mp4': 'https://example.com/3.mp4'}
+        imported_files = [notion.import_url(url, name, block=False) for name, url in urls.items()]
+        wait_for_uploads(imported_files)
+
+    assert set(exc_info.value.errors) == {1}
+    assert [file and file.file_name for file in exc_info.value.results] == ['a.txt', None, 'b.txt']
+    assert all(file.status == uno.FileUploadStatus.UPLOADED for file in imported_files)
+    assert n_polls == {'1.mp4': 1, '3.mp4': 3}  # the file imported first is not polled anymore
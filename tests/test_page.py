@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import io
+import json
 import re
+import threading
 import time
 from textwrap import dedent
+from typing import Any
+from uuid import uuid4
 
+import httpx
 import pytest
 
 import ultimate_notion as uno
-from tests.conftest import assert_eventually
-from ultimate_notion.blocks import Block, Unsupported
+from tests.conftest import MockAPI, assert_eventually
+from ultimate_notion.blocks import Block, ParentBlock, Unsupported
 from ultimate_notion.emoji import CustomEmoji
+from ultimate_notion.obj_api import blocks
 from ultimate_notion.obj_api.props import MAX_ITEMS_PER_PROPERTY
 from ultimate_notion.page import Page
 
@@ -459,3 +466,275 @@ def test_update_props(notion: uno.Session, root_page: uno.Page) -> None:
     props_page = notion.get_page(props_page.id)
     assert props_page.props['Name'] == 'John Doe'
     assert props_page.props['Role'] is None
+
+
+def test_fetch_tree(notion: uno.Session, mock_api: MockAPI) -> None:
+    page_id = '00000000-0000-4000-8000-000000000000'
+    tree = {page_id: ['a', 'b'], 'a': ['c', 'd'], 'c': ['e']}  # block `b`, `d` and `e` have no children
+    block_ids = {name: f'00000000-0000-4000-8000-00000000000{name}' for name in 'abcde'}
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        parent_id = request.url.path.split('/')[-2]
+        requests.append(parent_id)
+        parent_name = next((name for name, block_id in block_ids.items() if block_id == parent_id), parent_id)
+        paragraphs = [
+            {
+                'object': 'block',
+                'id': block_ids[name],
+                'type': 'paragraph',
+                'paragraph': {'rich_text': [], 'color': 'default'},
+                'has_children': name in tree,
+            }
+            for name in tree[parent_name]
+        ]
+        block_list = {'object': 'list', 'type': 'block', 'block': {}, 'results': paragraphs, 'has_more': False}
+        return httpx.Response(200, json=block_list)
+
+    def make_page() -> uno.Page:
+        page_obj = {
+            'object': 'page',
+            'id': page_id,
+            'parent': {'type': 'workspace', 'workspace': True},
+            'properties': {'title': {'id': 'title', 'type': 'title', 'title': []}},
+        }
+        return uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+
+    mock_api(handler)
+    page = make_page().fetch_tree(max_depth=1)
+    assert requests == [page_id]
+    assert all(isinstance(block, ParentBlock) and block._children is None for block in page.children)
+
+    requests.clear()
+    page = make_page().fetch_tree(concurrency=2)
+    assert sorted(requests) == sorted([page_id, block_ids['a'], block_ids['c']])
+    requests.clear()
+    block_a = page.children[0]
+    assert isinstance(block_a, ParentBlock)
+    block_c, block_d = block_a.children
+    assert isinstance(block_c, ParentBlock)
+    assert isinstance(block_d, ParentBlock)
+    assert [str(block.id) for block in block_c.children] == [block_ids['e']]
+    assert block_d.children == ()
+    assert requests == []  # everything was already retrieved
+
+
+def test_export_markdown(notion: uno.Session, mock_api: MockAPI) -> None:
+    page_id = '00000000-0000-4000-8000-000000000000'
+    tree = {page_id: ['a', 'b'], 'a': ['c'], 'c': ['d']}
+    block_ids = {name: f'00000000-0000-4000-8000-00000000000{name}' for name in 'abcd'}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        parent_id = request.url.path.split('/')[-2]
+        parent_name = next((name for name, block_id in block_ids.items() if block_id == parent_id), parent_id)
+        items = [
+            {
+                'object': 'block',
+                'id': block_ids[name],
+                'type': 'bulleted_list_item',
+                'bulleted_list_item': {
+                    'rich_text': [
+                        {
+                            'type': 'text',
+                            'text': {'content': f'item {name}'},
+                            'plain_text': f'item {name}',
+                            'annotations': {'bold': False, 'color': 'default'},
+                        }
+                    ],
+                    'color': 'default',
+                },
+                'has_children': name in tree,
+            }
+            for name in tree[parent_name]
+        ]
+        block_list = {'object': 'list', 'type': 'block', 'block': {}, 'results': items, 'has_more': False}
+        return httpx.Response(200, json=block_list)
+
+    page_obj = {
+        'object': 'page',
+        'id': page_id,
+        'parent': {'type': 'workspace', 'workspace': True},
+        'properties': {
+            'title': {
+                'id': 'title',
+                'type': 'title',
+                'title': [{'type': 'text', 'text': {'content': 'Export'}, 'plain_text': 'Export'}],
+            }
+        },
+    }
+    mock_api(handler)
+    page = uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+    assert page.to_markdown() == '# Export\n\n- item a\n\n- item b\n'
+
+    file = io.StringIO()
+    page.export_markdown(file, concurrency=2)
+    exp_md = '# Export\n\n- item a\n\n    - item c\n\n        - item d\n\n- item b\n'
+    assert file.getvalue() == exp_md
+    assert page.to_markdown(nested=True) == exp_md
+    assert '<li>item d' in page.to_html(raw=True, nested=True)
+
+
+def test_export_markdown_in_columns(notion: uno.Session, mock_api: MockAPI) -> None:
+    """Nested blocks inside of container blocks like columns are exported as well."""
+    page_id = '00000000-0000-4000-8000-000000000000'
+    block_ids = {name: f'00000000-0000-4000-8000-00000000000{name}' for name in 'abcd'}
+    tree = {page_id: [('a', 'column_list')], 'a': [('b', 'column')], 'b': [('c', 'toggle')], 'c': [('d', 'toggle')]}
+
+    def block_obj(name: str, block_type: str) -> dict[str, Any]:
+        rich_text = [
+            {
+                'type': 'text',
+                'text': {'content': f'item {name}'},
+                'plain_text': f'item {name}',
+                'annotations': {'bold': False, 'color': 'default'},
+            }
+        ]
+        type_data = {'rich_text': rich_text, 'color': 'default'} if block_type == 'toggle' else {}
+        return {
+            'object': 'block',
+            'id': block_ids[name],
+            'type': block_type,
+            block_type: type_data,
+            'has_children': name in tree,
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        parent_id = request.url.path.split('/')[-2]
+        parent_name = next((name for name, block_id in block_ids.items() if block_id == parent_id), parent_id)
+        items = [block_obj(name, block_type) for name, block_type in tree[parent_name]]
+        block_list = {'object': 'list', 'type': 'block', 'block': {}, 'results': items, 'has_more': False}
+        return httpx.Response(200, json=block_list)
+
+    page_obj = {
+        'object': 'page',
+        'id': page_id,
+        'parent': {'type': 'workspace', 'workspace': True},
+        'properties': {
+            'title': {
+                'id': 'title',
+                'type': 'title',
+                'title': [{'type': 'text', 'text': {'content': 'Export'}, 'plain_text': 'Export'}],
+            }
+        },
+    }
+    mock_api(handler)
+    page = uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+    file = io.StringIO()
+    page.export_markdown(file)
+    exp_md = '# Export\n\n<!--- column 1 -->\n- item c\n\n    - item d\n'
+    assert file.getvalue() == exp_md
+    assert page.to_markdown(nested=True) == exp_md
+
+
+class MockBlockServer:
+    """Minimal in-memory imitation of the endpoints to append and list the children of blocks."""
+
+    def __init__(self, page_id: str) -> None:
+        self.page_id = page_id
+        self.children: dict[str, list[dict[str, Any]]] = {page_id: []}
+        self.requests: list[tuple[str, str]] = []
+        self.payloads: list[tuple[str, list[dict[str, Any]]]] = []
+        self._lock = threading.Lock()
+
+    def page(self) -> uno.Page:
+        page_obj = {
+            'object': 'page',
+            'id': self.page_id,
+            'parent': {'type': 'workspace', 'workspace': True},
+            'properties': {'title': {'id': 'title', 'type': 'title', 'title': []}},
+        }
+        return uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+
+    def _add_blocks(self, parent_id: str, block_objs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        added = []
+        for block_obj in block_objs:
+            nested_objs = block_obj[block_obj['type']].pop('children', [])
+            block_obj |= {'object': 'block', 'id': str(uuid4()), 'has_children': bool(nested_objs)}
+            self.children.setdefault(parent_id, []).append(block_obj)
+            self.children[block_obj['id']] = []
+            self._add_blocks(block_obj['id'], nested_objs)
+            added.append(block_obj)
+        return added
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        parent_id = request.url.path.split('/')[-2]
+        with self._lock:
+            self.requests.append((request.method, parent_id))
+            if request.method == 'PATCH':
+                self.payloads.append((parent_id, json.loads(request.content)['children']))
+                results = self._add_blocks(parent_id, json.loads(request.content)['children'])
+            else:
+                results = self.children[parent_id]
+        block_list = {'object': 'list', 'type': 'block', 'block': {}, 'results': results, 'has_more': False}
+        return httpx.Response(200, json=block_list)
+
+
+def test_append_nested_first_level(notion: uno.Session, mock_api: MockAPI) -> None:
+    server = MockBlockServer('00000000-0000-4000-8000-000000000000')
+    mock_api(server.handler)
+    page = server.page()
+    tables = [uno.Table(2, 2) for _ in range(3)]
+    page.append([*tables, uno.Paragraph('End')])
+
+    table_ids = [str(table.id) for table in tables]
+    # a single append, then the rows of all tables are listed one after another to get their ids
+    requests = [request for request in server.requests if request != ('GET', server.page_id)]
+    assert requests == [('PATCH', server.page_id), *(('GET', table_id) for table_id in table_ids)]
+    for table, table_id in zip(tables, table_ids, strict=True):
+        assert [str(row.id) for row in table.rows] == [row_obj['id'] for row_obj in server.children[table_id]]
+
+
+def test_append_subtrees_concurrently(notion: uno.Session, mock_api: MockAPI) -> None:
+    server = MockBlockServer('00000000-0000-4000-8000-000000000000')
+    toggles = [uno.Callout(f'Toggle {idx}') for idx in range(3)]
+    for idx, toggle in enumerate(toggles):
+        nested = uno.Callout(f'Nested {idx}')
+        nested.append(uno.Paragraph(f'Deep {idx}'))
+        toggle.append([uno.Paragraph(f'Child {idx}'), nested])
+
+    mock_api(server.handler)
+    page = server.page()
+    page.append(toggles, concurrency=3)
+
+    appends = [parent_id for method, parent_id in server.requests if method == 'PATCH']
+    assert appends[0] == server.page_id
+    assert sorted(appends[1:4]) == sorted(str(toggle.id) for toggle in toggles)
+    for toggle in toggles:
+        child_block, nested_block = toggle.children
+        assert isinstance(nested_block, ParentBlock)
+        child_json, nested_json = server.children[str(toggle.id)]
+        assert (child_json['id'], nested_json['id']) == (str(child_block.id), str(nested_block.id))
+        assert [deep['id'] for deep in server.children[nested_json['id']]] == [str(nested_block.children[0].id)]
+
+
+def test_append_sends_blocks_once(notion: uno.Session, mock_api: MockAPI) -> None:
+    server = MockBlockServer('00000000-0000-4000-8000-000000000000')
+    toggles = [uno.Callout(f'Toggle {idx}') for idx in range(2)]
+    for idx, toggle in enumerate(toggles):
+        nested = uno.Callout(f'Nested {idx}')
+        nested.append(uno.Paragraph(f'Deep {idx}'))
+        toggle.append([uno.Paragraph(f'Child {idx}'), nested])
+    table = uno.Table(7, 2)
+
+    mock_api(server.handler)
+    page = server.page()
+    page.append([*toggles, table], concurrency=3)
+
+    def texts(block_objs: list[dict[str, Any]]) -> list[str]:
+        rich_texts = [obj[obj['type']].get('rich_text', []) for obj in block_objs]
+        return [''.join(text['text']['content'] for text in rich_text) for rich_text in rich_texts]
+
+    # the children of the toggles are appended in later requests and not sent along with the toggles
+    (root_id, root_objs), *child_payloads = server.payloads
+    assert root_id == server.page_id
+    assert texts(root_objs) == ['Toggle 0', 'Toggle 1', '']
+    assert not any(obj['callout'].get('children') for obj in root_objs[:2])
+    assert len(root_objs[2]['table']['children']) == 5  # at most `MAX_BLOCK_CHILDREN` rows
+    payloads = dict(child_payloads)
+    assert len(payloads) == len(child_payloads) == 5
+    for idx, toggle in enumerate(toggles):
+        nested_block = toggle.children[1]
+        assert texts(payloads[str(toggle.id)]) == [f'Child {idx}', f'Nested {idx}']
+        assert texts(payloads[str(nested_block.id)]) == [f'Deep {idx}']
+    assert len(payloads[str(table.id)]) == 2
+    assert [str(row.id) for row in table.rows] == [row_obj['id'] for row_obj in server.children[str(table.id)]]
@@ -475,6 +475,30 @@ def test_query_new_task_db(new_task_db: uno.DataSource) -> None:
     assert set(query.execute()) == {task2, task3}
 
 
+@pytest.mark.vcr()
+def test_count_exists_new_task_db(new_task_db: uno.DataSource) -> None:
+    assert new_task_db.is_empty
+    assert len(new_task_db) == 0
+
+    Task = new_task_db.schema  # noqa: N806
+    status_col = 'Status'
+    status_prop = Task[status_col]
+    assert isinstance(status_prop, schema.Select)
+    status_options = {option.name: option for option in status_prop.options}
+
+    Task.create(task='Task 1', status=status_options['Done'], due_date='2024-01-01')
+    Task.create(task='Task 2', status=status_options['Backlog'], due_date='2024-01-02')
+    Task.create(task='Task 3', status=status_options['In Progress'], due_date='2024-01-01')
+
+    assert not new_task_db.is_empty
+    assert len(new_task_db) == 3
+    assert new_task_db.count(uno.prop('Due Date') == '2024-01-01') == 2
+
+    query = new_task_db.query.filter(uno.prop('Status') == 'Blocked')
+    assert query.count() == 0
+    assert not query.exists()
+
+
 @pytest.mark.vcr()
 def test_query_formula(root_page: uno.Page, notion: uno.Session, formula_db: uno.DataSource) -> None:
     # Sort by title so the test does not depend on Notion's (workspace-specific) default row
@@ -656,3 +680,16 @@ def test_id_prop(all_props_db: uno.DataSource) -> None:
 
     query = all_props_db.query.filter(uno.prop('ID') > -1)
     assert set(query.execute()) == set(all_pages)
+
+
+@pytest.mark.vcr()
+def test_query_iter(all_props_db: uno.DataSource) -> None:
+    cache = uno.Session.get_or_create().cache
+    uncached_pages = list(all_props_db.iter_pages(cache=False))
+    assert uncached_pages
+    assert all(cache.get(page.id) is not page for page in uncached_pages)
+
+    query = all_props_db.query.filter(uno.prop('ID') != 42)
+    cached_pages = list(query.iter())
+    assert set(cached_pages) == set(uncached_pages)
+    assert all(cache[page.id] is page for page in cached_pages)
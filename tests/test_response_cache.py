@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+import ultimate_notion as uno
+from ultimate_notion.obj_api import blocks
+from ultimate_notion.response_cache import CHILDREN, ResponseCache
+from ultimate_notion.utils import temp_attr
+
+from .conftest import MockAPI
+
+
+def test_versioned_entries(tmp_path: Path) -> None:
+    path = tmp_path / 'cache' / 'responses.sqlite'
+    obj_id, version = uuid4(), dt.datetime(2026, 1, 1, 10, tzinfo=dt.timezone.utc)
+    cache = ResponseCache(path)
+    cache.put(CHILDREN, obj_id, version, [{'id': 1}])
+    cache.close()
+
+    cache = ResponseCache(path)  # entries are persisted
+    assert cache.get(CHILDREN, obj_id, version) == [{'id': 1}]
+    assert cache.get(CHILDREN, obj_id, version + dt.timedelta(minutes=1)) is None
+    assert cache.get('page', obj_id, version) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.put(CHILDREN, obj_id, version + dt.timedelta(minutes=1), [])
+    assert len(cache) == 1  # only the latest version is kept
+    cache.delete(CHILDREN, obj_id)
+    assert cache.get(CHILDREN, obj_id, version + dt.timedelta(minutes=1)) is None
+
+    recent_version = dt.datetime.now(dt.timezone.utc).replace(second=0, microsecond=0)
+    cache.put(CHILDREN, obj_id, recent_version, [])  # might still change within the current minute
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_page_children_from_response_cache(notion: uno.Session, mock_api: MockAPI, tmp_path: Path) -> None:
+    page_id, block_id = '00000000-0000-4000-8000-000000000001', '00000000-0000-4000-8000-000000000002'
+    requests: list[str] = []
+
+    def page_json(last_edited_time: str) -> dict[str, object]:
+        return {
+            'object': 'page',
+            'id': page_id,
+            'last_edited_time': last_edited_time,
+            'parent': {'type': 'workspace', 'workspace': True},
+            'properties': {'title': {'id': 'title', 'type': 'title', 'title': []}},
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        paragraph = {
+            'object': 'block',
+            'id': block_id,
+            'type': 'paragraph',
+            'paragraph': {'rich_text': [], 'color': 'default'},
+            'parent': {'type': 'page_id', 'page_id': page_id},
+            'has_children': False,
+        }
+        block_list = {'object': 'list', 'type': 'block', 'block': {}, 'results': [paragraph], 'has_more': False}
+        return httpx.Response(200, json=block_list)
+
+    mock_api(handler)
+    response_cache = ResponseCache(tmp_path / 'responses.sqlite')
+    with temp_attr(notion, response_cache=response_cache):
+        for last_edited_time in ('2026-01-01T10:00:00.000Z', '2026-01-01T10:00:00.000Z', '2026-01-01T11:00:00.000Z'):
+            notion.cache.clear()
+            page = uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_json(last_edited_time)))
+            assert [str(block.id) for block in page.children] == [block_id]
+        assert requests == [f'/v1/blocks/{page_id}/children'] * 2  # unchanged page was served from the cache
+
+        assert len(response_cache) == 1
+        page.append(uno.Paragraph('Appended'))
+        assert len(response_cache) == 0  # local changes might keep the version of the page
+    response_cache.close()
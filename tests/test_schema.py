@@ -256,6 +256,14 @@ def test_to_pydantic_model() -> None:
     all_props_item = all_props_model(**{'Name': 'Name', 'Tags': ['Tag1', 'Tag2'], 'Created on': created_on})
     assert len(all_props_item.__class__.model_fields) == 3
 
+    # models are cached per schema class and recreated when the properties change
+    assert Schema.to_pydantic_model(with_ro_props=False) is rw_props_model
+    assert Schema.to_pydantic_model(with_ro_props=True) is all_props_model
+    Schema._props = [prop for prop in Schema._props if prop.name != 'Tags']
+    rw_props_model_wo_tags = Schema.to_pydantic_model(with_ro_props=False)
+    assert rw_props_model_wo_tags is not rw_props_model
+    assert len(rw_props_model_wo_tags.model_fields) == 1
+
 
 @pytest.mark.vcr()
 def test_add_del_update_prop(notion: uno.Session, root_page: uno.Page) -> None:
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import httpx
 import pytest
 
 import ultimate_notion as uno
+from ultimate_notion.cache import ObjectCache
 from ultimate_notion.errors import UnknownPageError, UnknownUserError
+from ultimate_notion.obj_api import blocks
+from ultimate_notion.utils import temp_attr
 
-from .conftest import CONTACTS_DB
+from .conftest import CONTACTS_DB, MockAPI
 
 
 @pytest.mark.vcr()
@@ -94,3 +98,62 @@ def test_create_page(notion: uno.Session, root_page: uno.Page) -> None:
     )
     assert isinstance(icon_page.icon, uno.Emoji)
     assert icon_page.icon == emoji_icon
+
+
+def test_prefetch_refs(notion: uno.Session, mock_api: MockAPI) -> None:
+    bot_id, user_id = '00000000-0000-4000-8000-00000000000b', '00000000-0000-4000-8000-00000000000a'
+    related_ids = [f'00000000-0000-4000-8000-00000000010{i}' for i in range(3)]
+    requests: list[str] = []
+
+    def page_json(page_id: str, **properties: object) -> dict[str, object]:
+        properties['title'] = {'id': 'title', 'type': 'title', 'title': []}
+        return {
+            'object': 'page',
+            'id': page_id,
+            'parent': {'type': 'workspace', 'workspace': True},
+            'properties': properties,
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == '/v1/users/me':
+            return httpx.Response(200, json={'object': 'user', 'id': bot_id, 'type': 'bot', 'bot': {}})
+        if request.url.path == '/v1/users':
+            user = {'object': 'user', 'id': user_id, 'type': 'person', 'person': {}, 'name': 'Jane'}
+            user_list = {'object': 'list', 'type': 'user', 'user': {}, 'results': [user], 'has_more': False}
+            return httpx.Response(200, json=user_list)
+        return httpx.Response(200, json=page_json(request.url.path.rsplit('/', 1)[-1]))
+
+    def make_page(idx: int, relation: list[str]) -> uno.Page:
+        page_obj = page_json(
+            f'00000000-0000-4000-8000-00000000000{idx}',
+            Related={'id': 'rel', 'type': 'relation', 'relation': [{'id': ref} for ref in relation]},
+            Owner={'id': 'own', 'type': 'people', 'people': [{'object': 'user', 'id': user_id}]},
+        )
+        return uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+
+    pages = [make_page(1, related_ids[:2]), make_page(2, related_ids[1:])]
+    mock_api(handler)
+    notion.prefetch_refs(pages, concurrency=2)
+    assert sorted(requests) == sorted(['/v1/users/me', '/v1/users', *(f'/v1/pages/{ref}' for ref in related_ids)])
+
+    requests.clear()
+    assert [str(page.id) for page in pages[1].props['Related']] == related_ids[1:]
+    assert pages[0].props['Owner'][0].name == 'Jane'
+    notion.prefetch_refs(pages)
+    assert requests == []  # everything is served from the cache now
+
+
+def test_get_cached_page_counts_one_hit(notion: uno.Session) -> None:
+    page_obj = {
+        'object': 'page',
+        'id': '00000000-0000-4000-8000-000000000001',
+        'parent': {'type': 'workspace', 'workspace': True},
+        'properties': {'title': {'id': 'title', 'type': 'title', 'title': []}},
+    }
+    page = uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+    cache: ObjectCache[uno.Page] = ObjectCache()
+    cache[page.id] = page
+    with temp_attr(notion, cache=cache):
+        assert notion.get_page(page.id) is page
+    assert (cache.stats.hits, cache.stats.misses) == (1, 0)
@@ -132,3 +132,17 @@ def test_safe_list_get() -> None:
     assert utils.safe_list_get(lst, 2) == 3
     assert utils.safe_list_get(lst, 3) is None
     assert utils.safe_list_get(lst, 3, default=42) == 42
+
+
+def test_run_concurrently() -> None:
+    assert utils.run_concurrently(lambda x: x**2, range(10), concurrency=3) == [x**2 for x in range(10)]
+    assert utils.run_concurrently(str, [], concurrency=3) == []
+
+    def fail(x: int) -> int:
+        msg = f'failed for {x}'
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError):
+        utils.run_concurrently(fail, [1, 2], concurrency=2)
+    with pytest.raises(ValueError):
+        utils.run_concurrently(str, [1], concurrency=0)
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import datetime as dt
+import json
+
+import polars as pl
+import pyarrow as pa
 import pytest
 
 import ultimate_notion as uno
+from ultimate_notion.errors import FilterQueryError
+from ultimate_notion.obj_api import blocks
+from ultimate_notion.obj_api import props as obj_props
+from ultimate_notion.obj_api.objects import DateRange
 from ultimate_notion.props import PropertyValue
+from ultimate_notion.view import View
 
 
 @pytest.mark.vcr()
@@ -90,6 +100,18 @@ def test_to_polars(task_db: uno.DataSource, all_props_db: uno.DataSource) -> Non
     assert len(view) == len(df)
 
 
+@pytest.mark.vcr()
+def test_to_arrow(task_db: uno.DataSource, all_props_db: uno.DataSource) -> None:
+    view = task_db.get_all_pages()
+    table = view.to_arrow()
+    assert len(view) == table.num_rows
+    assert table.column_names == view.columns
+
+    view = all_props_db.get_all_pages()
+    table = view.to_arrow()
+    assert len(view) == table.num_rows
+
+
 @pytest.mark.vcr()
 def test_to_pydantic(task_db: uno.DataSource) -> None:
     view = task_db.get_all_pages()
@@ -101,3 +123,110 @@ def test_to_pydantic(task_db: uno.DataSource) -> None:
         field = getattr(task, field_attr)
         assert isinstance(field, PropertyValue)
         _ = field.value
+
+
+@pytest.fixture
+def local_view(notion: uno.Session) -> View:
+    ds_id = '00000000-0000-4000-8000-0000000000d5'
+    options = [{'id': 'low', 'name': 'Low', 'color': 'default'}, {'id': 'high', 'name': 'High', 'color': 'red'}]
+    ds_obj = {
+        'object': 'data_source',
+        'id': ds_id,
+        'title': [],
+        'parent': {'type': 'database_id', 'database_id': ds_id},
+        'properties': {
+            'Name': {'id': 'title', 'name': 'Name', 'type': 'title', 'title': {}},
+            'Age': {'id': 'age', 'name': 'Age', 'type': 'number', 'number': {'format': 'number'}},
+            'Prio': {'id': 'prio', 'name': 'Prio', 'type': 'select', 'select': {'options': options}},
+            'Born': {'id': 'born', 'name': 'Born', 'type': 'date', 'date': {}},
+        },
+    }
+    ds = uno.DataSource.wrap_obj_ref(blocks.DataSource.model_validate(ds_obj))
+    notion.cache[ds.id] = ds
+
+    def make_page(idx: int, name: str, age: int | None, prio: str | None, born: str | None) -> uno.Page:
+        title = [{'type': 'text', 'text': {'content': name}, 'plain_text': name}]
+        prio_option = next((option for option in options if option['name'] == prio), None)
+        page_obj = {
+            'object': 'page',
+            'id': f'00000000-0000-4000-8000-00000000000{idx}',
+            'parent': {'type': 'data_source_id', 'data_source_id': ds_id},
+            'properties': {
+                'Name': {'id': 'title', 'type': 'title', 'title': title},
+                'Age': {'id': 'age', 'type': 'number', 'number': age},
+                'Prio': {'id': 'prio', 'type': 'select', 'select': prio_option},
+                'Born': {'id': 'born', 'type': 'date', 'date': born and {'start': born}},
+            },
+        }
+        return uno.Page.wrap_obj_ref(blocks.Page.model_validate(page_obj))
+
+    pages = [
+        make_page(0, 'John', 42, 'High', '1983-05-01'),
+        make_page(1, 'Jane', 31, 'Low', '1994-02-11'),
+        make_page(2, 'Alice', None, 'High', None),
+        make_page(3, 'Bob', 25, None, '2000-12-24'),
+    ]
+    return View(ds=ds, pages=pages, query=ds.query)
+
+
+def test_sort_filter(local_view: View) -> None:
+    view = local_view
+
+    def names(view: View) -> list[str]:
+        return [str(page.title) for page in view]
+
+    assert names(view.sort('Name')) == ['Alice', 'Bob', 'Jane', 'John']
+    assert names(view.sort(uno.prop('Age').desc())) == ['John', 'Jane', 'Bob', 'Alice']  # empty values last
+    assert names(view.sort('Prio', uno.prop('Name').desc())) == ['Jane', 'John', 'Alice', 'Bob']
+    assert names(view.sort('Born')) == ['John', 'Jane', 'Bob', 'Alice']
+    assert names(view) == ['John', 'Jane', 'Alice', 'Bob']  # original view is untouched
+
+    assert names(view.filter(uno.prop('Age') > 30)) == ['John', 'Jane']
+    assert names(view.filter(uno.prop('Prio') == 'High')) == ['John', 'Alice']
+    assert names(view.filter(uno.prop('Name').starts_with('J') & (uno.prop('Age') < 40))) == ['Jane']
+    assert names(view.filter(uno.prop('Born').is_empty() | uno.prop('Name').contains('o'))) == ['John', 'Alice', 'Bob']
+    assert names(view.filter(uno.prop('Born') >= '1990-01-01').sort('Name')) == ['Bob', 'Jane']
+    assert names(view.limit(2).filter(uno.prop('Prio') != 'Low')) == ['John']
+
+    with pytest.raises(FilterQueryError):
+        view.filter(uno.prop('Born').past_week())
+
+
+def test_to_pydantic_to_json(local_view: View) -> None:
+    models = local_view.to_pydantic()
+    assert [model.name.value for model in models] == ['John', 'Jane', 'Alice', 'Bob']  # type: ignore[attr-defined]
+    assert all(isinstance(model.age, PropertyValue) for model in models)  # type: ignore[attr-defined]
+    # writable properties are validated from their values and thus don't share the objects of the page
+    assert models[0].name.obj_ref is not local_view.get_page(0).obj_ref.properties['Name']  # type: ignore[attr-defined]
+
+    rows = json.loads(local_view.to_json())
+    assert len(rows) == len(local_view)
+    assert rows[1] == {'Name': 'Jane', 'Age': 31, 'Prio': 'Low', 'Born': '1994-02-11T00:00:00'}
+    assert rows[2] == {'Name': 'Alice', 'Age': None, 'Prio': 'High', 'Born': None}
+
+
+def test_export_date_ranges(local_view: View) -> None:
+    born = local_view.get_page(3).obj_ref.properties['Born']
+    assert isinstance(born, obj_props.Date)
+    born.date = DateRange(start=dt.date(2000, 12, 24), end=dt.date(2000, 12, 31))
+
+    def utc(year: int, month: int, day: int) -> dt.datetime:  # dates are exported as naive datetimes in UTC
+        return dt.datetime(year, month, day)  # noqa: DTZ001
+
+    john_born, jane_born = {'start': utc(1983, 5, 1), 'end': None}, {'start': utc(1994, 2, 11), 'end': None}
+    bob_born = {'start': utc(2000, 12, 24), 'end': utc(2000, 12, 31)}
+
+    df = local_view.to_pandas()
+    assert df['Born'].tolist() == [john_born, jane_born, None, bob_born]
+
+    pl_df = local_view.to_polars()
+    assert pl_df.schema['Born'] == pl.Struct({'start': pl.Datetime(), 'end': pl.Datetime()})
+    assert pl_df['Born'].to_list() == df['Born'].tolist()
+
+    table = local_view.to_arrow()
+    assert table.schema.field('Born').type == pa.struct([('start', pa.timestamp('ms')), ('end', pa.timestamp('ms'))])
+    assert table['Born'].to_pylist() == df['Born'].tolist()
+
+    rows = json.loads(local_view.to_json())
+    assert rows[3]['Born'] == {'start': '2000-12-24T00:00:00', 'end': '2000-12-31T00:00:00'}
+    assert rows[0]['Born'] == {'start': '1983-05-01T00:00:00', 'end': None}